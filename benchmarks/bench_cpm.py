@@ -0,0 +1,138 @@
+"""
+bench_cpm.py
+
+Compares a full CPM calculation against incremental recalculation of
+single edits on synthetic exports.
+
+For each size the schedule is calculated once in full, then a sample of
+random not started activities is edited one at a time:
+
+    duration    set_duration to a new remaining duration
+    add         add_relationship to a later activity
+    remove      remove_relationship of an existing successor
+    constraint  set_constraint to a start on or after date
+
+Every edit reports the median and worst time and the mean number of
+activities whose dates changed.
+
+Usage:
+    python -m benchmarks.bench_cpm --sizes 1k 10k --edits 50
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import timedelta
+
+from benchmarks.synthetic import SyntheticXer, parse_size
+from xer_pro.data.cpm import CpmEngine
+from xer_pro.data.logic_graph import LINK_TYPES
+from xer_pro.data.parse import parse_xer_file
+from xer_pro.data.schedule import SCHEDULE_COLUMNS, build_schedules
+
+DEFAULT_SIZES = ("1k", "10k")
+
+
+def _edits(engine: CpmEngine, rnd: random.Random) -> dict:
+    """One random edit of each kind, as callables that return a CpmUpdate"""
+    graph = engine.schedule.logic_graph
+    tasks = [task for task in engine.tasks if task.is_not_started]
+    task = rnd.choice(tasks)
+    n = graph.number(task)
+    position = engine._position
+    later = [t for t in tasks if position[graph.number(t)] > position[n]]
+    edits = {
+        "duration": lambda: engine.set_duration(task, rnd.choice((0, 40, 160))),
+        "constraint": lambda: engine.set_constraint(
+            task, "CS_MSOA", engine.early_start[n] + timedelta(days=14)
+        ),
+    }
+    if later:
+        edits["add"] = lambda: engine.add_relationship(task, rnd.choice(later))
+    if engine.succs[n]:
+        succ, link, _ = engine.succs[n][0]
+        edits["remove"] = lambda: engine.remove_relationship(
+            task, engine.tasks[succ], LINK_TYPES[link]
+        )
+
+    return edits
+
+
+def run(path: str, edits: int, seed: int) -> list[dict]:
+    """Measure a full calculation and single edits of a .xer file
+
+    Args:
+        path (str): path to a .xer file
+        edits (int): edits of each kind to time
+        seed (int): seed of the random edits
+
+    Returns:
+        list[dict]: results of the full calculation and each kind of edit
+    """
+    schedule = build_schedules(parse_xer_file(path, columns=SCHEDULE_COLUMNS))[0]
+    start = time.perf_counter()
+    engine = CpmEngine(schedule).calculate()
+    seconds = time.perf_counter() - start
+    full = {"name": "full", "median": seconds, "worst": seconds}
+    results = [{**full, "changed": len(engine.tasks)}]
+
+    rnd = random.Random(seed)
+    timings = {}
+    for _ in range(edits):
+        for name, edit in _edits(engine, rnd).items():
+            start = time.perf_counter()
+            update = edit()
+            seconds = time.perf_counter() - start
+            timings.setdefault(name, []).append((seconds, len(update.tasks)))
+
+    for name, samples in timings.items():
+        results.append(
+            {
+                "name": name,
+                "median": statistics.median(s for s, _ in samples),
+                "worst": max(s for s, _ in samples),
+                "changed": statistics.mean(c for _, c in samples),
+            }
+        )
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="activities per export, e.g. 1k 10k 50k",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--edits", type=int, default=50, help="edits of each kind")
+    parser.add_argument(
+        "--data-dir",
+        default=os.path.join(tempfile.gettempdir(), "xer_pro_bench"),
+        help="directory the synthetic exports are kept in",
+    )
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    print(f'{"Size":>6} {"Edit":<11} {"Median s":>9} {"Worst s":>9} {"Changed":>9}')
+    for size in args.sizes:
+        activities = parse_size(size)
+        path = os.path.join(args.data_dir, f"synthetic_{activities}_{args.seed}.xer")
+        if not os.path.exists(path):
+            SyntheticXer(activities, seed=args.seed).write(path + ".tmp")
+            os.replace(path + ".tmp", path)
+
+        for result in run(path, args.edits, args.seed):
+            print(
+                f'{size:>6} {result["name"]:<11} {result["median"]:>9.4f} '
+                f'{result["worst"]:>9.4f} {result["changed"]:>9.1f}'
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+bench_decoders.py
+
+Compares the original parser, which decoded each line and typed it one
+value at a time, against the compiled per-table decoder plans that
+parse_xer_file applies to the raw bytes.
+
+Usage:
+    python -m benchmarks.bench_decoders path/to/schedule.xer
+    python -m benchmarks.bench_decoders --activities 20k
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any
+
+from benchmarks.synthetic import SyntheticXer, parse_size
+from xer_pro.data.parse import CODEC, _iter_records, _open_xer, _read_table
+
+TABLES = ("TASK", "TASKRSRC", "TRSRCFIN")
+
+
+def _read_raw_tables(path: str, names: tuple[str]) -> dict[str, list[bytes]]:
+    """Collect the %F header and %R records of the requested tables."""
+    tables = defaultdict(list)
+    name = None
+    with _open_xer(path) as stream:
+        for _, record in _iter_records(stream):
+            if record.startswith(b"%T\t"):
+                name = record[3:].strip().decode(CODEC)
+            elif name in names and record.startswith((b"%F\t", b"%R\t")):
+                tables[name].append(record)
+
+    return tables
+
+
+def _original_data_type(key: str, val: str) -> Any:
+    """Per value typing of the original parser."""
+    if not val or val == "":
+        return None
+    if key.endswith(("_date", "_date2")):
+        return datetime.strptime(val, "%Y-%m-%d %H:%M")
+    if key.endswith("_num"):
+        return int(val)
+    if key.endswith(("_cnt", "_qty", "_cost", "_pct")):
+        return float(val)
+    if key.endswith("_flag"):
+        return val == "Y"
+
+    return val
+
+
+def _per_value(records: list[bytes]) -> list[dict]:
+    lines = [record.decode(CODEC) for record in records]
+    cols = lines[0].split("\t")[1:]
+    return [
+        {
+            label: _original_data_type(label, value)
+            for label, value in zip(cols, line.split("\t")[1:])
+        }
+        for line in lines[1:]
+    ]
+
+
+def _compiled(records: list[bytes]) -> list:
+    return _read_table(records)
+
+
+def _best_of(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("xer", nargs="?", help="path to a .xer file")
+    parser.add_argument(
+        "--activities",
+        default="20k",
+        help="size of the synthetic export used when no file is given",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.xer:
+        tables = _read_raw_tables(args.xer, TABLES)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "synthetic.xer")
+            SyntheticXer(parse_size(args.activities)).write(path)
+            tables = _read_raw_tables(path, TABLES)
+
+    print(f'{"Table":<10} {"Rows":>8} {"Cols":>5} {"Original":>11} {"Compiled":>10} {"Speedup":>8}')
+    for name in TABLES:
+        records = tables.get(name, [])
+        if len(records) < 2:
+            print(f"{name:<10} {'-':>8}")
+            continue
+
+        table = _compiled(records)
+        assert _per_value(records) == [dict(row) for row in table]
+        per_value = _best_of(_per_value, records, repeat=args.repeat)
+        compiled = _best_of(_compiled, records, repeat=args.repeat)
+        print(
+            f"{name:<10} {len(table):>8,} {len(table.columns):>5} {per_value:>10.3f}s "
+            f"{compiled:>9.3f}s {per_value / compiled:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
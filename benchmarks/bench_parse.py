@@ -0,0 +1,215 @@
+"""
+bench_parse.py
+
+Measures parse_xer_file and the Schedule model on synthetic exports.
+
+Each size is written once by benchmarks.synthetic and then measured in a
+fresh process, stage by stage:
+
+    scan       parse_xer_file, which finds the position of every table
+    tables     typing the tables a Schedule is built from
+    schedules  build_schedules on the typed tables
+
+Every stage reports its time, rows/sec, MB/sec of the .xer file and the
+peak RSS of the process while it ran. Save the results with --json to keep
+a baseline to compare later changes against.
+
+Usage:
+    python -m benchmarks.bench_parse --sizes 1k 10k 100k
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks.synthetic import SyntheticXer, parse_size
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SIZES = ("1k", "10k", "100k")
+
+
+def _reset_peak_rss() -> None:
+    """Reset the peak RSS of the process where the platform allows it"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss() -> int:
+    """Peak resident set size of the process in bytes"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _count_records(path: str) -> int:
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def _stage(name: str, func: Callable, rows: Callable, size: int) -> tuple:
+    _reset_peak_rss()
+    start = time.perf_counter()
+    value = func()
+    seconds = time.perf_counter() - start
+    count = rows(value)
+    result = {
+        "stage": name,
+        "seconds": seconds,
+        "rows": count,
+        "rows_per_sec": count / seconds if seconds else 0.0,
+        "mb_per_sec": size / 1e6 / seconds if seconds else 0.0,
+        "peak_rss_mb": _peak_rss() / 1e6,
+    }
+    return value, result
+
+
+def _measure(
+    path: str, workers: int, all_columns: bool, queue: multiprocessing.Queue
+) -> None:
+    """Run the stages on one file; runs in a fresh process"""
+    from xer_pro.data.parse import parse_xer_file
+    from xer_pro.data.schedule import (
+        SCHEDULE_COLUMNS,
+        SCHEDULE_TABLES,
+        build_schedules,
+    )
+
+    size = os.path.getsize(path)
+    results = []
+
+    xer, result = _stage(
+        "scan",
+        lambda: parse_xer_file(
+            path,
+            workers=workers or None,
+            columns=None if all_columns else SCHEDULE_COLUMNS,
+        ),
+        lambda tables: _count_records(path),
+        size,
+    )
+    results.append(result)
+
+    tables, result = _stage(
+        "tables",
+        lambda: xer.select(SCHEDULE_TABLES),
+        lambda tables: sum(len(table) for table in tables.values()),
+        size,
+    )
+    results.append(result)
+
+    _, result = _stage(
+        "schedules",
+        lambda: build_schedules(tables),
+        lambda schedules: sum(
+            len(schedule.tasks()) + len(schedule.logic()) for schedule in schedules
+        ),
+        size,
+    )
+    results.append(result)
+
+    queue.put(results)
+
+
+def run(path: str, workers: int = 0, all_columns: bool = False) -> list[dict]:
+    """Measure the stages on a .xer file in a fresh process
+
+    Args:
+        path (str): path to a .xer file
+        workers (int, optional): worker processes for parse_xer_file. Defaults to 0.
+        all_columns (bool, optional): type every column instead of only the
+            SCHEDULE_COLUMNS. Defaults to False.
+
+    Returns:
+        list[dict]: results of each stage
+    """
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_measure, args=(path, workers, all_columns, queue))
+    proc.start()
+    results = queue.get()
+    proc.join()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="activities per export, e.g. 1k 10k 100k 1m",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument(
+        "--all-columns",
+        action="store_true",
+        help="type every column instead of only the columns the models read",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=os.path.join(tempfile.gettempdir(), "xer_pro_bench"),
+        help="directory the synthetic exports are kept in",
+    )
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    report = []
+
+    print(
+        f'{"Size":>6} {"Stage":<10} {"Rows":>10} {"Seconds":>8} '
+        f'{"Rows/s":>11} {"MB/s":>8} {"Peak RSS":>10}'
+    )
+    for size in args.sizes:
+        activities = parse_size(size)
+        path = os.path.join(args.data_dir, f"synthetic_{activities}_{args.seed}.xer")
+        if not os.path.exists(path):
+            SyntheticXer(activities, seed=args.seed).write(path + ".tmp")
+            os.replace(path + ".tmp", path)
+
+        results = run(path, args.workers, args.all_columns)
+        report.append(
+            {
+                "activities": activities,
+                "bytes": os.path.getsize(path),
+                "stages": results,
+            }
+        )
+        for result in results:
+            print(
+                f'{size:>6} {result["stage"]:<10} {result["rows"]:>10,} '
+                f'{result["seconds"]:>8.3f} {result["rows_per_sec"]:>11,.0f} '
+                f'{result["mb_per_sec"]:>8.1f} {result["peak_rss_mb"]:>8.1f}MB'
+            )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,591 @@
+"""
+synthetic.py
+
+Deterministic generator of synthetic Primavera P6 .xer exports.
+
+The exports hold the CALENDAR, ACCOUNT, PROJECT, PROJWBS, RSRC, TASK,
+TASKPRED, FINDATES, TASKRSRC and TRSRCFIN tables with realistic column sets,
+status mix, float values and logic density, so client schedules never have
+to be shared to measure the parser and the schedule model. The same
+arguments always produce the same bytes.
+
+Rows are written as they are generated; the tables that depend on the
+activities regenerate them from the same seed instead of keeping them in
+memory, so exports of a million activities can be written in constant memory.
+
+Usage:
+    python -m benchmarks.synthetic 10k -o schedule.xer
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+CODEC = "cp1252"
+
+DATE_FMT = "%Y-%m-%d %H:%M"
+
+# Activity counts used by the benchmark suite
+SIZES = {
+    "1k": 1_000,
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+WORK_DAY_HOURS = 8
+
+# Work packages per activity
+WBS_RATIO = 1 / 20
+
+# Predecessors are picked from this many activities before the successor
+LOGIC_WINDOW = 50
+
+# Workdays the activity starts are spread over
+SCHEDULE_SPAN_DAYS = 900
+
+TASK_VERBS = ("Install", "Pour", "Submit", "Review", "Erect")
+
+# Relationship types and how often each is used
+PRED_TYPES = ("PR_FS", "PR_SS", "PR_FF", "PR_SF")
+PRED_TYPE_WEIGHTS = (85, 8, 6, 1)
+
+# Mon - Fri 08:00 - 17:00 with a lunch break and a few holidays
+CLNDR_DATA = (
+    "(0||CalendarData()("
+    "(0||DaysOfWeek()("
+    "(0||1()())"
+    "(0||2()((0||0(s|08:00|f|12:00)())(0||1(s|13:00|f|17:00)())))"
+    "(0||3()((0||0(s|08:00|f|12:00)())(0||1(s|13:00|f|17:00)())))"
+    "(0||4()((0||0(s|08:00|f|12:00)())(0||1(s|13:00|f|17:00)())))"
+    "(0||5()((0||0(s|08:00|f|12:00)())(0||1(s|13:00|f|17:00)())))"
+    "(0||6()((0||0(s|08:00|f|12:00)())(0||1(s|13:00|f|17:00)())))"
+    "(0||7()())))"
+    "(0||VIEW(ShowTotal|Y)())"
+    "(0||Exceptions()("
+    "(0||0(d|44927)())"
+    "(0||1(d|45108)())"
+    "(0||2(d|45171)())"
+    "(0||3(d|44933)((0||0(s|08:00|f|12:00)())))"
+    ")))"
+)
+
+TABLE_COLUMNS = {
+    "CALENDAR": [
+        "clndr_id", "default_flag", "clndr_name", "proj_id", "base_clndr_id",
+        "last_chng_date", "clndr_type", "day_hr_cnt", "week_hr_cnt",
+        "month_hr_cnt", "year_hr_cnt", "rsrc_private", "clndr_data",
+    ],
+    "ACCOUNT": [
+        "acct_id", "parent_acct_id", "acct_seq_num", "acct_name",
+        "acct_short_name", "acct_descr",
+    ],
+    "PROJECT": [
+        "proj_id", "fy_start_month_num", "rsrc_self_add_flag",
+        "allow_complete_flag", "export_flag", "proj_short_name", "clndr_id",
+        "plan_start_date", "plan_end_date", "scd_end_date", "last_recalc_date",
+        "last_fin_dates_id", "guid",
+    ],
+    "PROJWBS": [
+        "wbs_id", "proj_id", "obs_id", "seq_num", "est_wt", "proj_node_flag",
+        "sum_data_flag", "status_code", "wbs_short_name", "wbs_name",
+        "phase_id", "parent_wbs_id", "ev_user_pct", "ev_etc_user_value",
+        "orig_cost", "indep_remain_total_cost", "ann_dscnt_rate_pct",
+        "dscnt_period_type", "indep_remain_work_qty", "anticip_start_date",
+        "anticip_end_date", "ev_compute_type", "ev_etc_compute_type", "guid",
+        "tmpl_guid", "plan_open_state",
+    ],
+    "RSRC": [
+        "rsrc_id", "parent_rsrc_id", "clndr_id", "role_id", "shift_id",
+        "user_id", "pobs_id", "guid", "rsrc_seq_num", "email_addr",
+        "employee_code", "office_phone", "other_phone", "rsrc_name",
+        "rsrc_short_name", "rsrc_title_name", "def_qty_per_hr", "cost_qty_type",
+        "ot_factor", "active_flag", "auto_compute_act_flag",
+        "def_cost_qty_link_flag", "ot_flag", "curr_id", "unit_id", "rsrc_type",
+        "location_id", "rsrc_notes", "load_tasks_flag", "level_flag",
+        "last_checksum",
+    ],
+    "TASK": [
+        "task_id", "proj_id", "wbs_id", "clndr_id", "phys_complete_pct",
+        "rev_fdbk_flag", "est_wt", "lock_plan_flag", "auto_compute_act_flag",
+        "complete_pct_type", "task_type", "duration_type", "status_code",
+        "task_code", "task_name", "rsrc_id", "total_float_hr_cnt",
+        "free_float_hr_cnt", "remain_drtn_hr_cnt", "act_work_qty",
+        "remain_work_qty", "target_work_qty", "target_drtn_hr_cnt",
+        "target_equip_qty", "act_equip_qty", "remain_equip_qty", "cstr_date",
+        "act_start_date", "act_end_date", "late_start_date", "late_end_date",
+        "expect_end_date", "early_start_date", "early_end_date", "restart_date",
+        "reend_date", "target_start_date", "target_end_date",
+        "rem_late_start_date", "rem_late_end_date", "cstr_type",
+        "priority_type", "suspend_date", "resume_date", "float_path",
+        "float_path_order", "guid", "tmpl_guid", "cstr_date2", "cstr_type2",
+        "driving_path_flag", "act_this_per_work_qty", "act_this_per_equip_qty",
+        "external_early_start_date", "external_late_end_date", "create_date",
+        "update_date", "create_user", "update_user", "location_id",
+    ],
+    "TASKPRED": [
+        "task_pred_id", "task_id", "pred_task_id", "proj_id", "pred_proj_id",
+        "pred_type", "lag_hr_cnt", "comments", "float_path", "aref", "arls",
+    ],
+    "FINDATES": ["fin_dates_id", "fin_dates_name", "start_date", "end_date"],
+    "TASKRSRC": [
+        "taskrsrc_id", "task_id", "proj_id", "cost_qty_link_flag", "role_id",
+        "acct_id", "rsrc_id", "pobs_id", "skill_level", "remain_qty",
+        "target_qty", "remain_qty_per_hr", "target_lag_drtn_hr_cnt",
+        "target_qty_per_hr", "act_ot_qty", "act_reg_qty", "relag_drtn_hr_cnt",
+        "ot_factor", "cost_per_qty", "target_cost", "act_reg_cost",
+        "act_ot_cost", "remain_cost", "act_start_date", "act_end_date",
+        "restart_date", "reend_date", "target_start_date", "target_end_date",
+        "rem_late_start_date", "rem_late_end_date", "rollup_dates_flag",
+        "target_crv", "remain_crv", "actual_crv", "ts_pend_act_end_flag",
+        "guid", "rate_type", "act_this_per_cost", "act_this_per_qty",
+        "curv_id", "rsrc_type", "cost_per_qty_source_type", "create_user",
+        "create_date", "has_rsrc_hours", "taskrsrc_sum_id",
+    ],
+    "TRSRCFIN": [
+        "fin_dates_id", "taskrsrc_id", "task_id", "proj_id", "act_qty",
+        "act_cost", "act_ot_qty", "act_ot_cost",
+    ],
+}
+
+
+def parse_size(size: str) -> int:
+    """Activity count of a size name such as 10k or 1m, or a plain number"""
+    size = size.strip().lower().replace("_", "")
+    if size in SIZES:
+        return SIZES[size]
+    if size.endswith(("k", "m")):
+        return int(float(size[:-1]) * (1_000 if size[-1] == "k" else 1_000_000))
+
+    return int(size)
+
+
+def _fmt(date: Optional[datetime]) -> Optional[str]:
+    return None if date is None else date.strftime(DATE_FMT)
+
+
+def _add_workdays(date: datetime, days: int) -> datetime:
+    """Add whole workdays on a Monday to Friday calendar"""
+    step = 1 if days >= 0 else -1
+    # from a workday every 5 workdays span exactly one week
+    weeks = (abs(days) - 1) // 5 if days else 0
+    days -= step * 5 * weeks
+    while days:
+        date += timedelta(days=step)
+        if date.weekday() < 5:
+            days -= step
+
+    return date + timedelta(weeks=step * weeks)
+
+
+def _table(name: str, rows: Iterator[dict]) -> Iterator[str]:
+    cols = TABLE_COLUMNS[name]
+    yield f"%T\t{name}"
+    yield "%F\t" + "\t".join(cols)
+    for row in rows:
+        yield "%R\t" + "\t".join(
+            "" if (val := row.get(col)) is None else str(val) for col in cols
+        )
+
+
+class SyntheticXer:
+    """
+    A class to represent a deterministic synthetic .xer export.
+
+    ...
+
+    Attributes
+    ----------
+    activities: int
+        Number of TASK rows per project
+    projects: int
+        Number of projects in the export
+    logic_density: float
+        Average number of predecessors per activity
+    resources_per_task: float
+        Average number of TASKRSRC rows per activity
+    seed: int
+        Random seed
+    """
+
+    def __init__(
+        self,
+        activities: int,
+        projects: int = 1,
+        logic_density: float = 1.8,
+        resources_per_task: float = 0.5,
+        seed: int = 1,
+    ) -> None:
+        self.activities = activities
+        self.projects = projects
+        self.logic_density = logic_density
+        self.resources_per_task = resources_per_task
+        self.seed = seed
+        self.start_date = datetime(2022, 1, 3, 8, 0)
+        self.data_date = datetime(2023, 3, 1, 8, 0)
+        self.wbs_nodes = max(1, int(activities * WBS_RATIO))
+
+    def lines(self) -> Iterator[str]:
+        """Records of the export without line terminators"""
+        yield (
+            "ERMHDR\t19.12\t2023-03-01\tProject\tadmin\tadmin\tdbxDatabaseNoName"
+            "\tProject Management\tUSD"
+        )
+        yield from _table("CALENDAR", self._calendars())
+        yield from _table("ACCOUNT", self._accounts())
+        yield from _table("PROJECT", self._projects())
+        yield from _table("PROJWBS", self._wbs())
+        yield from _table("RSRC", self._resources())
+        yield from _table("TASK", self._tasks())
+        yield from _table("TASKPRED", self._logic())
+        yield from _table("FINDATES", self._fin_dates())
+        yield from _table("TASKRSRC", self._task_resources())
+        yield from _table("TRSRCFIN", self._financials())
+        yield "%E"
+
+    def to_bytes(self) -> bytes:
+        """Encoded export"""
+        return "".join(line + "\r\n" for line in self.lines()).encode(CODEC)
+
+    def write(self, path: str) -> int:
+        """Write the export to a file
+
+        Args:
+            path (str): path of the .xer file
+
+        Returns:
+            int: size of the file in bytes
+        """
+        size = 0
+        with open(path, "wb") as f:
+            for line in self.lines():
+                size += f.write((line + "\r\n").encode(CODEC))
+
+        return size
+
+    def _proj_id(self, p: int) -> str:
+        return str(1000 + p)
+
+    def _wbs_id(self, p: int, n: int) -> str:
+        return str(10_000 + p * (self.wbs_nodes + 1) + n)
+
+    def _task_id(self, p: int, n: int) -> str:
+        return str(100_000 + p * self.activities + n)
+
+    def _random(self, section: str, p: int) -> random.Random:
+        return random.Random(f"{self.seed}-{section}-{p}")
+
+    def _calendars(self) -> Iterator[dict]:
+        calendar = {
+            "default_flag": "N",
+            "clndr_type": "CA_Project",
+            "day_hr_cnt": 8,
+            "week_hr_cnt": 40,
+            "month_hr_cnt": 172,
+            "year_hr_cnt": 2000,
+            "rsrc_private": "N",
+            "clndr_data": CLNDR_DATA,
+            "last_chng_date": "2022-01-01 00:00",
+        }
+        yield {
+            **calendar,
+            "clndr_id": "1",
+            "default_flag": "Y",
+            "clndr_name": "Standard 5 Day",
+            "clndr_type": "CA_Base",
+        }
+        for p in range(self.projects):
+            yield {
+                **calendar,
+                "clndr_id": str(100 + p),
+                "clndr_name": f"Project {p} Calendar",
+                "proj_id": self._proj_id(p),
+            }
+
+    def _accounts(self) -> Iterator[dict]:
+        for a in range(5):
+            yield {
+                "acct_id": str(a + 1),
+                "acct_seq_num": a,
+                "acct_name": f"Cost Account {a}",
+                "acct_short_name": f"CA{a}",
+            }
+
+    def _projects(self) -> Iterator[dict]:
+        for p in range(self.projects):
+            yield {
+                "proj_id": self._proj_id(p),
+                "fy_start_month_num": 1,
+                "rsrc_self_add_flag": "Y",
+                "allow_complete_flag": "Y",
+                "export_flag": "Y",
+                "proj_short_name": f"PRJ-{p}",
+                "clndr_id": "1",
+                "plan_start_date": _fmt(self.start_date),
+                "plan_end_date": _fmt(datetime(2026, 12, 31, 17, 0)),
+                "scd_end_date": _fmt(datetime(2026, 6, 30, 17, 0)),
+                "last_recalc_date": _fmt(self.data_date),
+                "last_fin_dates_id": "2",
+                "guid": f"guid-project-{p}",
+            }
+
+    def _wbs(self) -> Iterator[dict]:
+        for p in range(self.projects):
+            rand = self._random("wbs", p)
+            node = {
+                "proj_id": self._proj_id(p),
+                "proj_node_flag": "N",
+                "sum_data_flag": "N",
+                "status_code": "WS_Open",
+                "est_wt": 1,
+            }
+            yield {
+                **node,
+                "wbs_id": self._wbs_id(p, 0),
+                "seq_num": 0,
+                "proj_node_flag": "Y",
+                "wbs_short_name": f"PRJ-{p}",
+                "wbs_name": f"Synthetic Project {p}",
+            }
+            for n in range(1, self.wbs_nodes + 1):
+                # shallow, bushy tree: parents are recent nodes
+                parent = rand.randrange(max(0, n - 20), n)
+                yield {
+                    **node,
+                    "wbs_id": self._wbs_id(p, n),
+                    "seq_num": n,
+                    "wbs_short_name": f"W{n}",
+                    "wbs_name": f"Work Package {n}",
+                    "parent_wbs_id": self._wbs_id(p, parent),
+                }
+
+    def _resources(self) -> Iterator[dict]:
+        for r, kind in enumerate(("RT_Labor", "RT_Equip", "RT_Mat", "RT_Labor")):
+            yield {
+                "rsrc_id": str(r + 1),
+                "clndr_id": "1",
+                "rsrc_seq_num": r,
+                "rsrc_name": f"Resource {r}",
+                "rsrc_short_name": f"R{r}",
+                "def_qty_per_hr": 1,
+                "cost_qty_type": "QT_Hour",
+                "ot_factor": 1,
+                "active_flag": "Y",
+                "auto_compute_act_flag": "Y",
+                "def_cost_qty_link_flag": "Y",
+                "ot_flag": "N",
+                "rsrc_type": kind,
+            }
+
+    def _tasks(self) -> Iterator[dict]:
+        for p in range(self.projects):
+            yield from self._project_tasks(p)
+
+    def _project_tasks(self, p: int) -> Iterator[dict]:
+        rand = self._random("task", p)
+        proj_id = self._proj_id(p)
+        for n in range(self.activities):
+            offset = n * SCHEDULE_SPAN_DAYS // max(1, self.activities)
+            start = _add_workdays(self.start_date, offset)
+            drtn = rand.choice((0, 1, 3, 5, 10, 15, 20, 30))
+            kind = "TT_Task"
+            if drtn == 0:
+                kind = rand.choice(("TT_Mile", "TT_FinMile"))
+            elif rand.random() < 0.01:
+                kind = "TT_LOE"
+            finish = _add_workdays(start, drtn).replace(hour=17)
+
+            if finish < self.data_date:
+                status, rem = "TK_Complete", 0
+            elif start < self.data_date:
+                status, rem = "TK_Active", max(1, drtn // 2)
+            else:
+                status, rem = "TK_NotStart", drtn
+            tf = rand.choice((-5, 0, 0, 5, 10, 25, 60))
+            late_start = _add_workdays(start, tf)
+            late_finish = _add_workdays(finish, tf)
+            cstr = rand.random() < 0.02
+            done = status == "TK_Complete"
+            task_id = self._task_id(p, n)
+
+            yield {
+                "task_id": task_id,
+                "proj_id": proj_id,
+                "wbs_id": self._wbs_id(p, rand.randint(1, self.wbs_nodes)),
+                "clndr_id": str(100 + p) if n % 3 else "1",
+                "phys_complete_pct": 0 if status == "TK_NotStart" else 50,
+                "rev_fdbk_flag": "N",
+                "est_wt": 1,
+                "lock_plan_flag": "N",
+                "auto_compute_act_flag": "N",
+                "complete_pct_type": rand.choice(("CP_Drtn", "CP_Phys", "CP_Units")),
+                "task_type": kind,
+                "duration_type": "DT_FixedDrtn",
+                "status_code": status,
+                "task_code": f"A{p}-{n:07d}",
+                "task_name": f"{rand.choice(TASK_VERBS)} item {n}",
+                "total_float_hr_cnt": None if done else tf * WORK_DAY_HOURS,
+                "free_float_hr_cnt": None if done else max(0, tf // 2) * WORK_DAY_HOURS,
+                "remain_drtn_hr_cnt": rem * WORK_DAY_HOURS,
+                "act_work_qty": 0,
+                "remain_work_qty": 0,
+                "target_work_qty": WORK_DAY_HOURS * drtn,
+                "target_drtn_hr_cnt": drtn * WORK_DAY_HOURS,
+                "target_equip_qty": 0,
+                "act_equip_qty": 0,
+                "remain_equip_qty": 0,
+                "cstr_date": _fmt(start) if cstr else None,
+                "act_start_date": None if status == "TK_NotStart" else _fmt(start),
+                "act_end_date": _fmt(finish) if done else None,
+                "late_start_date": _fmt(late_start),
+                "late_end_date": _fmt(late_finish),
+                "early_start_date": _fmt(max(start, self.data_date)),
+                "early_end_date": _fmt(max(finish, self.data_date)),
+                "restart_date": _fmt(max(start, self.data_date)),
+                "reend_date": _fmt(max(finish, self.data_date)),
+                "target_start_date": _fmt(start),
+                "target_end_date": _fmt(finish),
+                "rem_late_start_date": None if done else _fmt(max(late_start, self.data_date)),
+                "rem_late_end_date": None if done else _fmt(max(late_finish, self.data_date)),
+                "cstr_type": "CS_MSOA" if cstr else None,
+                "priority_type": "PT_Normal",
+                "guid": f"guid-task-{task_id}",
+                "driving_path_flag": "Y" if tf <= 0 else "N",
+                "act_this_per_work_qty": 0,
+                "act_this_per_equip_qty": 0,
+                "create_date": "2021-12-01 08:00",
+                "update_date": "2023-03-01 08:00",
+                "create_user": "admin",
+                "update_user": "admin",
+            }
+
+    def _logic(self) -> Iterator[dict]:
+        rel_id = 0
+        for p in range(self.projects):
+            rand = self._random("logic", p)
+            proj_id = self._proj_id(p)
+            for n in range(1, self.activities):
+                count = max(1, int(rand.gauss(self.logic_density, 0.7)))
+                preds = {
+                    rand.randrange(max(0, n - LOGIC_WINDOW), n) for _ in range(count)
+                }
+                for pred in sorted(preds):
+                    rel_id += 1
+                    yield {
+                        "task_pred_id": str(rel_id),
+                        "task_id": self._task_id(p, n),
+                        "pred_task_id": self._task_id(p, pred),
+                        "proj_id": proj_id,
+                        "pred_proj_id": proj_id,
+                        "pred_type": rand.choices(PRED_TYPES, PRED_TYPE_WEIGHTS)[0],
+                        "lag_hr_cnt": rand.choice((0, 0, 0, 0, 8, 16, -8)),
+                    }
+
+    def _fin_dates(self) -> Iterator[dict]:
+        yield {
+            "fin_dates_id": "1",
+            "fin_dates_name": "Jan-2023",
+            "start_date": "2023-01-01 00:00",
+            "end_date": "2023-01-31 23:59",
+        }
+        yield {
+            "fin_dates_id": "2",
+            "fin_dates_name": "Feb-2023",
+            "start_date": "2023-02-01 00:00",
+            "end_date": "2023-02-28 23:59",
+        }
+
+    def _task_resources(self) -> Iterator[dict]:
+        rsrc_id = 0
+        for p in range(self.projects):
+            rand = self._random("rsrc", p)
+            for task in self._project_tasks(p):
+                if rand.random() >= self.resources_per_task:
+                    continue
+
+                rsrc_id += 1
+                budget = round(rand.uniform(1_000, 50_000), 2)
+                complete = task["status_code"] == "TK_Complete"
+                active = task["status_code"] == "TK_Active"
+                actual = budget if complete else (round(budget / 2, 2) if active else 0.0)
+                yield {
+                    "taskrsrc_id": str(rsrc_id),
+                    "task_id": task["task_id"],
+                    "proj_id": task["proj_id"],
+                    "cost_qty_link_flag": "Y",
+                    "acct_id": str(rand.randint(1, 5)),
+                    "rsrc_id": str(rand.randint(1, 4)),
+                    "remain_qty": 0 if complete else 80,
+                    "target_qty": 80,
+                    "remain_qty_per_hr": 1,
+                    "target_lag_drtn_hr_cnt": 0,
+                    "target_qty_per_hr": 1,
+                    "act_ot_qty": 0,
+                    "act_reg_qty": 80 if complete else 0,
+                    "relag_drtn_hr_cnt": 0,
+                    "ot_factor": 1,
+                    "cost_per_qty": budget / 80,
+                    "target_cost": budget,
+                    "act_reg_cost": actual,
+                    "act_ot_cost": 0,
+                    "remain_cost": round(budget - actual, 2),
+                    "act_start_date": task["act_start_date"],
+                    "act_end_date": task["act_end_date"],
+                    "restart_date": task["restart_date"],
+                    "reend_date": task["reend_date"],
+                    "target_start_date": task["target_start_date"],
+                    "target_end_date": task["target_end_date"],
+                    "rem_late_start_date": task["rem_late_start_date"] or task["restart_date"],
+                    "rem_late_end_date": task["rem_late_end_date"] or task["reend_date"],
+                    "rollup_dates_flag": "Y",
+                    "guid": f"guid-rsrc-{rsrc_id}",
+                    "rate_type": "COST_PER_QTY",
+                    "act_this_per_cost": round(actual / 4, 2) if active else 0,
+                    "act_this_per_qty": 0,
+                    "rsrc_type": rand.choice(("RT_Labor", "RT_Equip", "RT_Mat")),
+                    "cost_per_qty_source_type": "S_Rsrc",
+                    "has_rsrc_hours": "N",
+                    "status_code": task["status_code"],
+                }
+
+    def _financials(self) -> Iterator[dict]:
+        for res in self._task_resources():
+            if res["status_code"] == "TK_NotStart":
+                continue
+
+            yield {
+                "fin_dates_id": "1",
+                "taskrsrc_id": res["taskrsrc_id"],
+                "task_id": res["task_id"],
+                "proj_id": res["proj_id"],
+                "act_qty": 10,
+                "act_cost": round(res["act_reg_cost"] / 2, 2),
+                "act_ot_qty": 0,
+                "act_ot_cost": 0,
+            }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("size", help="activities per project, e.g. 1k, 10k, 100k, 1m")
+    parser.add_argument("-o", "--output", required=True, help="path of the .xer file")
+    parser.add_argument("--projects", type=int, default=1)
+    parser.add_argument("--logic-density", type=float, default=1.8)
+    parser.add_argument("--resources-per-task", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    xer = SyntheticXer(
+        parse_size(args.size),
+        projects=args.projects,
+        logic_density=args.logic_density,
+        resources_per_task=args.resources_per_task,
+        seed=args.seed,
+    )
+    size = xer.write(args.output)
+    print(f"wrote {args.output} ({size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import io
+import os
+import pickle
+import zlib
+
+import pytest
+
+from xer_pro.data.cache import CACHE_SUFFIX, ScheduleCache
+
+SECRET = b"test secret"
+
+
+class _Stale:
+    """Pickles to a call that fails when the entry is loaded, as an entry
+    written by an older layout of a class would"""
+
+    def __reduce__(self):
+        return (int, ("1", "2", "3"))
+
+
+@pytest.fixture
+def cache(tmp_path) -> ScheduleCache:
+    return ScheduleCache(str(tmp_path / "cache"), SECRET)
+
+
+def _write_signed(cache: ScheduleCache, key: str, pickled: bytes) -> str:
+    data = zlib.compress(pickled)
+    path = os.path.join(cache.directory, key + CACHE_SUFFIX)
+    with open(path, "wb") as f:
+        f.write(cache._sign(key, data))
+        f.write(data)
+    return path
+
+
+def test_put_and_get(cache):
+    key = ScheduleCache.key(io.BytesIO(b"ERMHDR"))
+    assert cache.get(key) is None
+
+    cache.put(key, {"a": [1, 2]})
+    assert cache.get(key) == {"a": [1, 2]}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_rejects_entry_with_wrong_signature(cache):
+    cache.put("k", [1])
+    path = os.path.join(cache.directory, "k" + CACHE_SUFFIX)
+    other = ScheduleCache(cache.directory, b"other secret")
+
+    assert other.get("k") is None
+    assert not os.path.exists(path)
+
+    cache.put("k", [1])
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 1]))
+    assert cache.get("k") is None
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize(
+    "pickled",
+    [
+        b"\x80\x04cno_such_module\nThing\n.",
+        b"\x80\x04cxer_pro.data.task\nNoSuchClass\n.",
+        None,
+    ],
+    ids=["module", "attribute", "type"],
+)
+def test_stale_entry_is_a_miss(cache, pickled):
+    if pickled is None:
+        pickled = pickle.dumps(_Stale())
+    path = _write_signed(cache, "stale", pickled)
+
+    assert cache.get("stale") is None
+    assert cache.misses == 1
+    assert not os.path.exists(path)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ScheduleCache(str(tmp_path / "cache"), SECRET)
+    for n, key in enumerate(("a", "b", "c")):
+        cache.put(key, os.urandom(1000))
+        os.utime(os.path.join(cache.directory, key + CACHE_SUFFIX), (n, n))
+    size = cache.stats()["bytes"] // 3
+
+    # reading a marks it as recently used, so b is the oldest
+    assert cache.get("a") is not None
+    cache.max_bytes = size * 3
+    cache.put("d", os.urandom(1000))
+
+    names = sorted(os.listdir(cache.directory))
+    assert names == ["a" + CACHE_SUFFIX, "c" + CACHE_SUFFIX, "d" + CACHE_SUFFIX]
+
+
+def test_failed_put_removes_its_temp_file(cache, monkeypatch):
+    def disk_full(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(os, "replace", disk_full)
+    with pytest.raises(OSError):
+        cache.put("k", [1])
+
+    assert os.listdir(cache.directory) == []
+
+
+def test_refuses_directory_writable_by_others(tmp_path):
+    directory = tmp_path / "shared"
+    directory.mkdir()
+    directory.chmod(0o777)
+
+    with pytest.raises(PermissionError, match="writable by other users"):
+        ScheduleCache(str(directory), SECRET)
+
+
+def test_refuses_a_file_as_directory(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(b"")
+
+    with pytest.raises((PermissionError, FileExistsError)):
+        ScheduleCache(str(path), SECRET)
+
+
+def test_requires_a_secret(tmp_path):
+    with pytest.raises(ValueError):
+        ScheduleCache(str(tmp_path / "cache"), b"")
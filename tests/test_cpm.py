@@ -0,0 +1,308 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from xer_pro.data.cpm import CpmEngine, WorkTime, calculate_dates
+from xer_pro.data.logic_graph import LINK_TYPES
+from xer_pro.data.sched_calendar import SchedCalendar, add_work_hours
+from xer_pro.data.schedule import Schedule
+
+# Monday to Friday, 08:00 - 16:00
+CLNDR_DATA = (
+    "(0||CalendarData()("
+    "(0||DaysOfWeek()("
+    "(0||1()())"
+    "(0||2()((0||0(s|08:00|f|16:00)())))"
+    "(0||3()((0||0(s|08:00|f|16:00)())))"
+    "(0||4()((0||0(s|08:00|f|16:00)())))"
+    "(0||5()((0||0(s|08:00|f|16:00)())))"
+    "(0||6()((0||0(s|08:00|f|16:00)())))"
+    "(0||7()())))"
+    "(0||VIEW(ShowTotal|Y)())"
+    "(0||Exceptions()())))"
+)
+
+DATA_DATE = datetime(2024, 1, 8, 8, 0)  # Monday
+
+
+def _at(day: int, hour: int) -> datetime:
+    return datetime(2024, 1, day, hour, 0)
+
+
+# task code, remaining hours, constraint type, constraint date
+TASKS = (
+    ("A", 16, None, None),
+    ("B", 24, None, None),
+    ("C", 8, None, None),
+    ("D", 16, None, None),
+    ("E", 8, "CS_MSOA", _at(10, 8)),
+)
+
+# predecessor, successor, type, lag hours
+LOGIC = (
+    ("A", "B", "PR_FS", 0),
+    ("A", "C", "PR_SS", 8),
+    ("B", "D", "PR_FF", 8),
+    ("C", "D", "PR_FS", 0),
+    ("C", "E", "PR_SF", 16),
+)
+
+# early start, early finish, late start, late finish, total float, free float
+EXPECTED = {
+    "A": (_at(8, 8), _at(9, 16), _at(8, 8), _at(9, 16), 0, 0),
+    "B": (_at(10, 8), _at(12, 16), _at(10, 8), _at(12, 16), 0, 0),
+    "C": (_at(9, 8), _at(9, 16), _at(11, 8), _at(11, 16), 16, 0),
+    "D": (_at(12, 8), _at(15, 16), _at(12, 8), _at(15, 16), 0, 0),
+    "E": (_at(10, 8), _at(10, 16), _at(15, 8), _at(15, 16), 24, 24),
+}
+
+
+def make_schedule(tasks=TASKS, logic=LOGIC, stored=None) -> Schedule:
+    """Schedule of not started tasks on one calendar
+
+    stored holds the dates and floats P6 stored for each task code, in the
+    layout of EXPECTED.
+    """
+    stored = stored or {}
+    task_rows = []
+    for code, hours, cstr_type, cstr_date in tasks:
+        es, ef, ls, lf, tf, ff = stored.get(code, (None,) * 6)
+        task_rows.append(
+            {
+                "task_id": code,
+                "proj_id": "1",
+                "wbs_id": None,
+                "clndr_id": "1",
+                "task_code": code,
+                "task_name": code,
+                "task_type": "TT_Task",
+                "status_code": "TK_NotStart",
+                "driving_path_flag": False,
+                "cstr_type": cstr_type,
+                "cstr_date": cstr_date,
+                "cstr_type2": None,
+                "cstr_date2": None,
+                "act_start_date": None,
+                "act_end_date": None,
+                "restart_date": es,
+                "reend_date": ef,
+                "early_start_date": es,
+                "early_end_date": ef,
+                "late_start_date": ls,
+                "late_end_date": lf,
+                "target_drtn_hr_cnt": float(hours),
+                "remain_drtn_hr_cnt": float(hours),
+                "total_float_hr_cnt": tf,
+                "free_float_hr_cnt": ff,
+            }
+        )
+    logic_rows = [
+        {
+            "task_id": succ,
+            "pred_task_id": pred,
+            "proj_id": "1",
+            "pred_proj_id": "1",
+            "pred_type": link,
+            "lag_hr_cnt": float(lag),
+        }
+        for pred, succ, link, lag in logic
+    ]
+
+    return Schedule(
+        "1",
+        PROJECT=[
+            {
+                "proj_id": "1",
+                "proj_short_name": "TEST",
+                "last_recalc_date": DATA_DATE,
+                "plan_start_date": DATA_DATE,
+                "plan_end_date": None,
+                "scd_end_date": _at(15, 16),
+            }
+        ],
+        CALENDAR=[
+            {
+                "clndr_id": "1",
+                "clndr_name": "5 Day",
+                "clndr_type": "CA_Base",
+                "clndr_data": CLNDR_DATA,
+                "proj_id": None,
+            }
+        ],
+        TASK=task_rows,
+        TASKPRED=logic_rows,
+    )
+
+
+def _dates(engine: CpmEngine, code: str) -> tuple:
+    dates = engine.dates(engine.schedule.tasks_by_id[code])
+    return (
+        dates.early_start,
+        dates.early_finish,
+        dates.late_start,
+        dates.late_finish,
+        dates.total_float,
+        dates.free_float,
+    )
+
+
+def test_calculate_matches_hand_computed_dates():
+    engine = calculate_dates(make_schedule())
+
+    assert engine.project_finish == _at(15, 16)
+    for code, expected in EXPECTED.items():
+        assert _dates(engine, code) == expected, code
+
+
+def test_finish_before_constraint_limits_late_dates():
+    tasks = TASKS[:-1] + (("E", 8, "CS_MEOB", _at(11, 16)),)
+    engine = calculate_dates(make_schedule(tasks))
+
+    # E may finish no later than Thursday, which pulls C's SF start back
+    assert _dates(engine, "E") == (_at(10, 8), _at(10, 16), _at(11, 8), _at(11, 16), 8, 24)
+    assert _dates(engine, "C")[2:5] == (_at(10, 8), _at(10, 16), 8)
+    assert _dates(engine, "A") == EXPECTED["A"]
+
+
+def test_logic_loop_raises():
+    logic = LOGIC + (("D", "A", "PR_FS", 0),)
+    with pytest.raises(ValueError, match="Logic loop"):
+        CpmEngine(make_schedule(logic=logic))
+
+
+def test_validate_without_differences():
+    engine = calculate_dates(make_schedule(stored=EXPECTED))
+
+    assert engine.validate() == []
+
+
+def test_validate_reports_differences():
+    stored = dict(EXPECTED)
+    stored["C"] = EXPECTED["C"][:3] + (_at(12, 16), 24, 0)
+    engine = calculate_dates(make_schedule(stored=stored))
+
+    differences = [(d.task.activity_id, d.field) for d in engine.validate()]
+    assert differences == [("C", "late_finish"), ("C", "total_float")]
+
+
+def test_work_time_outside_its_window():
+    calendar = SchedCalendar(clndr_name="5 Day", clndr_type="CA_Base", clndr_data=CLNDR_DATA)
+    work = WorkTime(calendar, DATA_DATE, _at(15, 16))
+    later = datetime(2031, 6, 4, 10, 30)
+
+    for date, hours in ((DATA_DATE, 8 * 2000), (later, 44.5), (later, -8 * 3000)):
+        assert work.add(date, hours) == add_work_hours(calendar, date, hours)
+    assert work.hours_between(DATA_DATE, later) == -work.hours_between(later, DATA_DATE)
+
+
+@pytest.mark.parametrize(
+    "date",
+    [_at(9, 8), _at(9, 11), _at(9, 16), _at(12, 20), _at(13, 12), _at(15, 8)]
+    + [datetime(2031, 6, 4, 10, 30), datetime(2031, 6, 7, 9, 0)],
+)
+@pytest.mark.parametrize("hours", [0, 4, 8, 44.5])
+def test_work_time_steps_match_separate_calls(date, hours):
+    calendar = SchedCalendar(clndr_name="5 Day", clndr_type="CA_Base", clndr_data=CLNDR_DATA)
+    work = WorkTime(calendar, DATA_DATE, _at(15, 16))
+
+    start = work.next_start(date)
+    assert work.forward(date, hours) == (start, work.add(start, hours))
+    finish = work.prev_finish(date)
+    assert work.backward(date, hours) == (work.subtract(finish, hours), finish)
+
+
+def _random_schedule(rnd, count: int) -> Schedule:
+    tasks = tuple(
+        (f"T{i:02d}", rnd.choice((0, 8, 16, 24, 40)), None, None) for i in range(count)
+    )
+    logic = {}
+    for i in range(1, count):
+        for j in rnd.sample(range(i), min(i, rnd.randint(1, 2))):
+            link = rnd.choice(("PR_FS", "PR_FS", "PR_SS", "PR_FF", "PR_SF"))
+            logic[(tasks[j][0], tasks[i][0])] = (link, rnd.choice((0, 0, 8, 16)))
+
+    return make_schedule(
+        tasks, tuple((pred, succ, *rel) for (pred, succ), rel in logic.items())
+    )
+
+
+def _recalculated(engine: CpmEngine) -> CpmEngine:
+    """A fresh engine with the edited durations, logic and constraints,
+    calculated in full"""
+    fresh = CpmEngine(engine.schedule)
+    fresh.duration = list(engine.duration)
+    fresh.succs = [list(succs) for succs in engine.succs]
+    fresh.preds = [list(preds) for preds in engine.preds]
+    for name in ("start_after", "finish_after", "start_before", "finish_before"):
+        setattr(fresh, name, list(getattr(engine, name)))
+    fresh.order = fresh._topological_order()
+
+    return fresh.calculate()
+
+
+def _all_dates(engine: CpmEngine) -> list:
+    return [
+        (
+            engine.early_start[n],
+            engine.remaining_start[n],
+            engine.early_finish[n],
+            engine.late_start[n],
+            engine.late_finish[n],
+            engine.total_float(n),
+            engine.free_float(n),
+        )
+        for n in range(len(engine.tasks))
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_edits_match_full_calculation(seed):
+    rnd = random.Random(seed)
+    engine = calculate_dates(_random_schedule(rnd, 30))
+    tasks = engine.tasks
+    graph = engine.schedule.logic_graph
+
+    for i in range(40):
+        task = rnd.choice(tasks)
+        edit = rnd.choice(("duration", "add", "remove", "constraint"))
+        if i % 10 == 9:
+            # close a loop back from the successor of a relationship
+            pred = rnd.choice([n for n, succs in enumerate(engine.succs) if succs])
+            succ = rnd.choice(engine.succs[pred])[0]
+            with pytest.raises(ValueError, match="Logic loop"):
+                engine.add_relationship(tasks[succ], tasks[pred])
+        elif edit == "duration":
+            engine.set_duration(task, rnd.choice((0, 8, 24, 80)))
+        elif edit == "add":
+            other = rnd.choice([t for t in tasks if t is not task])
+            link = rnd.choice(("FS", "SS", "FF", "SF"))
+            try:
+                engine.add_relationship(task, other, link, rnd.choice((0, 8)))
+            except ValueError as error:
+                assert "Logic loop" in str(error)
+        elif edit == "remove":
+            n = graph.number(task)
+            if engine.succs[n]:
+                succ, link, _ = rnd.choice(engine.succs[n])
+                engine.remove_relationship(task, tasks[succ], LINK_TYPES[link])
+        else:
+            cstr_type = rnd.choice((None, "CS_MSOA", "CS_MEOB", "CS_MSO", "CS_MANDFIN"))
+            engine.set_constraint(task, cstr_type, _at(rnd.randint(8, 31), 8))
+
+        fresh = _recalculated(engine)
+        assert engine.project_finish == fresh.project_finish
+        assert _all_dates(engine) == _all_dates(fresh)
+
+
+def test_edit_closing_a_loop_raises_and_keeps_dates():
+    engine = calculate_dates(make_schedule())
+    before = _all_dates(engine)
+    by_id = engine.schedule.tasks_by_id
+
+    # A drives D through B and C
+    with pytest.raises(ValueError, match="Logic loop"):
+        engine.add_relationship(by_id["D"], by_id["A"])
+
+    assert _all_dates(engine) == before
+    assert _all_dates(_recalculated(engine)) == before
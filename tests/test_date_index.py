@@ -0,0 +1,78 @@
+import random
+from datetime import datetime, timedelta
+
+from xer_pro.data.date_index import TaskDateIndex, _IntervalTree
+from xer_pro.data.task import Task
+
+BASE = datetime(2024, 1, 1)
+
+
+def _task(code, start, finish, status="TK_NotStart"):
+    if status == "TK_NotStart":
+        return Task(
+            task_code=code,
+            status_code=status,
+            early_start_date=start,
+            early_end_date=finish,
+        )
+    return Task(
+        task_code=code,
+        status_code=status,
+        act_start_date=start,
+        early_end_date=finish,
+    )
+
+
+def _brute_active(tasks, start, end):
+    spans = [
+        (task, min(task.start, task.finish), max(task.start, task.finish))
+        for task in tasks
+        if task.start is not None and task.finish is not None
+    ]
+    spans.sort(key=lambda span: span[0].start)
+    return tuple(task for task, lo, hi in spans if lo < end and hi >= start)
+
+
+def test_inverted_interval_builds():
+    tree = _IntervalTree([(datetime(2024, 1, 5), datetime(2024, 1, 3), 0)])
+    assert tree.overlapping(datetime(2024, 1, 4), datetime(2024, 1, 6)) == [0]
+    assert tree.overlapping(datetime(2024, 1, 6), datetime(2024, 1, 7)) == []
+
+
+def test_active_with_inverted_task():
+    # in progress task with an actual start after its early finish
+    inverted = _task("A", datetime(2024, 1, 5), datetime(2024, 1, 3), "TK_Active")
+    normal = _task("B", datetime(2024, 1, 1), datetime(2024, 1, 2))
+    index = TaskDateIndex([inverted, normal])
+
+    assert index.active(datetime(2024, 1, 4), datetime(2024, 1, 10)) == (inverted,)
+    assert index.active(datetime(2024, 1, 1), datetime(2024, 1, 10)) == (
+        normal,
+        inverted,
+    )
+    assert index.active(datetime(2024, 1, 6), datetime(2024, 1, 10)) == ()
+
+
+def test_active_with_empty_window():
+    tasks = [_task("A", datetime(2024, 1, 5), datetime(2024, 1, 8))]
+    index = TaskDateIndex(tasks)
+
+    assert index.active(datetime(2023, 12, 1), datetime(2023, 12, 31)) == ()
+    assert index.active(datetime(2024, 2, 1), datetime(2024, 2, 28)) == ()
+    assert TaskDateIndex([]).active(BASE, BASE + timedelta(days=7)) == ()
+
+
+def test_active_matches_scan():
+    rng = random.Random(20)
+    tasks = []
+    for i in range(300):
+        start = BASE + timedelta(days=rng.randrange(120))
+        finish = start + timedelta(days=rng.randrange(-10, 30))
+        status = "TK_Active" if rng.random() < 0.3 else "TK_NotStart"
+        tasks.append(_task(f"A{i}", start, finish, status))
+    index = TaskDateIndex(tasks)
+
+    for _ in range(100):
+        start = BASE + timedelta(days=rng.randrange(-10, 130))
+        end = start + timedelta(days=rng.randrange(0, 40))
+        assert index.active(start, end) == _brute_active(tasks, start, end)
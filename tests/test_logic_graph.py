@@ -0,0 +1,75 @@
+from xer_pro.data.logic import Relationship
+from xer_pro.data.logic_graph import LINK_CODES, LogicGraph
+from xer_pro.data.task import Task
+
+
+def _tasks(*codes: str) -> dict[str, Task]:
+    return {
+        code: Task({"task_id": f"id-{code}", "task_code": code, "task_type": "TT_Task"})
+        for code in codes
+    }
+
+
+def _rel(tasks: dict[str, Task], pred: str, succ: str, link: str, lag=0.0):
+    return Relationship(
+        tasks[pred], tasks[succ], {"pred_type": f"PR_{link}", "lag_hr_cnt": lag}
+    )
+
+
+def _names(rels) -> list[str]:
+    return [f"{r.predecessor.activity_id}{r.successor.activity_id} {r.link}" for r in rels]
+
+
+def test_csr_rows_by_successor_and_predecessor():
+    tasks = _tasks("D", "B", "A", "C")
+    logic = [
+        _rel(tasks, "C", "D", "FS", 8.0),
+        _rel(tasks, "A", "C", "SS", 16.0),
+        _rel(tasks, "B", "D", "FF"),
+        _rel(tasks, "A", "D", "SF", None),
+        _rel(tasks, "B", "C", "FS"),
+        _rel(tasks, "A", "B", "FS"),
+    ]
+    graph = LogicGraph(tasks.values(), logic)
+    a, b, c, d = (tasks[code] for code in "ABCD")
+
+    # tasks numbered A=0, B=1, C=2, D=3; edges sorted by predecessor, successor
+    assert graph.tasks == (a, b, c, d)
+    assert _names(graph.relationships) == [
+        "AB FS",
+        "AC SS",
+        "AD SF",
+        "BC FS",
+        "BD FF",
+        "CD FS",
+    ]
+    assert list(graph.succ_offsets) == [0, 3, 5, 6, 6]
+    assert list(graph.succ_targets) == [1, 2, 3, 2, 3, 3]
+    assert list(graph.pred_offsets) == [0, 0, 1, 3, 6]
+    assert list(graph.pred_edges) == [0, 1, 3, 2, 4, 5]
+    assert list(graph.pred_sources) == [0, 0, 1, 0, 1, 2]
+    assert list(graph.links) == [LINK_CODES[link] for link in "FS SS SF FS FF FS".split()]
+    assert list(graph.lags) == [0.0, 16.0, 0.0, 0.0, 0.0, 8.0]
+
+    assert graph.successors(a) == graph.relationships[:3]
+    assert graph.successors(d) == ()
+    assert graph.predecessors(d) == tuple(graph.relationships[i] for i in (2, 4, 5))
+    assert (graph.out_degree(0), graph.in_degree(0)) == (3, 0)
+    assert (graph.out_degree(3), graph.in_degree(3)) == (0, 3)
+    assert graph.predecessor_links(3) == [LINK_CODES["SF"], LINK_CODES["FF"], 0]
+
+
+def test_by_link():
+    tasks = _tasks("A", "B", "C")
+    logic = [
+        _rel(tasks, "B", "C", "SS"),
+        _rel(tasks, "A", "C", "FS"),
+        _rel(tasks, "A", "B", "FS"),
+        _rel(tasks, "A", "B", "FF"),
+    ]
+    graph = LogicGraph(tasks.values(), logic)
+
+    assert _names(graph.by_link("FS")) == ["AB FS", "AC FS"]
+    assert _names(graph.by_link("SS", "FF")) == ["AB FF", "BC SS"]
+    assert graph.by_link("SF") == ()
+    assert len(graph.by_link("FS", "SS", "FF", "SF")) == len(logic)
@@ -0,0 +1,188 @@
+import io
+from datetime import datetime
+
+import pytest
+
+from benchmarks.synthetic import SyntheticXer
+from xer_pro.data import parse
+from xer_pro.data.parse import _decode_date, iter_xer_rows, parse_xer_file
+from xer_pro.data.report import ParseReport
+from xer_pro.data.schedule import SCHEDULE_COLUMNS, SCHEDULE_TABLES, build_schedules
+from xer_pro.data.table import XerTable
+
+XER = (
+    'ERMHDR\t19.12\r\n'
+    '%T\tPROJECT\r\n'
+    '%F\tproj_id\tproj_short_name\tlast_recalc_date\r\n'
+    '%R\t1\tALPHA\t2024-01-02 08:00\r\n'
+    '%T\tTASK\r\n'
+    '%F\ttask_id\ttask_code\ttask_name\ttarget_drtn_hr_cnt\tdriving_path_flag\r\n'
+    '%R\t10\tA1000\tCaf\xe9 fit-out\t16\tY\r\n'
+    '%R\t11\tA1010\r\n'
+    '%E\r\n'
+).encode('cp1252')
+
+
+def test_iter_xer_rows():
+    rows = list(iter_xer_rows(io.BytesIO(XER)))
+
+    assert [name for name, _ in rows] == ['PROJECT', 'TASK', 'TASK']
+    assert rows[0][1] == {
+        'proj_id': '1',
+        'proj_short_name': 'ALPHA',
+        'last_recalc_date': datetime(2024, 1, 2, 8, 0),
+    }
+    assert rows[1][1] == {
+        'task_id': '10',
+        'task_code': 'A1000',
+        'task_name': 'Caf\xe9 fit-out',
+        'target_drtn_hr_cnt': 16.0,
+        'driving_path_flag': True,
+    }
+    # missing trailing fields are empty
+    assert rows[2][1]['task_name'] is None
+
+
+def test_iter_xer_rows_matches_tables():
+    tables = parse_xer_file(XER)
+    rows = [row for name, row in iter_xer_rows(XER) if name == 'TASK']
+
+    assert [dict(row) for row in tables['TASK']] == rows
+
+
+def test_projected_parse_drops_only_unlisted_columns():
+    full = parse_xer_file(XER)
+    tables = parse_xer_file(XER, columns={'TASK': {'task_id', 'task_name', 'x'}})
+
+    # listed tables keep their listed columns in file order, others keep all
+    assert tables['TASK'].labels == ['task_id', 'task_name']
+    assert tables['PROJECT'].labels == full['PROJECT'].labels
+    assert [dict(row) for row in tables['PROJECT']] == [
+        dict(row) for row in full['PROJECT']
+    ]
+    assert [dict(row) for row in tables['TASK']] == [
+        {'task_id': row['task_id'], 'task_name': row['task_name']}
+        for row in full['TASK']
+    ]
+
+
+def test_parallel_projected_parse_matches_full_parse(monkeypatch):
+    monkeypatch.setattr(parse, 'PARALLEL_MIN_BYTES', 0)
+    monkeypatch.setattr(parse, 'PARALLEL_CHUNK_BYTES', 2048)
+    data = SyntheticXer(300, seed=4).to_bytes()
+    full = parse_xer_file(data)
+    tables = parse_xer_file(data, workers=2, columns=SCHEDULE_COLUMNS)
+
+    for name in ('TASK', 'TASKPRED', 'TASKRSRC'):
+        keep = SCHEDULE_COLUMNS[name]
+        labels = [label for label in full[name].labels if label in keep]
+        assert tables[name].labels == labels
+        assert [dict(row) for row in tables[name]] == [
+            {label: row[label] for label in labels} for row in full[name]
+        ]
+
+
+def test_decode_date():
+    assert _decode_date(b'2024-01-02 08:00') == datetime(2024, 1, 2, 8, 0)
+    # values that are not fixed width fall back to strptime
+    assert _decode_date(b'2024-1-2 8:00') == datetime(2024, 1, 2, 8, 0)
+    # the cache shares one object between equal values
+    assert _decode_date(b'2024-03-04 17:30') is _decode_date(b'2024-03-04 17:30')
+
+
+def test_decode_date_empty_value():
+    tables = parse_xer_file(
+        XER.replace(b'\tALPHA\t2024-01-02 08:00\r\n', b'\tALPHA\t\r\n')
+    )
+
+    # empty fields are never decoded
+    assert tables['PROJECT'][0]['last_recalc_date'] is None
+    with pytest.raises(ValueError):
+        _decode_date(b'')
+
+
+@pytest.mark.parametrize(
+    'val',
+    [b'2024/01/02 08:00', b'2024-13-01 08:00', b'2024-01-02 24:00', b'2024-01-02'],
+)
+def test_decode_date_malformed_value(val):
+    with pytest.raises(ValueError):
+        _decode_date(val)
+
+
+def test_key_values_are_interned_across_tables():
+    tables = parse_xer_file(SyntheticXer(50, seed=5).to_bytes())
+    task_ids = {task_id: task_id for task_id in tables['TASK'].column('task_id')}
+    pred = tables['TASKPRED'][0]
+
+    assert pred['task_id'] is task_ids[pred['task_id']]
+    assert pred['pred_task_id'] is task_ids[pred['pred_task_id']]
+    assert pred['proj_id'] is tables['PROJECT'][0]['proj_id']
+    # free text is not interned
+    assert not parse._is_interned('task_name')
+
+
+def test_intern_table_shares_values_of_a_typed_table():
+    interned = parse.InternTable()
+    code = interned[b'TK_Active']
+    # as typed by a worker process, equal to the interned value but not shared
+    value = b'TK_Active'.decode()
+    table = XerTable({'status_code': [value, None]})
+    assert value is not code
+
+    interned.share(table)
+
+    assert table.column('status_code')[0] is code
+    assert table.column('status_code')[1] is None
+    assert interned[b'TK_Active'] is code
+
+
+def test_parse_report_as_dict():
+    report = ParseReport()
+    tables = parse_xer_file(XER, report=report)
+    tables['TASK']
+
+    # only the tables read are recorded
+    assert report.as_dict() == {
+        'tables': [
+            {
+                'name': 'TASK',
+                'rows': 2,
+                'columns': 5,
+                'bytes': len(XER) - XER.index(b'%T\tTASK') - len(b'%E\r\n'),
+                'seconds': report.tables['TASK'].seconds,
+                'memory': report.tables['TASK'].memory,
+            }
+        ],
+        'steps': [{'name': 'scan', 'seconds': report.steps[0].seconds, 'items': 2}],
+    }
+
+
+def test_parse_report_counts_schedule_steps():
+    report = ParseReport()
+    tables = parse_xer_file(SyntheticXer(50, seed=3).to_bytes(), report=report)
+    schedule = build_schedules(tables.select(SCHEDULE_TABLES), report)[0]
+    data = report.as_dict()
+
+    assert [t['name'] for t in data['tables']] == [
+        name for name in SCHEDULE_TABLES if name in tables
+    ]
+    task = next(t for t in data['tables'] if t['name'] == 'TASK')
+    assert task['rows'] == len(tables['TASK'])
+    assert task['columns'] == len(tables['TASK'].labels)
+    steps = {s['name']: s['items'] for s in data['steps']}
+    assert list(steps) == [
+        'scan',
+        'partition_tables',
+        'calendars',
+        'wbs',
+        '_generate_tasks',
+        'task_index',
+        '_generate_logic',
+        '_generate_resources',
+        '_generate_financials',
+        'assignments',
+    ]
+    assert steps['scan'] == len(tables)
+    assert steps['_generate_tasks'] == len(schedule.tasks()) == 50
+    assert steps['_generate_logic'] == len(tables['TASKPRED'])
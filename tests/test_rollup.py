@@ -0,0 +1,155 @@
+from datetime import datetime
+
+import pytest
+
+from xer_pro.data.rollup import ResourceRollup, RollupTotals
+from xer_pro.data.schedule import Schedule
+from xer_pro.services.warning_services import get_cost_warnings
+
+# task id, wbs id, status, physical percent complete
+TASKS = (
+    ("T1", "W1", "TK_Active", 50.0),
+    ("T2", "W1", "TK_NotStart", 0.0),
+    ("T3", "W2", "TK_Complete", 100.0),
+)
+
+# taskrsrc id, task, resource, account, resource type,
+# budget, actual regular, actual overtime, this period, remaining (units),
+# budget, actual regular, actual overtime, this period, remaining (cost)
+ASSIGNMENTS = (
+    ("X1", "T1", "R1", "A1", "RT_Labor", 100, 40, 10, 20, 50, 1000, 400, 100, 200, 500),
+    ("X2", "T1", "R2", "A2", "RT_Mat", 10, 5, 0, 5, 6, 2000, 1000, 0, 1000, 1200),
+    ("X3", "T2", "R1", "A1", "RT_Labor", 80, 0, 0, 0, 80, 800, 0, 0, 0, 800),
+    ("X4", "T3", "R1", "A2", "RT_Labor", 40, 25, 5, 0, 0, 400, 250, 50, 0, 0),
+    ("X5", "T3", "R2", None, "RT_Mat", 5, 5, 0, 0, 0, 250, 250, 0, 0, 0),
+)
+
+
+# summed by hand from ASSIGNMENTS: budget, actual, this period and remaining
+# cost, the same for units, earned value (budget x percent complete) and count
+EXPECTED = {
+    "total": RollupTotals(4450, 2050, 1200, 2500, 235, 90, 25, 136, 2150, 5),
+    "by_resource": {
+        "R1": RollupTotals(2200, 800, 200, 1300, 220, 80, 20, 130, 900, 3),
+        "R2": RollupTotals(2250, 1250, 1000, 1200, 15, 10, 5, 6, 1250, 2),
+    },
+    "by_type": {
+        "RT_Labor": RollupTotals(2200, 800, 200, 1300, 220, 80, 20, 130, 900, 3),
+        "RT_Mat": RollupTotals(2250, 1250, 1000, 1200, 15, 10, 5, 6, 1250, 2),
+    },
+    "by_account": {
+        "A1": RollupTotals(1800, 500, 200, 1300, 180, 50, 20, 130, 500, 2),
+        "A2": RollupTotals(2400, 1300, 1000, 1200, 50, 35, 5, 6, 1400, 2),
+        None: RollupTotals(250, 250, 0, 0, 5, 5, 0, 0, 250, 1),
+    },
+    "by_wbs": {
+        "W1": RollupTotals(3800, 1500, 1200, 2500, 190, 55, 25, 136, 1500, 3),
+        "W2": RollupTotals(650, 550, 0, 0, 45, 35, 0, 0, 650, 2),
+    },
+    "by_task": {
+        "T1": RollupTotals(3000, 1500, 1200, 1700, 110, 55, 25, 56, 1500, 2),
+        "T2": RollupTotals(800, 0, 0, 800, 80, 0, 0, 80, 0, 1),
+        "T3": RollupTotals(650, 550, 0, 0, 45, 35, 0, 0, 650, 2),
+    },
+}
+
+
+@pytest.fixture
+def schedule() -> Schedule:
+    task_rows = [
+        {
+            "task_id": task_id,
+            "proj_id": "1",
+            "wbs_id": wbs_id,
+            "clndr_id": None,
+            "task_code": task_id,
+            "task_name": task_id,
+            "task_type": "TT_Task",
+            "status_code": status,
+            "complete_pct_type": "CP_Phys",
+            "phys_complete_pct": pct,
+            "driving_path_flag": False,
+        }
+        for task_id, wbs_id, status, pct in TASKS
+    ]
+    wbs_rows = [
+        {
+            "wbs_id": wbs_id,
+            "proj_id": "1",
+            "parent_wbs_id": "P" if wbs_id != "P" else None,
+            "proj_node_flag": wbs_id == "P",
+            "wbs_name": wbs_id,
+            "wbs_short_name": wbs_id,
+        }
+        for wbs_id in ("P", "W1", "W2")
+    ]
+    labels = (
+        "taskrsrc_id task_id rsrc_id acct_id rsrc_type "
+        "target_qty act_reg_qty act_ot_qty act_this_per_qty remain_qty "
+        "target_cost act_reg_cost act_ot_cost act_this_per_cost remain_cost"
+    ).split()
+    assignment_rows = [
+        {"proj_id": "1", "target_lag_drtn_hr_cnt": 0.0, **dict(zip(labels, values))}
+        for values in ASSIGNMENTS
+    ]
+
+    return Schedule(
+        "1",
+        PROJECT=[
+            {
+                "proj_id": "1",
+                "proj_short_name": "TEST",
+                "last_recalc_date": datetime(2024, 1, 8),
+            }
+        ],
+        PROJWBS=wbs_rows,
+        TASK=task_rows,
+        RSRC=[
+            {"rsrc_id": "R1", "rsrc_name": "Crew", "rsrc_type": "RT_Labor"},
+            {"rsrc_id": "R2", "rsrc_name": "Concrete", "rsrc_type": "RT_Mat"},
+        ],
+        ACCOUNT=[
+            {"acct_id": "A1", "acct_name": "Labor", "acct_short_name": "100"},
+            {"acct_id": "A2", "acct_name": "Material", "acct_short_name": "200"},
+        ],
+        TASKRSRC=assignment_rows,
+    )
+
+
+def test_rollupRollupTotals(schedule):
+    rollup = ResourceRollup(schedule.resources)
+
+    assert rollup.total == EXPECTED["total"]
+    for breakdown in ("by_resource", "by_type", "by_account", "by_wbs", "by_task"):
+        assert getattr(rollup, breakdown) == EXPECTED[breakdown], breakdown
+
+
+def test_rollup_by_assignment_matches_each_resource(schedule):
+    rollup = ResourceRollup(schedule.resources)
+
+    assert list(rollup.by_assignment) == ["X1", "X2", "X3", "X4", "X5"]
+    for res in schedule.resources:
+        totals = rollup.by_assignment[res["taskrsrc_id"]]
+        assert totals.assignments == 1
+        assert totals.cost == res.cost
+        assert totals.unit_qty == res.unit_qty
+        assert totals.earned_value == res.earned_value
+
+    assert rollup.by_wbs["W1"].cost_variance == 200
+    assert schedule.rollup.total == EXPECTED["total"]
+
+
+def test_cost_warnings(schedule):
+    warnings = get_cost_warnings(schedule)
+
+    # X2 finishes 200 over budget and X4 100 under; X4 is complete with
+    # 300 spent of an earned 400
+    found = {key: [res["taskrsrc_id"] for res in w] for key, w in warnings.items()}
+    assert found == {"cost_variance": ["X2", "X4"], "ev_variance": ["X4"]}
+
+    # the same warnings as checking each resource's own values
+    for res in schedule.resources:
+        assert (res in warnings["cost_variance"]) == (res.cost.variance != 0)
+        assert (res in warnings["ev_variance"]) == (
+            round(res.cost.actual, 2) != round(res.earned_value, 2)
+        )
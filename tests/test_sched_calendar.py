@@ -0,0 +1,135 @@
+import random
+from datetime import datetime, timedelta
+
+from xer_pro.data.sched_calendar import (
+    SchedCalendar,
+    add_work_hours,
+    compile_calendar,
+    work_hours_between,
+)
+
+# Monday to Friday 07:00 - 11:00 and 12:00 - 16:00, Saturday 08:00 - 12:00
+WORK_WEEK = (
+    "(0||DaysOfWeek()("
+    "(0||1()())"
+    "(0||2()((0||0(s|07:00|f|11:00)())(0||1(s|12:00|f|16:00)())))"
+    "(0||3()((0||0(s|07:00|f|11:00)())(0||1(s|12:00|f|16:00)())))"
+    "(0||4()((0||0(s|07:00|f|11:00)())(0||1(s|12:00|f|16:00)())))"
+    "(0||5()((0||0(s|07:00|f|11:00)())(0||1(s|12:00|f|16:00)())))"
+    "(0||6()((0||0(s|07:00|f|11:00)())(0||1(s|12:00|f|16:00)())))"
+    "(0||7()((0||0(s|08:00|f|12:00)())))))"
+)
+
+START = datetime(2024, 1, 10)
+
+
+def _serial(day: datetime) -> int:
+    """Excel serial date as stored in clndr_data"""
+    return (day - datetime(1899, 12, 30)).days
+
+
+def _calendar(holidays=(), exceptions=()) -> SchedCalendar:
+    items = [f"(0||{i}(d|{_serial(day)})())" for i, day in enumerate(holidays)]
+    items.extend(
+        f"(0||{i}(d|{_serial(day)})((0||0(s|{start}|f|{end})())))"
+        for i, (day, start, end) in enumerate(exceptions, start=len(items))
+    )
+    clndr_data = (
+        f"(0||CalendarData()({WORK_WEEK}"
+        f"(0||VIEW(ShowTotal|Y)())(0||Exceptions()({''.join(items)}))))"
+    )
+    return SchedCalendar(
+        clndr_id="1", clndr_name="Test", clndr_type="CA_Base", clndr_data=clndr_data
+    )
+
+
+def _baseline_day(clndr: SchedCalendar, day: datetime) -> tuple:
+    """Shifts, workday flag and hours of a date looked up the way
+    SchedCalendar did before the calendars were compiled"""
+    shifts = clndr.work_exceptions.get(day) or clndr.work_week.get(f"{day:%A}")
+    if day in clndr.holidays:
+        is_work = False
+    elif day in clndr.work_exceptions:
+        is_work = True
+    else:
+        is_work = bool(shifts)
+
+    return shifts, is_work, round(shifts.hours, 3) if is_work else 0.0
+
+
+def _assert_matches_baseline(clndr: SchedCalendar) -> None:
+    compiled = clndr._compiled
+    for i in range(compiled.last - compiled.first + 1):
+        day = datetime.fromordinal(compiled.first + i)
+        shifts, is_work, hours = _baseline_day(clndr, day)
+        assert compiled.shifts[i] == shifts, day
+        assert compiled.work[i] == is_work, day
+        assert compiled.hours[i] == hours, day
+        minutes = sum(end - start for start, end in compiled.periods[i])
+        assert minutes == hours * 60, day
+        assert compiled.cumulative[i + 1] - compiled.cumulative[i] == minutes, day
+
+
+def test_compiled_tables_match_baseline_across_growth():
+    first = compile_calendar(_calendar(), START, START)
+    edge = datetime.fromordinal(first.last)
+
+    # holidays and exceptions on both sides of the first window's last day
+    days = [edge + timedelta(days=n) for n in range(-10, 11)]
+    clndr = _calendar(
+        holidays=days[::3],
+        exceptions=[(day, "09:00", "13:00") for day in days[1::3]],
+    )
+    assert set(clndr.holidays) & set(days[::3])
+
+    compiled = compile_calendar(clndr, START, START)
+    assert compiled.first < days[0].toordinal() <= compiled.last < days[-1].toordinal()
+    _assert_matches_baseline(clndr)
+
+    # grow right past the exceptions, then left
+    grown = compile_calendar(clndr, START, edge + timedelta(days=30))
+    assert grown.first == compiled.first and grown.last > days[-1].toordinal()
+    _assert_matches_baseline(clndr)
+
+    grown = compile_calendar(clndr, START - timedelta(days=800), START)
+    assert grown.first < compiled.first and grown.last >= days[-1].toordinal()
+    _assert_matches_baseline(clndr)
+
+
+def _work_moment(rnd: random.Random, clndr: SchedCalendar, after_start: bool):
+    """Random quarter hour inside a shift; after_start leaves out the start
+    of the shift, otherwise the end of the shift is left out"""
+    while True:
+        day = START + timedelta(days=rnd.randrange(-400, 1200))
+        compiled = compile_calendar(clndr, day, day)
+        if periods := compiled.periods[compiled.index(day)]:
+            break
+
+    start, end = rnd.choice(periods)
+    quarters = list(range(start, end + 1, 15))
+    minute = rnd.choice(quarters[1:] if after_start else quarters[:-1])
+    return day + timedelta(minutes=minute)
+
+
+def test_work_hours_round_trip():
+    rnd = random.Random(25)
+    clndr = _calendar(
+        holidays=[START + timedelta(days=n) for n in range(0, 900, 37)],
+        exceptions=[
+            (START + timedelta(days=n), "10:00", "14:30") for n in range(5, 900, 41)
+        ],
+    )
+
+    checked = 0
+    while checked < 2000:
+        start = _work_moment(rnd, clndr, after_start=False)
+        end = _work_moment(rnd, clndr, after_start=True)
+        if end <= start:
+            continue
+
+        hours = work_hours_between(clndr, start, end)
+        assert hours > 0
+        assert add_work_hours(clndr, start, hours) == end
+        assert work_hours_between(clndr, end, start) == -hours
+        assert add_work_hours(clndr, end, -hours) == start
+        checked += 1
@@ -0,0 +1,65 @@
+import pytest
+
+from benchmarks.synthetic import SyntheticXer
+from xer_pro.data.parse import parse_xer_file
+from xer_pro.data.schedule import build_schedules
+from xer_pro.data.table import LazyTextColumn, LinkedRow, XerTable
+
+
+def test_xer_row_can_not_add_a_column():
+    table = XerTable({"task_id": ["1", "2"]}, 2)
+    row = table[0]
+
+    row["task_id"] = "3"
+    assert table.column("task_id") == ["3", "2"]
+    with pytest.raises(KeyError):
+        row["calendar"] = object()
+    assert list(table.columns) == ["task_id"]
+
+
+def test_linked_row_keeps_its_own_values():
+    table = XerTable({"task_id": ["1"], "clndr_id": ["9"]}, 1)
+    row = LinkedRow(table[0], calendar="A")
+
+    row["task_id"] = "2"
+    assert row["task_id"] == "2" and row["calendar"] == "A"
+    assert row.get("clndr_id") == "9" and row.get("wbs", 0) == 0
+    assert dict(row) == {"calendar": "A", "task_id": "2", "clndr_id": "9"}
+    assert table.column("task_id") == ["1"]
+    assert list(table.columns) == ["task_id", "clndr_id"]
+
+
+def test_schedules_from_shared_tables_keep_their_links():
+    tables = parse_xer_file(SyntheticXer(200, seed=2).to_bytes())
+    columns = {name: list(tables[name].columns) for name in tables}
+    first = build_schedules(tables)[0]
+    second = build_schedules(tables)[0]
+
+    for schedule in (first, second):
+        calendars = {cal["clndr_id"]: cal for cal in schedule.calendars}
+        for task in schedule.tasks():
+            assert task.calendar is calendars[task["clndr_id"]]
+        for res in schedule.resources:
+            assert res.task is schedule.tasks_by_id[res.task.activity_id]
+
+    assert first.tasks()[0].calendar is not second.tasks()[0].calendar
+    assert {name: list(tables[name].columns) for name in tables} == columns
+
+
+def test_lazy_text_column_searches_decoded_values():
+    def column():
+        return LazyTextColumn("cp1252", [b"Foo", b"Caf\xe9", b"Foo", None])
+
+    assert "Foo" in column()
+    assert b"Foo" not in column()
+    assert column().count("Foo") == 2
+    assert column().index("Caf\xe9") == 1
+    assert column().index("Foo", 1) == 2
+    with pytest.raises(ValueError):
+        column().index(b"Foo")
+
+    assert column() == ["Foo", "Caf\xe9", "Foo", None]
+    assert column() == column()
+    assert not column() != column()
+    assert column() != [b"Foo", b"Caf\xe9", b"Foo", None]
+    assert sorted(column()[:3]) == ["Caf\xe9", "Foo", "Foo"]
@@ -0,0 +1,87 @@
+import pytest
+
+from xer_pro.data.task import Task
+from xer_pro.data.task_index import TaskIndex
+
+np = pytest.importorskip("numpy")
+
+from xer_pro.data.task_frame import TaskFrame  # noqa: E402
+
+
+def _task(code, status="TK_NotStart", float_days=0, **row) -> Task:
+    return Task(
+        {
+            "task_code": code,
+            "task_name": code,
+            "task_type": "TT_Task",
+            "status_code": status,
+            "clndr_id": "1",
+            "wbs_id": "10",
+            "driving_path_flag": False,
+            "target_drtn_hr_cnt": 80.0,
+            "remain_drtn_hr_cnt": 0.0 if status == "TK_Complete" else 80.0,
+            "total_float_hr_cnt": float_days * 8.0,
+            "free_float_hr_cnt": 0.0,
+            **row,
+        }
+    )
+
+
+def test_float_counts_at_group_boundaries():
+    floats = (-3, 0, 1, 20, 21, 49, 50, 51)
+    tasks = [_task(f"A{i}", float_days=tf) for i, tf in enumerate(floats)]
+    tasks.append(_task("DONE", "TK_Complete", float_days=100))
+
+    counts = TaskFrame(tasks).float_counts(near_critical=20, high_float=50)
+
+    assert counts == {
+        "Critical": 2,
+        "Near Critical": 2,
+        "Normal Float": 2,
+        "High Float": 2,
+    }
+
+
+def test_unknown_status_counts_as_open():
+    tasks = [
+        _task("A", "TK_NotStart", float_days=5),
+        _task("B", "TK_Active", remain_drtn_hr_cnt=40.0),
+        _task("C", "TK_Complete"),
+        _task("D", "TK_Suspend", float_days=60),
+    ]
+    frame = TaskFrame(tasks)
+    index = TaskIndex(tasks)
+
+    assert frame.status.tolist() == [0, 1, 2, -1]
+    assert frame.is_open.tolist() == [True, True, False, True]
+    assert frame.open_float().tolist() == [5, 0, 60]
+    assert frame.float_counts(20, 50)["High Float"] == 1
+    assert frame.status_count("TK_Complete") == index.count("TK_Complete") == 1
+    assert index.status("TK_Suspend") == (tasks[3],)
+
+    # durations 10, 10, 10, 10 days with 10, 5, 0, 10 remaining; and
+    # one complete and one in progress task of four
+    assert frame.percent_complete() == pytest.approx((0.375 + 0.375) / 2 * 100)
+
+
+def test_task_index_partitions():
+    tasks = [
+        _task("A", "TK_Complete", clndr_id="1", wbs_id="10"),
+        _task("B", "TK_Active", clndr_id="2", wbs_id="10", driving_path_flag=True),
+        _task("C", "TK_NotStart", clndr_id="1", wbs_id="11", task_type="TT_Mile"),
+        _task("D", "TK_NotStart", clndr_id="2", wbs_id="11", driving_path_flag=True),
+    ]
+    a, b, c, d = tasks
+    index = TaskIndex(tasks)
+
+    assert len(index) == 4
+    assert index.open == (b, c, d)
+    assert index.status("TK_Complete", "TK_NotStart") == (a, c, d)
+    assert index.status("TK_NotStart", "TK_Active", "TK_Complete") == index.all
+    assert index.count("TK_NotStart") == 2
+    assert index.count("TK_Suspend") == 0
+    assert index.by_type == {"TT_Task": (a, b, d), "TT_Mile": (c,)}
+    assert index.calendar("2") == (b, d)
+    assert index.calendar(None) == ()
+    assert index.wbs("11") == (c, d)
+    assert index.longest_path == (b, d)
@@ -0,0 +1,157 @@
+from datetime import datetime
+
+from xer_pro.data.logic import Relationship
+from xer_pro.data.logic_graph import LogicGraph
+from xer_pro.data.schedule import Schedule
+from xer_pro.data.task import Task
+from xer_pro.services.warning_services import (
+    RedundantLogic,
+    get_duplicate_logic,
+    get_open_ends,
+    get_redundant_logic,
+)
+
+
+def _task_row(code: str, task_type: str = "TT_Task") -> dict:
+    return {
+        "task_id": f"id-{code}",
+        "proj_id": "1",
+        "wbs_id": None,
+        "clndr_id": None,
+        "task_code": code,
+        "task_name": code,
+        "task_type": task_type,
+        "status_code": "TK_NotStart",
+        "driving_path_flag": False,
+    }
+
+
+def _logic_row(pred: str, succ: str, link: str) -> dict:
+    return {
+        "task_id": f"id-{succ}",
+        "pred_task_id": f"id-{pred}",
+        "proj_id": "1",
+        "pred_proj_id": "1",
+        "pred_type": f"PR_{link}",
+        "lag_hr_cnt": 0.0,
+    }
+
+
+def _graph(tasks, logic) -> tuple[LogicGraph, dict[tuple, Relationship]]:
+    """Graph of TT_Task tasks, or LOE tasks for codes starting with L, and
+    its relationships keyed by (predecessor, successor, link)"""
+    tasks = {
+        code: Task(_task_row(code, "TT_LOE" if code.startswith("L") else "TT_Task"))
+        for code in tasks
+    }
+    rels = {
+        (pred, succ, link): Relationship(
+            tasks[pred], tasks[succ], _logic_row(pred, succ, link)
+        )
+        for pred, succ, link in logic
+    }
+    return LogicGraph(tasks.values(), rels.values()), rels
+
+
+def test_redundant_shortcut_of_a_fs_chain():
+    graph, rels = _graph(
+        "ABCDE",
+        [
+            ("A", "B", "FS"),
+            ("B", "C", "FS"),
+            ("C", "D", "FS"),
+            ("A", "D", "FS"),
+            ("A", "E", "FS"),
+        ],
+    )
+
+    redundant = get_redundant_logic(graph)
+
+    # A --> D is implied by A --> B --> C --> D, two relationships past A --> B
+    assert redundant == {
+        rels["A", "B", "FS"]: {
+            RedundantLogic(rels["A", "B", "FS"], rels["A", "D", "FS"], 2)
+        }
+    }
+    assert next(iter(redundant[rels["A", "B", "FS"]])).level == 2
+
+
+def test_redundant_logic_needs_a_matching_link():
+    # an SS path does not make a direct FS relationship redundant, and a
+    # path through a level of effort task is not followed from A
+    graph, _ = _graph(
+        ["A", "B", "C", "L1", "D"],
+        [
+            ("A", "B", "SS"),
+            ("B", "C", "FS"),
+            ("A", "C", "FS"),
+            ("A", "L1", "FS"),
+            ("L1", "D", "FS"),
+            ("A", "D", "FS"),
+        ],
+    )
+
+    assert get_redundant_logic(graph) == {}
+
+
+def test_duplicate_logic_between_the_same_tasks():
+    graph, rels = _graph(
+        "ABCD",
+        [
+            ("A", "B", "FS"),
+            ("B", "C", "SS"),
+            ("A", "B", "SS"),
+            ("B", "C", "FF"),
+            ("C", "D", "SF"),
+        ],
+    )
+
+    # B --> C is SS and FF only, which is not a duplicate
+    assert get_duplicate_logic(graph) == [
+        (rels["A", "B", "FS"], rels["A", "B", "SS"])
+    ]
+
+
+def test_open_ends():
+    tasks = [
+        ("START", "TT_Mile"),
+        ("A", "TT_Task"),
+        ("B", "TT_Task"),
+        ("C", "TT_Task"),
+        ("D", "TT_Task"),
+        ("FINISH", "TT_FinMile"),
+    ]
+    logic = [
+        ("START", "A", "FS"),
+        ("START", "C", "FS"),
+        ("START", "D", "FF"),
+        ("A", "B", "SS"),
+        ("B", "FINISH", "FS"),
+        ("D", "FINISH", "FS"),
+    ]
+    schedule = Schedule(
+        "1",
+        PROJECT=[
+            {
+                "proj_id": "1",
+                "proj_short_name": "TEST",
+                "last_recalc_date": datetime(2024, 1, 8),
+            }
+        ],
+        TASK=[_task_row(code, task_type) for code, task_type in tasks],
+        TASKPRED=[_logic_row(*rel) for rel in logic],
+    )
+
+    open_ends = {
+        key: [task.activity_id for task in found]
+        for key, found in get_open_ends(schedule).items()
+    }
+
+    assert open_ends == {
+        # C and FINISH have no successor; START has no predecessor
+        "open_successor": ["C", "FINISH"],
+        "open_predecessor": ["START"],
+        # A only drives the start of B; D is only driven at its finish
+        "open_finish": ["A"],
+        "open_start": ["D"],
+    }
@@ -0,0 +1,167 @@
+from datetime import datetime
+
+from xer_pro.data.rollup import RollupTotals
+from xer_pro.data.schedule import Schedule
+from xer_pro.data.task import Task
+from xer_pro.data.wbs import WbsLinkedList, WbsNode, WbsTree
+
+
+def _nodes(*rows: tuple) -> dict[str, WbsNode]:
+    """WbsNodes linked to their parents from (id, parent id, short name, name)"""
+    nodes = {
+        wbs_id: WbsNode(
+            {
+                "wbs_id": wbs_id,
+                "parent_wbs_id": parent_id,
+                "proj_node_flag": parent_id is None,
+                "wbs_short_name": short_name,
+                "wbs_name": name,
+            }
+        )
+        for wbs_id, parent_id, short_name, name in rows
+    }
+    for node in nodes.values():
+        node.parent = nodes.get(node["parent_wbs_id"])
+    return nodes
+
+
+def _task(code: str, status: str, start: int, finish: int, float_days: int) -> Task:
+    return Task(
+        {
+            "task_code": code,
+            "status_code": status,
+            "early_start_date": datetime(2024, 1, start),
+            "early_end_date": datetime(2024, 1, finish),
+            "act_start_date": datetime(2024, 1, start),
+            "act_end_date": datetime(2024, 1, finish),
+            "total_float_hr_cnt": float_days * 8.0,
+        }
+    )
+
+
+NODES = (
+    ("P", None, "PRJ", "Project"),
+    ("D", "P", "DES", "Design"),
+    ("DC", "D", "CIV", "Civil"),
+    ("DA", "D", "ARC", "Architectural"),
+    ("C", "P", "CON", "Construction"),
+)
+
+
+def test_summaries_roll_up_and_recalculate_after_invalidate():
+    nodes = _nodes(*NODES)
+    tasks = {
+        "DC": [_task("A1", "TK_Complete", 2, 5, 0)],
+        "DA": [
+            _task("A2", "TK_Active", 3, 12, 4),
+            _task("A3", "TK_NotStart", 8, 9, 10),
+        ],
+        "C": [_task("A4", "TK_NotStart", 15, 26, -2)],
+    }
+    costs = {
+        "DC": RollupTotals(budget_cost=100.0, remaining_cost=0.0),
+        "D": RollupTotals(budget_cost=50.0, remaining_cost=50.0),
+        "C": RollupTotals(budget_cost=400.0, remaining_cost=400.0),
+    }
+    tree = WbsTree(nodes.values(), lambda wbs_id: tasks.get(wbs_id, ()), costs)
+
+    assert tree.roots == [nodes["P"]]
+    assert tree.children["D"] == [nodes["DC"], nodes["DA"]]
+
+    design = tree.summary("D")
+    assert design.status_counts == {"TK_Complete": 1, "TK_Active": 1, "TK_NotStart": 1}
+    assert design.activities == 3
+    assert design.start == datetime(2024, 1, 2)
+    assert design.finish == datetime(2024, 1, 12)
+    # the completed task has no total float
+    assert design.min_total_float == 4
+    assert (design.budget_cost, design.remaining_cost) == (150.0, 50.0)
+
+    project = tree.summary("P")
+    assert project.activities == 4
+    assert project.start == datetime(2024, 1, 2)
+    assert project.finish == datetime(2024, 1, 26)
+    assert project.min_total_float == -2
+    assert (project.budget_cost, project.remaining_cost) == (550.0, 450.0)
+
+    # summaries are kept until the changed node is invalidated
+    tasks["DA"].append(_task("A5", "TK_NotStart", 20, 30, -5))
+    construction = tree.summary("C")
+    assert tree.summary("P").activities == 4
+
+    tree.invalidate("DA")
+    assert tree.summary("DA").activities == 3
+    assert tree.summary("D").finish == datetime(2024, 1, 30)
+    assert tree.summary("P").activities == 5
+    assert tree.summary("P").min_total_float == -5
+    # only the node and its ancestors are recalculated
+    assert tree.summary("C") is construction
+    assert tree.summary("DC").activities == 1
+
+    costs["C"] = RollupTotals(budget_cost=400.0, remaining_cost=100.0)
+    tree.invalidate()
+    assert tree.summary("C") is not construction
+    assert tree.summary("P").remaining_cost == 150.0
+
+
+def test_name_paths_leave_out_the_project_node():
+    nodes = _nodes(*NODES)
+
+    assert nodes["P"].short_name_path == nodes["P"].long_name_path == ""
+    assert nodes["D"].short_name_path == "DES"
+    assert nodes["DC"].short_name_path == "DES.CIV"
+    assert nodes["DC"].long_name_path == "Design.Civil"
+    assert nodes["DA"].long_name_path == "Design.Architectural"
+    # the same paths as joining the linked list of each node
+    for node in nodes.values():
+        path = WbsLinkedList(node)
+        assert node.short_name_path == path.short_name_path()
+        assert node.long_name_path == path.long_name_path()
+
+
+def _schedule(wbs_rows: list[tuple]) -> Schedule:
+    return Schedule(
+        "1",
+        PROJECT=[
+            {
+                "proj_id": "1",
+                "proj_short_name": "TEST",
+                "last_recalc_date": datetime(2024, 1, 8),
+            }
+        ],
+        PROJWBS=[
+            {
+                "wbs_id": wbs_id,
+                "proj_id": "1",
+                "parent_wbs_id": parent_id,
+                "proj_node_flag": parent_id is None,
+                "wbs_short_name": short_name,
+                "wbs_name": name,
+            }
+            for wbs_id, parent_id, short_name, name in wbs_rows
+        ],
+    )
+
+
+def test_nodes_of_two_schedules_are_equal_by_short_name_path():
+    current = _schedule(NODES)
+    # a later export: new ids, CIV moved under CON and ARC renamed
+    previous = _schedule(
+        [
+            ("10", None, "PRJ", "Project"),
+            ("11", "10", "DES", "Design"),
+            ("12", "14", "CIV", "Civil"),
+            ("13", "11", "ARC", "Architecture"),
+            ("14", "10", "CON", "Construction"),
+        ]
+    )
+    current_paths = {node.short_name_path: node for node in current.wbs}
+    previous_paths = {node.short_name_path: node for node in previous.wbs}
+
+    assert set(previous_paths) == {"", "DES", "CON.CIV", "DES.ARC", "CON"}
+    assert current_paths["DES"] == previous_paths["DES"]
+    assert hash(current_paths["DES"]) == hash(previous_paths["DES"])
+    # a renamed node keeps its short name path
+    assert current_paths["DES.ARC"] == previous_paths["DES.ARC"]
+    assert current_paths["DES.CIV"] not in set(previous.wbs)
+    assert set(current.wbs) - set(previous.wbs) == {current_paths["DES.CIV"]}
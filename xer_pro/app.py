@@ -1,10 +1,12 @@
 import sched
-from flask import Flask, redirect, request, render_template, url_for
+from flask import Flask, jsonify, redirect, request, render_template, url_for
 from flask_dropzone import Dropzone
 from datetime import datetime
 import os
 
-from xer_pro.data.schedule import Schedule
+from xer_pro.data.cache import DEFAULT_MAX_BYTES, ScheduleCache, default_cache_dir
+from xer_pro.data.report import ParseReport
+from xer_pro.data.schedule import SCHEDULE_COLUMNS, SCHEDULE_TABLES, build_schedules
 from xer_pro.data.task import Task
 
 from xer_pro.data.parse import parse_xer_file, find_xer_errors
@@ -19,8 +21,6 @@ from xer_pro.services.schedule_services import (
 from xer_pro.services.comparison_services import get_schedule_changes
 from xer_pro.services.warning_services import get_schedule_warnings
 
-CODEC = "cp1252"  # Encoding standard for xer file
-
 app = Flask(__name__)
 
 app.config["SECRET_KEY"] = os.environ["CPM_PRO_KEY"]
@@ -30,9 +30,18 @@ app.config.update(
     DROPZONE_MAX_FILE_SIZE=15,
     DROPZONE_TIMEOUT=5 * 60 * 1000,
     DROPZONE_MAX_FILES=2,
+    XER_CACHE_DIR=os.environ.get("XER_CACHE_DIR", default_cache_dir()),
+    XER_CACHE_MAX_BYTES=int(os.environ.get("XER_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+    XER_PARSE_REPORT=os.environ.get("XER_PARSE_REPORT", "") == "1",
+    XER_KEEP_ALL_COLUMNS=os.environ.get("XER_KEEP_ALL_COLUMNS", "") == "1",
 )
 
 dropzone = Dropzone(app)
+schedule_cache = ScheduleCache(
+    app.config["XER_CACHE_DIR"],
+    app.config["SECRET_KEY"].encode(),
+    app.config["XER_CACHE_MAX_BYTES"],
+)
 
 files = []
 new_files = []
@@ -45,6 +54,7 @@ status_data = dict()
 changes = dict()
 warnings = dict()
 longest_path = dict()
+parse_reports = []
 
 
 @app.context_processor
@@ -139,27 +149,74 @@ def sort_by_finish(tasks: list[Task]):
 @app.route("/", methods=["GET", "POST"])
 def index():
     global files
+    global parse_reports
 
     if request.method == "GET":
         files = []
+        parse_reports = []
     if request.method == "POST":
-        if len(files) > 2:
+        upload = request.files.get("file").stream
+        keep_all = app.config["XER_KEEP_ALL_COLUMNS"]
+        cache_key = schedule_cache.key(upload) + ("-all" if keep_all else "")
+        upload_reports = []
+        if (xer_schedules := schedule_cache.get(cache_key)) is None:
+            report = ParseReport() if app.config["XER_PARSE_REPORT"] else None
+            file = parse_xer_file(
+                upload,
+                report=report,
+                columns=None if keep_all else SCHEDULE_COLUMNS,
+            )
+            if not (errors := find_xer_errors(file)) is None:
+                error_str = "\r\n".join(errors)
+                return error_str, 400
+
+            xer_schedules = build_schedules(file.select(SCHEDULE_TABLES), report)
+            if not xer_schedules:
+                return "XER does not contain an exported schedule!", 400
+            schedule_cache.put(cache_key, xer_schedules)
+
+            if report is not None:
+                name = ", ".join(schedule.name for schedule in xer_schedules)
+                app.logger.info("Parse report for %s\n%s", name, report)
+                upload_reports.append({"schedule": name, **report.as_dict()})
+
+        app.logger.info("Schedule cache %s", schedule_cache.stats())
+
+        # a multi project export adds each of its schedules to the comparison,
+        # unless one of them is picked by its short name in the upload form
+        names = ", ".join(schedule.short_name for schedule in xer_schedules)
+        if project := request.form.get("project", "").strip():
+            xer_schedules = [s for s in xer_schedules if s.short_name == project]
+            if not xer_schedules:
+                return (
+                    f"XER does not contain a project with short name {project}! "
+                    f"Projects in the XER: {names}",
+                    400,
+                )
+
+        # a full pair starts a new comparison; uploads never add past two, and
+        # a rejected upload keeps the schedules already uploaded
+        new_comparison = len(files) >= 2
+        if (0 if new_comparison else len(files)) + len(xer_schedules) > 2:
+            return (
+                "XER contains too many schedules to compare! Enter the short "
+                f"name of one project to upload: {names}",
+                400,
+            )
+
+        if new_comparison:
             files = []
-        file = parse_xer_file(request.files.get("file").read().decode(CODEC))
-        if not (errors := find_xer_errors(file)) is None:
-            error_str = "\r\n".join(errors)
-            return error_str, 400
+            parse_reports = []
+        files.extend(xer_schedules)
+        parse_reports.extend(upload_reports)
 
-        export_xer_projects = tuple(
-            p for p in file.get("PROJECT", []) if p["export_flag"]
-        )
-        if len(export_xer_projects) != 1:
-            return "XER contains multiple schedules!", 400
+    return render_template("index.html")
 
-        proj_id = export_xer_projects[0]["proj_id"]
-        files.append(Schedule(proj_id, **file))
 
-    return render_template("index.html")
+@app.route("/parse_report")
+def parse_report():
+    global parse_reports
+    return jsonify(parse_reports)
 
 
 @app.route("/dashboard")
@@ -188,11 +245,9 @@ def dashboard():
                 schedules[version], schedules[version].start, schedules[version].finish
             )
 
-        float_data = parse_float_chart_data(
-            schedules["current"].tasks(), schedules["previous"].tasks()
-        )
+        float_data = parse_float_chart_data(schedules["current"], schedules["previous"])
         status_data = parse_status_chart_data(
-            schedules["current"].tasks(), schedules["previous"].tasks()
+            schedules["current"], schedules["previous"]
         )
 
         changes = get_schedule_changes(schedules["current"], schedules["previous"])
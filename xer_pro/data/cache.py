@@ -0,0 +1,224 @@
+"""
+cache.py
+
+Content addressed on-disk cache of schedules built from .xer files.
+"""
+
+import gc
+import hashlib
+import hmac
+import os
+import pickle
+import stat
+import tempfile
+import zlib
+from typing import Any, BinaryIO, Optional
+
+# Bump when the cached classes change so old entries are not loaded; an
+# entry that still fails to load is removed and counted as a miss
+CACHE_VERSION = b"12"
+
+CACHE_SUFFIX = ".xerc"
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Entries start with an HMAC of their key and contents
+SIGNATURE = hashlib.sha256
+SIGNATURE_SIZE = SIGNATURE().digest_size
+
+
+def default_cache_dir() -> str:
+    """Per user cache directory, under $XDG_CACHE_HOME or ~/.cache"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "xer_pro")
+
+
+class ScheduleCache:
+    """
+    A class to represent a size bounded on-disk cache of built schedules.
+
+    Entries are keyed by a hash of the uploaded .xer bytes and stored as
+    compressed pickles. When the cache grows over max_bytes the least
+    recently used entries are removed.
+
+    Each entry is signed with an HMAC of the secret, and an entry is only
+    unpickled if its signature matches. The directory is created private to
+    the current user; a directory owned by another user, or writable by group
+    or other, is refused with a PermissionError.
+
+    ...
+
+    Attributes
+    ----------
+    directory: str
+        Directory the entries are stored in
+    max_bytes: int
+        Maximum total size of the entries
+    hits: int
+        Number of lookups that found an entry
+    misses: int
+        Number of lookups that did not find an entry
+    """
+
+    def __init__(
+        self, directory: str, secret: bytes, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        if not secret:
+            raise ValueError("ScheduleCache requires a secret to sign entries")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._secret = secret
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._check_directory()
+
+    @staticmethod
+    def key(stream: BinaryIO) -> str:
+        """Hash the contents of a binary stream and rewind it
+
+        Args:
+            stream (BinaryIO): seekable stream of .xer bytes
+
+        Returns:
+            str: cache key
+        """
+        start = stream.tell()
+        digest = hashlib.sha256(CACHE_VERSION)
+        while chunk := stream.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        stream.seek(start)
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Load a cached entry
+
+        Args:
+            key (str): cache key
+
+        Returns:
+            Any: cached value, or None if there is no entry for the key
+        """
+        path = self._path(key)
+        # the garbage collector would rescan every new object while unpickling
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(path, "rb") as f:
+                signature = f.read(SIGNATURE_SIZE)
+                data = f.read()
+            if not hmac.compare_digest(signature, self._sign(key, data)):
+                raise pickle.UnpicklingError(f"Invalid signature for {key}")
+            # only signed entries get here; any error loading one means it
+            # was written by an older layout of the cached classes
+            value = pickle.loads(zlib.decompress(data))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            self._remove(path)
+            self.misses += 1
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        # mark the entry as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store an entry and evict least recently used entries if needed
+
+        Args:
+            key (str): cache key
+            value (Any): picklable value
+        """
+        data = zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL), 1)
+        if len(data) > self.max_bytes:
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._sign(key, data))
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            # _entries skips .tmp files, so a partial write is never evicted
+            os.unlink(tmp_path)
+            raise
+
+        self._evict()
+
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts with the number and size of the entries"""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, _, size in entries),
+        }
+
+    def _check_directory(self) -> None:
+        """Refuse a directory other users own or can write to"""
+        info = os.lstat(self.directory)
+        if not stat.S_ISDIR(info.st_mode):
+            raise PermissionError(f"Cache path {self.directory} is not a directory")
+        if hasattr(os, "getuid") and info.st_uid != os.getuid():
+            raise PermissionError(
+                f"Cache directory {self.directory} is owned by another user"
+            )
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(
+                f"Cache directory {self.directory} is writable by other users"
+            )
+
+    def _entries(self) -> list[tuple[float, str, int]]:
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((info.st_mtime, path, info.st_size))
+
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _sign(self, key: str, data: bytes) -> bytes:
+        signature = hmac.new(self._secret, key.encode(), SIGNATURE)
+        signature.update(data)
+        return signature.digest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
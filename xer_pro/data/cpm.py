@@ -0,0 +1,803 @@
+"""
+cpm.py
+
+Critical Path Method calculation of the early and late dates and floats
+of a Schedule from its tasks, relationships and calendars.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from heapq import heapify, heappop, heappush
+from typing import Any, Iterable, Optional
+
+from xer_pro.data.logic_graph import LINK_CODES
+from xer_pro.data.sched_calendar import (
+    MAX_SEARCH_DAYS,
+    MINUTES_PER_DAY,
+    CompiledCalendar,
+    SchedCalendar,
+    _datetime_at,
+    _minute_of_day,
+    add_work_hours,
+    compile_calendar,
+)
+from xer_pro.data.schedule import Schedule
+from xer_pro.data.task import Task
+
+FS, SS, FF, SF = (LINK_CODES[link] for link in ("FS", "SS", "FF", "SF"))
+
+# Constraint types that limit each date of a task
+START_AFTER = frozenset({"CS_MSO", "CS_MSOA", "CS_MANDSTART"})
+FINISH_AFTER = frozenset({"CS_MEO", "CS_MEOA", "CS_MANDFIN"})
+START_BEFORE = frozenset({"CS_MSO", "CS_MSOB", "CS_MANDSTART"})
+FINISH_BEFORE = frozenset({"CS_MEO", "CS_MEOB", "CS_MANDFIN"})
+
+
+class WorkTime:
+    """
+    A class to represent the work time of a calendar for date arithmetic.
+
+    The calendar is compiled once over a window of dates, and work hours
+    are added and counted with its cumulative work minutes, so they take
+    the same time however many days they span. A date outside the window
+    grows it through add_work_hours. A task without a calendar works
+    around the clock.
+
+    ...
+
+    Attributes
+    ----------
+    calendar: SchedCalendar
+        Calendar the work periods are read from, or None
+    """
+
+    def __init__(
+        self,
+        calendar: Optional[SchedCalendar] = None,
+        first: Optional[datetime] = None,
+        last: Optional[datetime] = None,
+    ) -> None:
+        self.calendar = calendar
+        self._compiled = None
+        if calendar is not None and first is not None:
+            self._compiled = compile_calendar(calendar, first, last or first)
+
+    def periods(self, ordinal: int) -> tuple[tuple[float, float], ...]:
+        """Work periods of a date as (start, end) minutes after midnight"""
+        if self.calendar is None:
+            return ((0, MINUTES_PER_DAY),)
+
+        compiled = self._compiled
+        if compiled is None or not compiled.covers(ordinal, ordinal):
+            day = datetime.fromordinal(ordinal)
+            compiled = self._compiled = compile_calendar(self.calendar, day, day)
+
+        return compiled.periods[ordinal - compiled.first]
+
+    def next_start(self, date: datetime) -> datetime:
+        """Earliest moment of work at or after a date"""
+        day, minute = _split(date)
+        for day in range(day, day + MAX_SEARCH_DAYS):
+            for start, end in self.periods(day):
+                if minute <= start:
+                    return _datetime_at(day, start)
+                if minute < end:
+                    return date
+            minute = 0
+
+        raise ValueError(f"No work time in calendar {self.calendar} after {date}")
+
+    def prev_finish(self, date: datetime) -> datetime:
+        """Latest moment of work at or before a date"""
+        day, minute = _split(date)
+        for day in range(day, day - MAX_SEARCH_DAYS, -1):
+            for start, end in reversed(self.periods(day)):
+                if minute >= end:
+                    return _datetime_at(day, end)
+                if minute > start:
+                    return date
+            minute = MINUTES_PER_DAY
+
+        raise ValueError(f"No work time in calendar {self.calendar} before {date}")
+
+    def add(self, date: datetime, hours: float) -> datetime:
+        """Date that a number of work hours after a date finishes"""
+        if hours == 0:
+            return date
+        if self.calendar is None:
+            return date + timedelta(hours=hours)
+
+        if self._compiled is not None:
+            if (result := self._compiled.add_minutes(date, hours * 60)) is not None:
+                return result
+
+        result = add_work_hours(self.calendar, date, hours)
+        self._compiled = self.calendar._compiled
+        return result
+
+    def subtract(self, date: datetime, hours: float) -> datetime:
+        """Date that a number of work hours ending at a date starts"""
+        return self.add(date, -hours)
+
+    def forward(self, date: datetime, hours: float) -> tuple[datetime, datetime]:
+        """Start and finish of a number of work hours that start as early as
+        a date allows; next_start and add with one lookup of the date"""
+        if (compiled := self._window_of(date)) is not None:
+            total = compiled.work_minutes_at(date)
+            start = compiled.date_at(total, finish=False)
+            finish = compiled.date_at(total + hours * 60, hours > 0) if hours else start
+            if start is not None and finish is not None:
+                return start, finish
+
+        start = self.next_start(date)
+        return start, self.add(start, hours)
+
+    def backward(self, date: datetime, hours: float) -> tuple[datetime, datetime]:
+        """Start and finish of a number of work hours that finish as late as
+        a date allows; prev_finish and subtract with one lookup of the date"""
+        if (compiled := self._window_of(date)) is not None:
+            total = compiled.work_minutes_at(date)
+            finish = compiled.date_at(total)
+            start = compiled.date_at(total - hours * 60, hours < 0) if hours else finish
+            if start is not None and finish is not None:
+                return start, finish
+
+        finish = self.prev_finish(date)
+        return self.subtract(finish, hours), finish
+
+    def _window_of(self, date: datetime) -> Optional[CompiledCalendar]:
+        """Compiled calendar if its window holds a date, else None"""
+        compiled, day = self._compiled, date.toordinal()
+        if compiled is None or not compiled.covers(day, day):
+            return None
+
+        return compiled
+
+    def hours_between(self, start: datetime, end: datetime) -> float:
+        """Work hours from start to end; negative if end is before start"""
+        if self.calendar is None:
+            return round((end - start) / timedelta(hours=1), 3)
+
+        compiled = self._compiled
+        first, last = sorted((start.toordinal(), end.toordinal()))
+        if compiled is None or not compiled.covers(first, last):
+            compiled = self._compiled = compile_calendar(self.calendar, start, end)
+
+        minutes = compiled.work_minutes_at(end) - compiled.work_minutes_at(start)
+        return round(minutes / 60, 3)
+
+
+@dataclass(frozen=True)
+class CpmDates:
+    """
+    A class to represent the dates and floats of a task calculated by CPM.
+
+    Dates and floats of a completed task are its actual dates and None.
+
+    ...
+
+    Attributes
+    ----------
+    early_start: datetime
+        Early start, or the actual start of a started task
+    remaining_start: datetime
+        Date the remaining work can start
+    early_finish: datetime
+        Early finish, or the actual finish of a completed task
+    late_start: datetime
+        Late start of the remaining work
+    late_finish: datetime
+        Late finish
+    total_float: float
+        Work hours from early finish to late finish
+    free_float: float
+        Work hours the task can slip without delaying a successor
+    """
+
+    early_start: datetime
+    remaining_start: Optional[datetime]
+    early_finish: datetime
+    late_start: Optional[datetime]
+    late_finish: Optional[datetime]
+    total_float: Optional[float]
+    free_float: Optional[float]
+
+    @property
+    def is_critical(self) -> bool:
+        return self.total_float is not None and self.total_float <= 0
+
+
+@dataclass(frozen=True)
+class CpmDifference:
+    """
+    A class to represent a value calculated by CPM that differs from the
+    value P6 stored in the .xer file.
+
+    ...
+
+    Attributes
+    ----------
+    task: Task
+        Task the value belongs to
+    field: str
+        Name of the CpmDates attribute
+    calculated: Any
+        Value calculated by CPM
+    stored: Any
+        Value stored by P6
+    """
+
+    task: Task
+    field: str
+    calculated: Any
+    stored: Any
+
+
+@dataclass(frozen=True)
+class CpmUpdate:
+    """
+    A class to represent the effect of an edit recalculated by CpmEngine.
+
+    ...
+
+    Attributes
+    ----------
+    tasks: tuple[Task]
+        Tasks whose early or late dates changed, in task number order
+    finish_before: datetime
+        Latest early finish before the edit
+    finish_after: datetime
+        Latest early finish after the edit
+    """
+
+    tasks: tuple[Task]
+    finish_before: datetime
+    finish_after: datetime
+
+    @property
+    def finish_delta(self) -> timedelta:
+        """Calendar time the edit moved the latest early finish by"""
+        return self.finish_after - self.finish_before
+
+
+class CpmEngine:
+    """
+    A class to represent a Critical Path Method calculation of a schedule.
+
+    Tasks are numbered as in the schedule's logic graph. The forward pass
+    visits them in topological order and the backward pass in reverse, so
+    a full calculation is O(V + E) steps of calendar arithmetic.
+
+    Open tasks start no earlier than the data date and started tasks keep
+    their actual dates. Relationship lags are counted on the predecessor's
+    calendar and floats on the task's own calendar, in hours. Start and
+    finish constraints limit the early and late dates; mandatory
+    constraints are treated as their on-or-after/on-or-before pair.
+
+    After calculate, the edit methods change one duration, relationship
+    or constraint and recalculate only the tasks downstream of it in the
+    forward pass and upstream of it in the backward pass. The backward
+    pass is only repeated in full when the edit moves the project finish.
+
+    ...
+
+    Attributes
+    ----------
+    schedule: Schedule
+        Schedule the tasks and relationships are read from
+    tasks: tuple[Task]
+        Tasks in the order of their numbers
+    data_date: datetime
+        Earliest start of any remaining work
+    order: list[int]
+        Task numbers in topological order
+    project_finish: datetime
+        Latest early finish, or the must finish date of the project
+    """
+
+    def __init__(self, schedule: Schedule) -> None:
+        graph = schedule.logic_graph
+        self.schedule = schedule
+        self.tasks = graph.tasks
+        self.data_date = schedule.data_date
+        self.project_finish = None
+
+        # (task, link, lag) of the edges leaving and entering each task,
+        # sliced from the CSR rows of the graph
+        count = len(self.tasks)
+        links, lags = graph.links, graph.lags
+        leaving = list(zip(graph.succ_targets, links, lags))
+        entering = [
+            (pred, links[e], lags[e])
+            for pred, e in zip(graph.pred_sources, graph.pred_edges)
+        ]
+        offsets, pred_offsets = graph.succ_offsets, graph.pred_offsets
+        self.succs: list[list[tuple[int, int, float]]] = [
+            leaving[offsets[n] : offsets[n + 1]] for n in range(count)
+        ]
+        self.preds: list[list[tuple[int, int, float]]] = [
+            entering[pred_offsets[n] : pred_offsets[n + 1]] for n in range(count)
+        ]
+
+        # status, type and actual dates read by the passes, by task number
+        self.is_open = [task.is_open for task in self.tasks]
+        self.is_not_started = [task.is_not_started for task in self.tasks]
+        # only the rows of milestones are read for their type, and the
+        # actual dates are the start and finish a Task keeps of its row
+        self.is_finish_milestone = [
+            task.is_milestone and task["task_type"] == "TT_FinMile"
+            for task in self.tasks
+        ]
+        self.actual_start = [
+            None if not_started else task.start
+            for task, not_started in zip(self.tasks, self.is_not_started)
+        ]
+        self.actual_finish = [
+            None if is_open else task.finish
+            for task, is_open in zip(self.tasks, self.is_open)
+        ]
+        self.duration = [
+            (task["remain_drtn_hr_cnt"] or 0.0) if is_open else 0.0
+            for task, is_open in zip(self.tasks, self.is_open)
+        ]
+
+        # each calendar is compiled once over the dates of the schedule
+        first, last = self._window()
+        work_times = {}
+        self.work = [
+            work_times.get(id(task.calendar))
+            or work_times.setdefault(
+                id(task.calendar), WorkTime(task.calendar, first, last)
+            )
+            for task in self.tasks
+        ]
+        constraints = [_task_constraints(task) for task in self.tasks]
+        self.start_after = [c and _constraint(c, START_AFTER) for c in constraints]
+        self.finish_after = [c and _constraint(c, FINISH_AFTER) for c in constraints]
+        self.start_before = [c and _constraint(c, START_BEFORE) for c in constraints]
+        self.finish_before = [c and _constraint(c, FINISH_BEFORE) for c in constraints]
+
+        self.early_start: list[Optional[datetime]] = [None] * count
+        self.remaining_start: list[Optional[datetime]] = [None] * count
+        self.early_finish: list[Optional[datetime]] = [None] * count
+        self.late_start: list[Optional[datetime]] = [None] * count
+        self.late_finish: list[Optional[datetime]] = [None] * count
+        self.order = self._topological_order()
+        self._position = _positions(self.order)
+
+    def calculate(self) -> "CpmEngine":
+        """Run the forward and backward pass over every task
+
+        Returns:
+            CpmEngine: the engine, to chain calls
+        """
+        for n in self.order:
+            self._forward(n)
+        self.project_finish = self._project_finish()
+        for n in reversed(self.order):
+            self._backward(n)
+
+        return self
+
+    def dates(self, task: Task) -> CpmDates:
+        """Calculated dates and floats of a task"""
+        n = self.schedule.logic_graph.number(task)
+        return CpmDates(
+            early_start=self.early_start[n],
+            remaining_start=self.remaining_start[n],
+            early_finish=self.early_finish[n],
+            late_start=self.late_start[n],
+            late_finish=self.late_finish[n],
+            total_float=self.total_float(n),
+            free_float=self.free_float(n),
+        )
+
+    @property
+    def finish(self) -> Optional[datetime]:
+        """Latest calculated early finish"""
+        return max(filter(None, self.early_finish), default=None)
+
+    def total_float(self, n: int) -> Optional[float]:
+        """Work hours from early finish to late finish of task number n"""
+        if not self.is_open[n]:
+            return None
+
+        return self.work[n].hours_between(self.early_finish[n], self.late_finish[n])
+
+    def free_float(self, n: int) -> Optional[float]:
+        """Work hours task number n can slip without delaying a successor"""
+        if not self.is_open[n]:
+            return None
+
+        work = self.work[n]
+        limits = [self._successor_limit(n, *succ) for succ in self.succs[n]]
+        floats = [
+            work.hours_between(self._pred_date(n, link), limit)
+            for (_, link, _), limit in zip(self.succs[n], limits)
+            if limit is not None
+        ]
+        if not floats:
+            return work.hours_between(self.early_finish[n], self.project_finish)
+
+        return min(floats)
+
+    def validate(self, tolerance: float = 0.01) -> list[CpmDifference]:
+        """Compare the calculated dates and floats of the open tasks with the
+        values stored by P6
+
+        Args:
+            tolerance (float, optional): largest difference in float hours
+                that is not reported. Defaults to 0.01.
+
+        Returns:
+            list[CpmDifference]: differing values in task order
+        """
+        differences = []
+        for n, task in enumerate(self.tasks):
+            if not task.is_open:
+                continue
+
+            stored_start = task["restart_date"] or task["early_start_date"]
+            checks = (
+                ("remaining_start", self.remaining_start[n], stored_start),
+                ("early_finish", self.early_finish[n], task["early_end_date"]),
+                ("late_start", self.late_start[n], task["late_start_date"]),
+                ("late_finish", self.late_finish[n], task["late_end_date"]),
+            )
+            for field, calculated, stored in checks:
+                if calculated != stored:
+                    differences.append(CpmDifference(task, field, calculated, stored))
+
+            checks = (
+                ("total_float", self.total_float(n), task["total_float_hr_cnt"]),
+                ("free_float", self.free_float(n), task["free_float_hr_cnt"]),
+            )
+            for field, calculated, stored in checks:
+                if stored is None or abs(calculated - stored) > tolerance:
+                    differences.append(CpmDifference(task, field, calculated, stored))
+
+        return differences
+
+    def set_duration(self, task: Task, hours: float) -> CpmUpdate:
+        """Change the remaining duration of a task and recalculate
+
+        Args:
+            task (Task): task to change
+            hours (float): remaining duration in work hours
+
+        Returns:
+            CpmUpdate: tasks whose dates changed and the finish before and after
+        """
+        n = self._number(task)
+        self.duration[n] = hours
+        return self._propagate((n,), (n,))
+
+    def add_relationship(
+        self, pred: Task, succ: Task, link: str = "FS", lag: float = 0.0
+    ) -> CpmUpdate:
+        """Add a relationship between two tasks and recalculate
+
+        Args:
+            pred (Task): predecessor
+            succ (Task): successor
+            link (str, optional): FS, SS, FF or SF. Defaults to "FS".
+            lag (float, optional): lag in work hours. Defaults to 0.0.
+
+        Raises:
+            ValueError: the relationship would close a logic loop
+
+        Returns:
+            CpmUpdate: tasks whose dates changed and the finish before and after
+        """
+        p, s, code = self._number(pred), self._number(succ), LINK_CODES[link]
+        self.succs[p].append((s, code, lag))
+        self.preds[s].append((p, code, lag))
+
+        if self._position[p] > self._position[s]:
+            try:
+                self.order = self._topological_order()
+            except ValueError:
+                self.succs[p].pop()
+                self.preds[s].pop()
+                raise
+            self._position = _positions(self.order)
+
+        return self._propagate((s,), (p,))
+
+    def remove_relationship(
+        self, pred: Task, succ: Task, link: str = "FS"
+    ) -> CpmUpdate:
+        """Remove the relationships of a link type between two tasks and
+        recalculate
+
+        Args:
+            pred (Task): predecessor
+            succ (Task): successor
+            link (str, optional): FS, SS, FF or SF. Defaults to "FS".
+
+        Returns:
+            CpmUpdate: tasks whose dates changed and the finish before and after
+        """
+        p, s, code = self._number(pred), self._number(succ), LINK_CODES[link]
+        self.succs[p] = [e for e in self.succs[p] if e[:2] != (s, code)]
+        self.preds[s] = [e for e in self.preds[s] if e[:2] != (p, code)]
+        return self._propagate((s,), (p,))
+
+    def set_constraint(
+        self, task: Task, cstr_type: Optional[str], date: Optional[datetime]
+    ) -> CpmUpdate:
+        """Replace the constraints of a task and recalculate
+
+        Args:
+            task (Task): task to change
+            cstr_type (str): P6 constraint type such as CS_MSOA, or None to
+                remove the constraints
+            date (datetime): constraint date
+
+        Returns:
+            CpmUpdate: tasks whose dates changed and the finish before and after
+        """
+        n = self._number(task)
+        self.start_after[n] = date if cstr_type in START_AFTER else None
+        self.finish_after[n] = date if cstr_type in FINISH_AFTER else None
+        self.start_before[n] = date if cstr_type in START_BEFORE else None
+        self.finish_before[n] = date if cstr_type in FINISH_BEFORE else None
+        return self._propagate((n,), (n,))
+
+    def _window(self) -> tuple[datetime, datetime]:
+        """Dates the calendars are first compiled over; dates the passes
+        reach past them grow the window"""
+        dates = (
+            self.schedule.project_start_date,
+            self.data_date,
+            self.schedule.finish,
+            self.schedule.must_finish_date,
+        )
+        dates = [date for date in dates if date is not None]
+        return min(dates), max(dates)
+
+    def _early_dates(self, n: int) -> tuple[datetime, datetime, datetime]:
+        return self.early_start[n], self.remaining_start[n], self.early_finish[n]
+
+    def _number(self, task: Task) -> int:
+        if self.project_finish is None:
+            raise ValueError("CpmEngine.calculate must run before an edit")
+
+        return self.schedule.logic_graph.number(task)
+
+    def _propagate(self, forward: Iterable[int], backward: Iterable[int]) -> CpmUpdate:
+        """Recalculate the tasks reachable from the changed tasks
+
+        Early dates are recalculated in topological order from the forward
+        seeds, following successors only while a task's dates change. Late
+        dates do the same upstream from the backward seeds.
+        """
+        finish_before = self.finish
+        changed = set()
+        position = self._position
+
+        heap = [(position[n], n) for n in set(forward)]
+        heapify(heap)
+        queued = {n for _, n in heap}
+        while heap:
+            _, n = heappop(heap)
+            old = self._early_dates(n)
+            self._forward(n)
+            if old == self._early_dates(n):
+                continue
+            changed.add(n)
+            for succ, _, _ in self.succs[n]:
+                if succ not in queued:
+                    queued.add(succ)
+                    heappush(heap, (position[succ], succ))
+
+        project_finish = self._project_finish()
+        if project_finish != self.project_finish:
+            # every late date hangs off the project finish
+            self.project_finish = project_finish
+            backward = range(len(self.tasks))
+
+        heap = [(-position[n], n) for n in set(backward)]
+        heapify(heap)
+        queued = {n for _, n in heap}
+        while heap:
+            _, n = heappop(heap)
+            old = (self.late_start[n], self.late_finish[n])
+            self._backward(n)
+            if old == (self.late_start[n], self.late_finish[n]):
+                continue
+            changed.add(n)
+            for pred, _, _ in self.preds[n]:
+                if pred not in queued:
+                    queued.add(pred)
+                    heappush(heap, (-position[pred], pred))
+
+        return CpmUpdate(
+            tasks=tuple(self.tasks[n] for n in sorted(changed)),
+            finish_before=finish_before,
+            finish_after=self.finish,
+        )
+
+    def _topological_order(self) -> list[int]:
+        """Task numbers with every predecessor before its successors"""
+        in_degree = [len(preds) for preds in self.preds]
+        order = [n for n, degree in enumerate(in_degree) if degree == 0]
+        for n in order:
+            for succ, _, _ in self.succs[n]:
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    order.append(succ)
+
+        if len(order) < len(self.tasks):
+            looped = [
+                self.tasks[n].activity_id for n, d in enumerate(in_degree) if d > 0
+            ]
+            raise ValueError(
+                f"Logic loop through {len(looped)} activities, e.g. {looped[:5]}"
+            )
+
+        return order
+
+    def _forward(self, n: int) -> None:
+        """Early dates of task number n from the early dates of its predecessors"""
+        if not self.is_open[n]:
+            self.early_start[n] = self.remaining_start[n] = self.actual_start[n]
+            self.early_finish[n] = self.actual_finish[n]
+            return
+
+        not_started, work = self.is_not_started[n], self.work
+        early_start, early_finish = self.early_start, self.early_finish
+        start, finish = self.data_date, None
+        for pred, link, lag in self.preds[n]:
+            if link == FS:
+                start = max(start, work[pred].add(early_finish[pred], lag))
+            elif link == SS and not_started:
+                start = max(start, work[pred].add(early_start[pred], lag))
+            elif link == FF:
+                date = work[pred].add(early_finish[pred], lag)
+                finish = max(finish or date, date)
+            elif link == SF:
+                date = work[pred].add(early_start[pred], lag)
+                finish = max(finish or date, date)
+
+        if not_started and self.start_after[n]:
+            start = max(start, self.start_after[n])
+        if self.finish_after[n]:
+            finish = max(finish or self.finish_after[n], self.finish_after[n])
+
+        work, duration = work[n], self.duration[n]
+        if duration == 0 and self.is_finish_milestone[n]:
+            start = end = max(work.prev_finish(start), self.data_date)
+        else:
+            start, end = work.forward(start, duration)
+        if finish and finish > end:
+            end = work.prev_finish(finish)
+            if not_started:
+                start = work.subtract(end, duration)
+
+        self.remaining_start[n] = start
+        early_start[n] = start if not_started else self.actual_start[n]
+        early_finish[n] = end
+
+    def _backward(self, n: int) -> None:
+        """Late dates of task number n from the late dates of its successors"""
+        if not self.is_open[n]:
+            return
+
+        is_open, not_started, work = self.is_open, self.is_not_started[n], self.work[n]
+        late_starts, late_finishes = self.late_start, self.late_finish
+        finish, start = self.project_finish, None
+        for succ, link, lag in self.succs[n]:
+            if not is_open[succ]:
+                continue
+            if link == FS:
+                finish = min(finish, work.subtract(late_starts[succ], lag))
+            elif link == FF:
+                finish = min(finish, work.subtract(late_finishes[succ], lag))
+            elif not_started:
+                limit = work.subtract(
+                    late_starts[succ] if link == SS else late_finishes[succ], lag
+                )
+                start = min(start or limit, limit)
+
+        if self.finish_before[n]:
+            finish = min(finish, self.finish_before[n])
+        if self.start_before[n] and not_started:
+            start = min(start or self.start_before[n], self.start_before[n])
+
+        duration = self.duration[n]
+        late_start, end = work.backward(finish, duration)
+        if start and start < late_start:
+            late_start, end = work.forward(start, duration)
+
+        self.late_start[n] = late_start
+        self.late_finish[n] = end
+
+    def _successor_limit(
+        self, n: int, succ: int, link: int, lag: float
+    ) -> Optional[datetime]:
+        """Latest date of task number n allowed by the early dates of a
+        successor, or None if the relationship does not drive it"""
+        if not self.is_open[succ]:
+            return None
+        if link in (SS, SF) and not self.is_not_started[n]:
+            return None
+        if link == SS and not self.is_not_started[succ]:
+            return None
+
+        if link == FS:
+            succ_date = self.remaining_start[succ]
+        elif link == SS:
+            succ_date = self.early_start[succ]
+        else:
+            succ_date = self.early_finish[succ]
+
+        return self.work[n].subtract(succ_date, lag)
+
+    def _pred_date(self, n: int, link: int) -> datetime:
+        """Date of task number n a relationship of a link type leaves from"""
+        if link in (SS, SF):
+            return self.early_start[n]
+
+        return self.early_finish[n]
+
+    def _project_finish(self) -> datetime:
+        """Date the backward pass starts from"""
+        if must_finish := self.schedule.must_finish_date:
+            return must_finish
+
+        return max(
+            (ef for ef, is_open in zip(self.early_finish, self.is_open) if is_open),
+            default=self.data_date,
+        )
+
+
+def calculate_dates(schedule: Schedule) -> CpmEngine:
+    """Calculate the early and late dates and floats of a schedule
+
+    Args:
+        schedule (Schedule): schedule with tasks, relationships and calendars
+
+    Raises:
+        ValueError: the logic has a loop, or a calendar has no work time
+
+    Returns:
+        CpmEngine: calculated engine; read dates with CpmEngine.dates
+    """
+    return CpmEngine(schedule).calculate()
+
+
+def _task_constraints(task: Task) -> Optional[tuple[tuple[str, datetime], ...]]:
+    """(type, date) of both constraints of a task, or None if neither is set"""
+    cstr_type, cstr_type2 = task["cstr_type"], task["cstr_type2"]
+    if not cstr_type and not cstr_type2:
+        return None
+
+    return (cstr_type, task["cstr_date"]), (cstr_type2, task["cstr_date2"])
+
+
+def _constraint(
+    constraints: tuple[tuple[Optional[str], Optional[datetime]], ...],
+    types: frozenset[str],
+) -> Optional[datetime]:
+    """Date of the first of a task's (type, date) constraints with one of
+    the types"""
+    for cstr_type, date in constraints:
+        if cstr_type in types:
+            return date
+
+    return None
+
+
+def _positions(order: list[int]) -> list[int]:
+    """Position of each task number in a topological order"""
+    position = [0] * len(order)
+    for i, n in enumerate(order):
+        position[n] = i
+
+    return position
+
+
+def _split(date: datetime) -> tuple[int, float]:
+    """Date ordinal and minutes after midnight of a datetime"""
+    return date.toordinal(), _minute_of_day(date)
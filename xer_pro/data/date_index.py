@@ -0,0 +1,203 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from functools import cached_property
+from typing import Iterable, Optional
+
+from xer_pro.data.task import Task
+
+
+class TaskDateIndex:
+    """
+    A class to represent tasks sorted by start and by finish for date
+    window queries.
+
+    Tasks that tie on a date keep their original order, so a window is
+    the same list a stable sort of a filtered scan would give. Tasks
+    without the date are left out of that ordering.
+
+    ...
+
+    Attributes
+    ----------
+    by_start: tuple[Task]
+        Tasks sorted by start
+    by_finish: tuple[Task]
+        Tasks sorted by finish
+    """
+
+    def __init__(self, tasks: Iterable[Task]) -> None:
+        tasks = tuple(tasks)
+        self.by_start = tuple(
+            sorted((t for t in tasks if t.start is not None), key=lambda t: t.start)
+        )
+        self.by_finish = tuple(
+            sorted((t for t in tasks if t.finish is not None), key=lambda t: t.finish)
+        )
+        self._starts = [task.start for task in self.by_start]
+        self._finishes = [task.finish for task in self.by_finish]
+
+    def __len__(self) -> int:
+        return len(self.by_start)
+
+    def starting(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        inclusive: bool = False,
+    ) -> tuple[Task]:
+        """Tasks that start in a window, sorted by start
+
+        Args:
+            start (datetime, optional): first date of the window, or None
+                for no lower limit. Defaults to None.
+            end (datetime, optional): date the window ends before, or None
+                for no upper limit. Defaults to None.
+            inclusive (bool, optional): include tasks that start on the end
+                date. Defaults to False.
+
+        Returns:
+            tuple[Task]: tasks with start >= start and start < end
+        """
+        return _window(self.by_start, self._starts, start, end, inclusive)
+
+    def finishing(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        inclusive: bool = False,
+    ) -> tuple[Task]:
+        """Tasks that finish in a window, sorted by finish
+
+        Args:
+            start (datetime, optional): first date of the window, or None
+                for no lower limit. Defaults to None.
+            end (datetime, optional): date the window ends before, or None
+                for no upper limit. Defaults to None.
+            inclusive (bool, optional): include tasks that finish on the end
+                date. Defaults to False.
+
+        Returns:
+            tuple[Task]: tasks with finish >= start and finish < end
+        """
+        return _window(self.by_finish, self._finishes, start, end, inclusive)
+
+    def active(self, start: datetime, end: datetime) -> tuple[Task]:
+        """Tasks that are under way at any time in a window, sorted by start
+
+        A task is active if it starts before the end of the window and
+        finishes on or after its start. A task whose finish is before its
+        start, such as an in-progress task with an actual start after its
+        early finish, spans the dates between the two.
+
+        Args:
+            start (datetime): first date of the window
+            end (datetime): date the window ends before
+
+        Returns:
+            tuple[Task]: tasks with start < end and finish >= start
+        """
+        ranks = self._interval_tree.overlapping(start, end)
+        return tuple(self.by_start[rank] for rank in sorted(ranks))
+
+    @cached_property
+    def _interval_tree(self) -> "_IntervalTree":
+        return _IntervalTree(
+            [
+                (task.start, task.finish, rank)
+                for rank, task in enumerate(self.by_start)
+                if task.finish is not None
+            ]
+        )
+
+
+class _IntervalTree:
+    """
+    Static centered interval tree of (start, finish, rank) intervals.
+
+    Each node keeps the intervals that contain its center, sorted by start
+    and by descending finish; the rest go to the left or right child.
+    A query visits O(log n) nodes and stops each scan at the first
+    interval that does not overlap, so it runs in O(log n + k).
+    """
+
+    def __init__(self, intervals: list[tuple[datetime, datetime, int]]) -> None:
+        # An inverted interval would fall on neither side of its own
+        # center and recurse forever, so each one spans min to max
+        intervals = [
+            (start, finish, rank) if start <= finish else (finish, start, rank)
+            for start, finish, rank in intervals
+        ]
+        # node: [center, by_start, by_finish_desc, left, right]
+        self._root = self._build(intervals)
+
+    def _build(self, intervals: list) -> Optional[list]:
+        if not intervals:
+            return None
+
+        starts = sorted(interval[0] for interval in intervals)
+        center = starts[len(starts) // 2]
+        left, here, right = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        return [
+            center,
+            sorted(here, key=lambda i: i[0]),
+            sorted(here, key=lambda i: i[1], reverse=True),
+            self._build(left),
+            self._build(right),
+        ]
+
+    def overlapping(self, start: datetime, end: datetime) -> list[int]:
+        """Ranks of the intervals with interval start < end and finish >= start"""
+        ranks = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            center, by_start, by_finish, left, right = node
+            if end <= center:
+                # every interval here finishes after the window starts
+                for interval in by_start:
+                    if interval[0] >= end:
+                        break
+                    ranks.append(interval[2])
+            elif start > center:
+                # every interval here starts before the window ends
+                for interval in by_finish:
+                    if interval[1] < start:
+                        break
+                    ranks.append(interval[2])
+            else:
+                ranks.extend(interval[2] for interval in by_start)
+
+            if start < center:
+                stack.append(left)
+            if center < end:
+                stack.append(right)
+
+        return ranks
+
+
+def _window(
+    tasks: tuple[Task],
+    dates: list[datetime],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    inclusive: bool,
+) -> tuple[Task]:
+    """Slice of tasks sorted by date that falls in a window"""
+    lo = 0 if start is None else bisect_left(dates, start)
+    if end is None:
+        hi = len(dates)
+    else:
+        hi = bisect_right(dates, end) if inclusive else bisect_left(dates, end)
+
+    return tasks[lo:hi]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Mapping, Optional
 
 
 class FinancialPeriod:
@@ -15,8 +16,9 @@ class FinancialPeriod:
     finish: datetime
         Finish date for Financial Period
     """
-    def __init__(self, **kwargs) -> None:
-        self._attr = kwargs
+    def __init__(self, row: Optional[Mapping] = None, **kwargs) -> None:
+        self._attr = row if row is not None else {}
+        self._attr.update(kwargs)
 
     @property
     def name(self) -> str:
@@ -48,8 +50,14 @@ class ResourceFinancial:
     period: FinancialPeriod
         Financial Period object
     """
-    def __init__(self, **kwargs) -> None:
-        self._attr = kwargs
+    # Columns of the TRSRCFIN table read by the class and by Schedule
+    COLUMNS = frozenset(
+        {'fin_dates_id', 'taskrsrc_id', 'task_id', 'proj_id', 'act_cost', 'act_qty'}
+    )
+
+    def __init__(self, row: Optional[Mapping] = None, **kwargs) -> None:
+        self._attr = row if row is not None else {}
+        self._attr.update(kwargs)
 
     @property
     def cost(self) -> float:
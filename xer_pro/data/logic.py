@@ -1,9 +1,19 @@
+from typing import Mapping, Optional
+
 from xer_pro.data.task import Task
 
 
 class Relationship:
-    def __init__(self, pred: Task, succ: Task, **kwargs) -> None:
-        self._attr = kwargs
+    # Columns of the TASKPRED table read by the class and by Schedule
+    COLUMNS = frozenset(
+        {"task_id", "pred_task_id", "proj_id", "pred_proj_id", "pred_type", "lag_hr_cnt"}
+    )
+
+    def __init__(
+        self, pred: Task, succ: Task, row: Optional[Mapping] = None, **kwargs
+    ) -> None:
+        self._attr = row if row is not None else {}
+        self._attr.update(kwargs)
         self.predecessor: Task = pred
         self.successor: Task = succ
 
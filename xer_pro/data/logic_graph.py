@@ -0,0 +1,129 @@
+from array import array
+from typing import Iterable, Optional
+
+from xer_pro.data.logic import Relationship
+from xer_pro.data.task import Task
+
+# Relationship types in the order of their link codes
+LINK_TYPES = ("FS", "SS", "FF", "SF")
+LINK_CODES = {link: code for code, link in enumerate(LINK_TYPES)}
+
+
+class LogicGraph:
+    """
+    A class to represent the logic network of a schedule.
+
+    Tasks are numbered densely in activity id order. The relationships are
+    stored once, sorted by predecessor then successor activity id, as
+    compressed sparse rows: the relationships leaving task n are
+    relationships[succ_offsets[n]:succ_offsets[n + 1]]. The same layout
+    indexed by successor gives the relationships entering each task.
+
+    ...
+
+    Attributes
+    ----------
+    tasks: tuple[Task]
+        Tasks in the order of their numbers
+    relationships: tuple[Relationship]
+        Relationships sorted by predecessor then successor activity id
+    succ_offsets: array
+        Start of the successors of each task, with the edge count appended
+    succ_targets: array
+        Number of the successor of each relationship
+    pred_offsets: array
+        Start of the predecessors of each task, with the edge count appended
+    pred_sources: array
+        Number of the predecessor of each entering relationship
+    pred_edges: array
+        Position in relationships of each entering relationship
+    links: array
+        Link code (index in LINK_TYPES) of each relationship
+    lags: array
+        Lag in hours of each relationship
+    """
+
+    def __init__(self, tasks: Iterable[Task], logic: Iterable[Relationship]) -> None:
+        self.tasks = tuple(sorted(tasks, key=lambda t: (t.activity_id, t["task_id"])))
+        self._numbers = {task["task_id"]: n for n, task in enumerate(self.tasks)}
+        count = len(self.tasks)
+
+        edges = [
+            (self.number(rel.predecessor), self.number(rel.successor), rel)
+            for rel in logic
+        ]
+        edges.sort(key=lambda edge: (edge[0], edge[1]))
+
+        self.relationships = tuple(rel for _, _, rel in edges)
+        self.succ_targets = array("l", (succ for _, succ, _ in edges))
+        self.succ_offsets = _offsets((pred for pred, _, _ in edges), count)
+        self.links = array("B", (LINK_CODES[rel.link] for rel in self.relationships))
+        self.lags = array(
+            "d", (rel._attr["lag_hr_cnt"] or 0.0 for rel in self.relationships)
+        )
+
+        entering = sorted(range(len(edges)), key=lambda e: (edges[e][1], edges[e][0]))
+        self.pred_edges = array("l", entering)
+        self.pred_sources = array("l", (edges[e][0] for e in entering))
+        self.pred_offsets = _offsets((edges[e][1] for e in entering), count)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def number(self, task: Task) -> int:
+        """Dense number of a task"""
+        return self._numbers[task["task_id"]]
+
+    def get_number(self, task: Task) -> Optional[int]:
+        """Dense number of a task, or None if it is not in the graph"""
+        return self._numbers.get(task["task_id"])
+
+    def successors(self, task: Task) -> tuple[Relationship]:
+        """Relationships from a task to its successors, by successor activity id"""
+        n = self.number(task)
+        return self.relationships[self.succ_offsets[n] : self.succ_offsets[n + 1]]
+
+    def predecessors(self, task: Task) -> tuple[Relationship]:
+        """Relationships from the predecessors of a task, by predecessor activity id"""
+        n = self.number(task)
+        rels = self.relationships
+        edges = self.pred_edges[self.pred_offsets[n] : self.pred_offsets[n + 1]]
+        return tuple(rels[e] for e in edges)
+
+    def successor_links(self, n: int) -> array:
+        """Link codes of the relationships leaving task number n"""
+        return self.links[self.succ_offsets[n] : self.succ_offsets[n + 1]]
+
+    def predecessor_links(self, n: int) -> list[int]:
+        """Link codes of the relationships entering task number n"""
+        links = self.links
+        return [
+            links[e]
+            for e in self.pred_edges[self.pred_offsets[n] : self.pred_offsets[n + 1]]
+        ]
+
+    def out_degree(self, n: int) -> int:
+        """Number of successors of task number n"""
+        return self.succ_offsets[n + 1] - self.succ_offsets[n]
+
+    def in_degree(self, n: int) -> int:
+        """Number of predecessors of task number n"""
+        return self.pred_offsets[n + 1] - self.pred_offsets[n]
+
+    def by_link(self, *links: str) -> tuple[Relationship]:
+        """Relationships with any of the link types, in relationship order"""
+        codes = {LINK_CODES[link] for link in links}
+        return tuple(
+            rel for rel, code in zip(self.relationships, self.links) if code in codes
+        )
+
+
+def _offsets(keys: Iterable[int], count: int) -> array:
+    """Row offsets of sorted CSR keys in the range [0, count)"""
+    offsets = array("l", [0]) * (count + 1)
+    for key in keys:
+        offsets[key + 1] += 1
+    for n in range(count):
+        offsets[n + 1] += offsets[n]
+
+    return offsets
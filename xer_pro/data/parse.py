@@ -1,9 +1,77 @@
+import io
+import os
+import shutil
+import tempfile
+from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, BinaryIO, Callable, Collection, Iterator, Optional, Union
+
+from xer_pro.data.report import ParseReport, step_timer
+from xer_pro.data.table import LazyTextColumn, XerTable
+
+CODEC = 'cp1252'  # Encoding standard for xer file
+
+# A path to a .xer file, its raw bytes, or a binary file-like object
+XerSource = Union[str, os.PathLike, bytes, BinaryIO]
+
+# Streams that can not seek are spooled to disk above this size
+SPOOL_SIZE = 16 * 1024 * 1024
+
+# Large tables typed in worker processes when parsing in parallel
+PARALLEL_TABLES = ('TASK', 'TASKPRED', 'TASKRSRC', 'TRSRCFIN', 'RSRCHOUR')
+
+# Files smaller than this are always parsed in a single process
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+# Approximate size of the row ranges sent to each worker process
+PARALLEL_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Distinct timestamps kept by the date decoder cache
+DATE_CACHE_SIZE = 1 << 16
+
+# (field index, column label, decoder) for each column kept from a table
+DecoderPlan = tuple[tuple[int, str, Callable[[bytes], Any]], ...]
+
+# Column labels to keep from each table; tables not listed keep every column
+ColumnSets = Mapping[str, Collection[str]]
+
+# Free text columns left as raw bytes until first read
+LAZY_TEXT_COLUMNS = frozenset(
+    {
+        'acct_descr',
+        'clndr_data',
+        'comments',
+        'memo_type',
+        'rsrc_notes',
+        'task_memo',
+        'task_name',
+        'wbs_name',
+    }
+)
+
+# Key and code columns whose repeated values share one str object per file
+INTERNED_SUFFIXES = ('_id', '_type', '_type2')
+INTERNED_COLUMNS = frozenset({'status_code'})
+
+_DASH, _SPACE, _COLON = b'- :'
 
 
 REQUIRED_TABLES = ['CALENDAR', 'PROJECT', 'PROJWBS', 'TASK', 'TASKPRED']
 
+# Tables holding rows of individual projects, with their project id columns
+PROJECT_TABLES = {
+    'PROJWBS': ('proj_id',),
+    'TASK': ('proj_id',),
+    'TASKPRED': ('proj_id', 'pred_proj_id'),
+    'TASKRSRC': ('proj_id',),
+    'TRSRCFIN': ('proj_id',),
+}
+
 REQUIRED_TABLE_PAIRS = {
     'TASKFIN': 'FINDATES',
     'TRSRCFIN': 'FINDATES',
@@ -14,39 +82,354 @@ REQUIRED_TABLE_PAIRS = {
 }
 
 
-def _create_table(table: str) -> dict[str, list[dict]]:
-    lines = table.split('\r\n')
-    name = lines.pop(0).strip()
-    cols = lines.pop(0).split('\t')[1:]
-    rows = [
-        tuple(zip(cols, line.split('\t')[1:]))
-        for line in lines
-        if line and not line.startswith('%E')]
+def _iter_records(
+    stream: BinaryIO, offset: int = 0, end: Optional[int] = None
+) -> Iterator[tuple[int, bytes]]:
+    """Read a binary .xer stream one record at a time.
+
+    Records are terminated by '\r\n'; a bare '\n' inside a field is kept
+    as part of the record, the same as splitting the decoded text would.
+
+    Args:
+        stream (BinaryIO): stream positioned at offset
+        offset (int, optional): position of the stream. Defaults to 0.
+        end (int, optional): stop reading at this position. Defaults to None.
+
+    Yields:
+        Iterator[tuple[int, bytes]]: offset and contents of each record
+    """
+    pending = b''
+    for chunk in stream:
+        pending += chunk
+        if pending.endswith(b'\r\n'):
+            yield offset, pending[:-2]
+            offset += len(pending)
+            pending = b''
+            if end is not None and offset >= end:
+                return
+
+    if pending:
+        yield offset, pending
+
+
+def _decode_labels(record: bytes) -> list[str]:
+    """Column labels of a %F record"""
+    return record.decode(CODEC).split('\t')[1:]
+
+
+def _iter_table(records: Iterator[bytes]) -> Iterator[tuple[str, Optional[dict]]]:
+    """Type the rows of one or more tables from their records.
+
+    Yields (table name, None) at the start of each table, followed by
+    (table name, row) for each of its rows.
+    """
+    name, plan, interned = None, (), InternTable()
+    for record in records:
+        if record.startswith(b'%T\t'):
+            name, plan = record[3:].strip().decode(CODEC), ()
+            yield name, None
+        elif record.startswith(b'%F\t'):
+            plan = _compile_decoders(_decode_labels(record), interned=interned)
+        elif record.startswith(b'%R\t') and name is not None:
+            yield name, _decode_row(plan, record.split(b'\t'))
+
+
+def _read_table(
+    records: Iterator[bytes],
+    interned: Optional['InternTable'] = None,
+    keep: Optional[Collection[str]] = None,
+) -> XerTable:
+    """Type the rows of a single table straight into columns.
+
+    Fields are split and typed from bytes. Free text columns listed in
+    LAZY_TEXT_COLUMNS keep their raw bytes until a value is first read.
+    Key and code columns share their values through the interned table.
+    When keep is given, every other column is skipped before it is typed.
+    """
+    if interned is None:
+        interned = InternTable()
+
+    columns, decoders, width, length = {}, (), 0, 0
+    for record in records:
+        if record.startswith(b'%F\t'):
+            plan = _compile_decoders(
+                _decode_labels(record), keep=keep, lazy_text=True, interned=interned
+            )
+            columns = {
+                label: LazyTextColumn(CODEC) if decode is _keep_bytes else []
+                for _, label, decode in plan
+            }
+            decoders = tuple(
+                (index, columns[label].append, decode)
+                for index, label, decode in plan
+            )
+            width = plan[-1][0] + 1 if plan else 0
+        elif record.startswith(b'%R\t'):
+            values = record.split(b'\t')
+            if len(values) < width:
+                values += [b''] * (width - len(values))
+            for index, append, decode in decoders:
+                append(decode(val) if (val := values[index]) else None)
+            length += 1
+
+    return XerTable(columns, length)
+
+
+def _split_table(data: bytes) -> tuple[bytes, list[bytes]]:
+    """Split the bytes of a table into its %F header and row ranges
+
+    Args:
+        data (bytes): table from its %T line up to the next table
+
+    Returns:
+        tuple[bytes, list[bytes]]: %F header line and chunks of whole rows
+    """
+    _, header, rows = (data.split(b'\r\n', 2) + [b'', b''])[:3]
+    chunks = []
+    pos = 0
+    while pos < len(rows):
+        end = rows.find(b'\r\n', pos + PARALLEL_CHUNK_BYTES)
+        end = len(rows) if end == -1 else end + 2
+        chunks.append(rows[pos:end])
+        pos = end
+
+    return header, chunks
+
+
+def _read_table_chunk(
+    header: bytes, rows: bytes, keep: Optional[Collection[str]] = None
+) -> XerTable:
+    """Type a range of rows of a table in a worker process"""
+    return _read_table((header, *rows.split(b'\r\n')), keep=keep)
+
+
+@contextmanager
+def _open_xer(source: XerSource) -> Iterator[BinaryIO]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as stream:
+            yield stream
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        yield io.BytesIO(source)
+    else:
+        yield source
+
+
+def iter_xer_rows(source: XerSource) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Stream the rows of a .xer file one record at a time.
+
+    Only the current record is held in memory, so this suits a single pass
+    over a file, such as an export or a check of every row. Use
+    parse_xer_file to read tables by name.
+
+    Args:
+        source (XerSource): path to a .xer file, its raw bytes, or a binary
+            file-like object such as an upload stream
+
+    Yields:
+        Iterator[tuple[str, dict]]: table name and typed row keyed by column label
+    """
+    with _open_xer(source) as stream:
+        records = (record for _, record in _iter_records(stream))
+        for name, row in _iter_table(records):
+            if row is not None:
+                yield name, row
+
+
+class XerTables(Mapping):
+    """Tables of a .xer file, typed on first access.
+
+    Opening the file only records where each table starts and ends.
+    The rows of a table are decoded and typed into an XerTable the first time
+    the table is read, so tables that are never used are never materialized.
+    Checking if a table is in the file does not materialize it.
+
+    The source must stay open until every table that is needed has been read.
+    Streams that can not seek are copied to a temporary file.
+
+    When workers is set and the file is at least PARALLEL_MIN_BYTES, the
+    PARALLEL_TABLES are typed up front in a pool of worker processes, split
+    into row ranges of about PARALLEL_CHUNK_BYTES.
+
+    When columns is given, only the listed columns of a table are typed
+    and kept; tables that are not listed keep every column.
+
+    When a report is given, the scan and every table typed are recorded in it.
+    """
+
+    def __init__(
+        self,
+        source: XerSource,
+        workers: Optional[int] = None,
+        report: Optional[ParseReport] = None,
+        columns: Optional[ColumnSets] = None,
+    ) -> None:
+        if not isinstance(
+            source, (str, os.PathLike, bytes, bytearray, memoryview)
+        ) and not source.seekable():
+            spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+            shutil.copyfileobj(source, spool)
+            spool.seek(0)
+            source = spool
+
+        self._source = source
+        self._spans: dict[str, tuple[int, int]] = {}
+        self._rows: dict[str, XerTable] = {}
+        self._interned = InternTable()
+        self._columns = columns or {}
+        self.report = report
+
+        with step_timer(report)('scan') as scan, _open_xer(source) as stream:
+            start = name = None
+            offset = first = stream.tell()
+            for offset, record in _iter_records(stream, offset):
+                if record.startswith((b'%T\t', b'%E')):
+                    if name is not None:
+                        self._spans[name] = (start, offset)
+                    start, name = offset, None
+                    if record.startswith(b'%T\t'):
+                        name = record[3:].strip().decode(CODEC)
+                offset += len(record) + 2
+
+            if name is not None:
+                self._spans[name] = (start, offset)
+            scan.items = len(self._spans)
 
-    table = {
-        name: [
-            {label: _set_data_type(label, value)
-             for label, value in row} for row in rows
-        ]}
+        if workers and offset - first >= PARALLEL_MIN_BYTES:
+            self._read_parallel(workers)
 
-    return table
+    def __contains__(self, name: object) -> bool:
+        return name in self._spans
 
+    def __getitem__(self, name: str) -> XerTable:
+        if name not in self._rows:
+            start, end = self._spans[name]
+            began = perf_counter()
+            with _open_xer(self._source) as stream:
+                stream.seek(start)
+                records = (record for _, record in _iter_records(stream, start, end))
+                self._rows[name] = _read_table(
+                    records, self._interned, self._columns.get(name)
+                )
 
-def parse_xer_file(file: str) -> dict[str, list[dict]]:
-    """Parses a .xer file into a dictionary of the schedule data tables
+            if self.report is not None:
+                self.report.add_table(
+                    name, self._rows[name], end - start, perf_counter() - began
+                )
+
+        return self._rows[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def _read_parallel(self, workers: int) -> None:
+        """Type the large tables in a pool of worker processes"""
+        jobs = {}
+        began = perf_counter()
+        with _open_xer(self._source) as stream, ProcessPoolExecutor(workers) as pool:
+            for name in PARALLEL_TABLES:
+                if name not in self._spans:
+                    continue
+
+                start, end = self._spans[name]
+                stream.seek(start)
+                header, chunks = _split_table(stream.read(end - start))
+                keep = self._columns.get(name)
+                jobs[name] = [
+                    pool.submit(_read_table_chunk, header, chunk, keep)
+                    for chunk in chunks
+                ]
+
+            for name, futures in jobs.items():
+                table = XerTable.concat([job.result() for job in futures])
+                self._rows[name] = self._interned.share(table)
+
+                # the tables are typed concurrently; each is timed until it is ready
+                if self.report is not None:
+                    start, end = self._spans[name]
+                    self.report.add_table(
+                        name, self._rows[name], end - start, perf_counter() - began
+                    )
+
+    def select(self, names: Collection[str]) -> dict[str, XerTable]:
+        """Materialize the named tables that are in the file
+
+        Args:
+            names (Collection[str]): table names
+
+        Returns:
+            dict: typed table of each table found
+        """
+        return {name: self[name] for name in names if name in self}
+
+
+def parse_xer_file(
+    source: XerSource,
+    workers: Optional[int] = None,
+    report: Optional[ParseReport] = None,
+    columns: Optional[ColumnSets] = None,
+) -> XerTables:
+    """Parses a .xer file into a mapping of the schedule data tables
+
+    Only the position of each table is read up front; the rows of a table
+    are typed the first time it is accessed.
+
+    Args:
+        source (XerSource): path to a .xer file, its raw bytes, or a binary
+            file-like object such as an upload stream
+        workers (int, optional): number of processes used to type the large
+            tables of files over PARALLEL_MIN_BYTES. Defaults to None.
+        report (ParseReport, optional): records the time, rows, columns,
+            bytes and memory of each table as it is typed. Defaults to None.
+        columns (ColumnSets, optional): column labels to keep from each table,
+            such as SCHEDULE_COLUMNS. Defaults to None, which keeps every column.
+
+    Returns:
+        XerTables: Mapping of the schedule data tables
+    """
+    return XerTables(source, workers, report, columns)
+
+
+def partition_tables(
+    tables: Mapping[str, XerTable], proj_ids: Collection[str]
+) -> dict[str, dict[str, XerTable]]:
+    """Split the project tables of a .xer file by project in a single pass
+
+    Each table in PROJECT_TABLES is read once and its rows are bucketed by
+    project id. Logic between two different projects is left out.
+    A table that only holds rows of one project is not copied.
 
     Args:
-        file (str): .xer file
+        tables (Mapping[str, XerTable]): schedule data tables
+        proj_ids (Collection[str]): ids of the projects to keep
 
     Returns:
-        dict: Dictionary of the schedule data tables
+        dict: project tables of each project keyed by project id
     """
-    tables = {
-        name: rows
-        for table in file.split('%T\t')[1:]
-        for name, rows in _create_table(table).items()}
+    partitions = {proj_id: {} for proj_id in proj_ids}
+    for name, keys in PROJECT_TABLES.items():
+        if name not in tables:
+            continue
+
+        table = tables[name]
+        buckets = defaultdict(list)
+        if len(keys) == 1:
+            for index, proj_id in enumerate(table.column(keys[0])):
+                buckets[proj_id].append(index)
+        else:
+            for index, (proj_id, other_proj_id) in enumerate(
+                zip(*(table.column(key) for key in keys))
+            ):
+                if proj_id == other_proj_id:
+                    buckets[proj_id].append(index)
 
-    return tables
+        for proj_id, partition in partitions.items():
+            indices = buckets.get(proj_id, [])
+            partition[name] = table if len(indices) == len(table) else table.take(indices)
+
+    return partitions
 
 
 def find_xer_errors(tables: dict) -> Optional[list]:
@@ -62,11 +445,6 @@ def find_xer_errors(tables: dict) -> Optional[list]:
         if t1 in tables and t2 not in tables:
             errors.append(f'Missing Table {t2} Required for Table {t1}')
 
-    # check for multiple schedules
-    export_xer_projects = tuple(t for t in tables.get('PROJECT', []) if t['export_flag'])
-    if len(export_xer_projects) > 1:
-        errors.append(f'XER Contains {len(export_xer_projects)} Schedules')
-
     # check for tasks assigned to an invalid calendar (not included in CALENDAR TABLE)
     cal_ids = [c['clndr_id'] for c in tables.get('CALENDAR', [])]
     tasks_with_invalid_calendar = [t for t in tables.get('TASK', []) if not t['clndr_id'] in cal_ids]
@@ -81,25 +459,140 @@ def find_xer_errors(tables: dict) -> Optional[list]:
     return errors
 
 
-def _set_data_type(key: str, val: str) -> Any:
-    """Set the data type of a value based on its column label
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _decode_date(val: bytes) -> datetime:
+    """Decode a 'YYYY-MM-DD HH:MM' timestamp
+
+    The fields are sliced directly from the fixed width value, and the
+    cache shares one datetime object between every cell holding the same
+    timestamp.
+    """
+    if len(val) == 16 and val[4] == val[7] == _DASH and val[10] == _SPACE and val[13] == _COLON:
+        return datetime(
+            int(val[:4]), int(val[5:7]), int(val[8:10]), int(val[11:13]), int(val[14:])
+        )
+
+    return datetime.strptime(val.decode(CODEC), '%Y-%m-%d %H:%M')
+
+
+def _decode_flag(val: bytes) -> bool:
+    return val == b'Y'
+
+
+def _decode_str(val: bytes) -> str:
+    # ascii is a subset of cp1252 and decodes without a codec lookup
+    if val.isascii():
+        return val.decode('ascii')
+
+    return val.decode(CODEC)
+
+
+def _keep_bytes(val: bytes) -> bytes:
+    return val
+
+
+class InternTable(dict):
+    """Decoded key and code values of a file, keyed by their raw bytes.
+
+    Every cell holding the same value gets the same str object, so each
+    distinct id or code is stored once and comparing two of them is an
+    identity check.
+    """
+
+    def __missing__(self, val: bytes) -> str:
+        text = self[val] = _decode_str(val)
+        return text
+
+    def share(self, table: XerTable) -> XerTable:
+        """Replace equal values in the interned columns of a table with one object"""
+        by_text = {text: text for text in self.values()}
+        for label, values in table.columns.items():
+            if _is_interned(label):
+                values[:] = [
+                    by_text.setdefault(val, val) if val is not None else None
+                    for val in values
+                ]
+        self.update((text.encode(CODEC), text) for text in by_text.values())
+
+        return table
+
+
+def _is_interned(key: str) -> bool:
+    return key.endswith(INTERNED_SUFFIXES) or key in INTERNED_COLUMNS
+
+
+def _column_decoder(
+    key: str, lazy_text: bool = False, interned: Optional[InternTable] = None
+) -> Callable[[bytes], Any]:
+    """Get the function used to decode the values of a column
 
     Args:
         key (str): column label
-        val (str): data value
+        lazy_text (bool, optional): keep free text columns as bytes. Defaults to False.
+        interned (InternTable, optional): shared values of the key and code
+            columns. Defaults to None.
 
     Returns:
-        Any: data value set to correct data type
+        Callable: decoder for non-empty values in the column
     """
-    if not val or val == "":
-        return None
     if key.endswith(('_date', '_date2')):
-        return datetime.strptime(val, '%Y-%m-%d %H:%M')
+        return _decode_date
     if key.endswith('_num'):
-        return int(val)
+        return int
     if key.endswith(('_cnt', '_qty', '_cost', '_pct')):
-        return float(val)
+        return float
     if key.endswith('_flag'):
-        return val == 'Y'
+        return _decode_flag
+    if lazy_text and key in LAZY_TEXT_COLUMNS:
+        return _keep_bytes
+    if interned is not None and _is_interned(key):
+        return interned.__getitem__
 
-    return val
+    return _decode_str
+
+
+def _compile_decoders(
+    cols: list[str],
+    keep: Optional[Collection[str]] = None,
+    lazy_text: bool = False,
+    interned: Optional[InternTable] = None,
+) -> DecoderPlan:
+    """Compile the decoder plan for a table from its %F header line
+
+    The column suffixes are checked once per table instead of once per value.
+
+    Args:
+        cols (list[str]): column labels
+        keep (Collection[str], optional): only keep these column labels.
+            Defaults to None, which keeps every column.
+        lazy_text (bool, optional): keep free text columns as bytes. Defaults to False.
+        interned (InternTable, optional): shared values of the key and code
+            columns. Defaults to None.
+
+    Returns:
+        DecoderPlan: (field index, column label, decoder) for each kept column
+    """
+    return tuple(
+        (index, label, _column_decoder(label, lazy_text, interned))
+        for index, label in enumerate(cols, start=1)
+        if keep is None or label in keep
+    )
+
+
+def _decode_row(plan: DecoderPlan, values: list[bytes]) -> dict[str, Any]:
+    """Apply a decoder plan to the fields of a %R line
+
+    Args:
+        plan (DecoderPlan): compiled decoder plan for the table
+        values (list[bytes]): tab separated fields of the line, including '%R'
+
+    Returns:
+        dict: row keyed by column label
+    """
+    if plan and len(values) <= plan[-1][0]:
+        values += [b''] * (plan[-1][0] - len(values) + 1)
+
+    return {
+        label: decode(val) if (val := values[index]) else None
+        for index, label, decode in plan
+    }
@@ -0,0 +1,193 @@
+"""
+report.py
+
+Opt-in instrumentation of parsing a .xer file and building a Schedule.
+"""
+
+import sys
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from time import perf_counter
+from typing import Any, Iterator, Optional
+
+from xer_pro.data.table import XerTable
+
+# Rows sampled from each column to estimate the memory of a table
+MEMORY_SAMPLE_ROWS = 1000
+
+
+@dataclass
+class TableStats:
+    """
+    A class to represent the measurements of typing one table.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Table name
+    rows : int
+        Number of rows
+    columns : int
+        Number of columns
+    bytes : int
+        Size of the table in the .xer file
+    seconds : float
+        Wall time spent typing the table
+    memory : int
+        Approximate memory retained by the typed table in bytes
+    """
+
+    name: str
+    rows: int = 0
+    columns: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    memory: int = 0
+
+
+@dataclass
+class StepStats:
+    """
+    A class to represent the measurements of one step of parsing or building.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Step name
+    seconds : float
+        Wall time spent in the step
+    items : int
+        Number of objects the step produced
+    """
+
+    name: str
+    seconds: float = 0.0
+    items: int = 0
+
+
+@dataclass
+class ParseReport:
+    """
+    A class to represent the timings of parsing a .xer file and building
+    its schedules.
+
+    Pass an instance as the report argument of parse_xer_file, Schedule or
+    build_schedules; it is filled in as the work is done.
+
+    ...
+
+    Attributes
+    ----------
+    tables : dict[str, TableStats]
+        Measurements of each table typed, keyed by table name
+    steps : list[StepStats]
+        Measurements of each step in the order they ran
+    """
+
+    tables: dict[str, TableStats] = field(default_factory=dict)
+    steps: list[StepStats] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        lines = [
+            f"{t.name:<10} {t.rows:>9,} rows {t.columns:>3} cols "
+            f"{t.bytes / 1e6:>8.2f} MB {t.seconds:>8.3f} s "
+            f"{t.memory / 1e6:>8.2f} MB retained"
+            for t in self.tables.values()
+        ]
+        lines.extend(
+            f"{s.name:<24} {s.items:>9,} items {s.seconds:>8.3f} s" for s in self.steps
+        )
+        return "\n".join(lines)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Report as plain data that can be logged or serialized to JSON"""
+        return {
+            "tables": [asdict(t) for t in self.tables.values()],
+            "steps": [asdict(s) for s in self.steps],
+        }
+
+    def add_table(
+        self, name: str, table: XerTable, size: int, seconds: float
+    ) -> TableStats:
+        """Record the measurements of a typed table
+
+        Args:
+            name (str): table name
+            table (XerTable): typed table
+            size (int): size of the table in the .xer file
+            seconds (float): wall time spent typing the table
+
+        Returns:
+            TableStats: measurements of the table
+        """
+        stats = self.tables[name] = TableStats(
+            name=name,
+            rows=len(table),
+            columns=len(table.columns),
+            bytes=size,
+            seconds=seconds,
+            memory=estimate_memory(table),
+        )
+        return stats
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[StepStats]:
+        """Time the body of a with statement as a step
+
+        Args:
+            name (str): step name
+
+        Yields:
+            StepStats: measurements of the step; set items inside the block
+        """
+        stats = StepStats(name)
+        start = perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.seconds = perf_counter() - start
+            self.steps.append(stats)
+
+
+@contextmanager
+def untimed_step(name: str) -> Iterator[StepStats]:
+    """Stand-in for ParseReport.step when no report is requested"""
+    yield StepStats(name)
+
+
+def step_timer(report: Optional[ParseReport]):
+    """Get the step context manager of a report, or one that records nothing"""
+    return report.step if report is not None else untimed_step
+
+
+def estimate_memory(table: XerTable) -> int:
+    """Estimate the memory retained by a table from a sample of its rows
+
+    Values shared between cells, such as interned ids and cached dates,
+    are counted once per sample.
+
+    Args:
+        table (XerTable): typed table
+
+    Returns:
+        int: approximate size in bytes
+    """
+    total = sys.getsizeof(table.columns)
+    for values in table.columns.values():
+        total += sys.getsizeof(values)
+        sample = list(islice(list.__iter__(values), MEMORY_SAMPLE_ROWS))
+        if not sample:
+            continue
+
+        seen = {}
+        for val in sample:
+            if val is not None:
+                seen.setdefault(id(val), sys.getsizeof(val))
+        total += sum(seen.values()) * len(values) // len(sample)
+
+    return total
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import Mapping, Optional
 from xer_pro.data.sched_calendar import SchedCalendar
 from xer_pro.data.task import Task
 
@@ -113,8 +114,38 @@ class TaskResource:
 
     """
 
-    def __init__(self, **kwargs) -> None:
-        self._attr = kwargs
+    # Columns of the TASKRSRC table read by the class and by Schedule
+    COLUMNS = frozenset(
+        {
+            "taskrsrc_id",
+            "task_id",
+            "proj_id",
+            "rsrc_id",
+            "acct_id",
+            "rsrc_type",
+            "target_qty",
+            "act_reg_qty",
+            "act_ot_qty",
+            "act_this_per_qty",
+            "remain_qty",
+            "target_cost",
+            "act_reg_cost",
+            "act_ot_cost",
+            "act_this_per_cost",
+            "remain_cost",
+            "target_lag_drtn_hr_cnt",
+            "act_start_date",
+            "act_end_date",
+            "restart_date",
+            "reend_date",
+            "rem_late_start_date",
+            "rem_late_end_date",
+        }
+    )
+
+    def __init__(self, row: Optional[Mapping] = None, **kwargs) -> None:
+        self._attr = row if row is not None else {}
+        self._attr.update(kwargs)
 
     def __getitem__(self, name: str):
         return self._attr[name]
@@ -208,7 +239,7 @@ class TaskResource:
         """Account assigned to resource"""
         return self._attr.get("account")
 
-    @property
+    @cached_property
     def cost(self) -> ResourceValues:
         return ResourceValues(
             budget=self._attr.get("target_cost"),
@@ -217,7 +248,7 @@ class TaskResource:
             remaining=self._attr.get("remain_cost"),
         )
 
-    @property
+    @cached_property
     def unit_qty(self) -> ResourceValues:
         return ResourceValues(
             budget=self._attr.get("target_qty"),
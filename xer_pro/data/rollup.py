@@ -0,0 +1,154 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+
+from xer_pro.data.resource import ResourceValues, TaskResource
+
+
+@dataclass
+class RollupTotals:
+    """
+    A class to represent cost and unit quantity totals of a group of
+    resource assignments.
+
+    ...
+
+    Attributes
+    ----------
+    budget_cost : float
+        Budgeted cost
+    actual_cost : float
+        Actual regular and overtime cost
+    this_period_cost : float
+        Actual cost this period
+    remaining_cost : float
+        Remaining cost
+    budget_qty : float
+        Budgeted units
+    actual_qty : float
+        Actual regular and overtime units
+    this_period_qty : float
+        Actual units this period
+    remaining_qty : float
+        Remaining units
+    earned_value : float
+        Budgeted cost times the percent complete of each task
+    assignments : int
+        Number of resource assignments in the group
+    """
+
+    budget_cost: float = 0.0
+    actual_cost: float = 0.0
+    this_period_cost: float = 0.0
+    remaining_cost: float = 0.0
+    budget_qty: float = 0.0
+    actual_qty: float = 0.0
+    this_period_qty: float = 0.0
+    remaining_qty: float = 0.0
+    earned_value: float = 0.0
+    assignments: int = 0
+
+    @property
+    def cost(self) -> ResourceValues:
+        return ResourceValues(
+            budget=self.budget_cost,
+            actual=self.actual_cost,
+            this_period=self.this_period_cost,
+            remaining=self.remaining_cost,
+        )
+
+    @property
+    def unit_qty(self) -> ResourceValues:
+        return ResourceValues(
+            budget=self.budget_qty,
+            actual=self.actual_qty,
+            this_period=self.this_period_qty,
+            remaining=self.remaining_qty,
+        )
+
+    @property
+    def cost_variance(self) -> float:
+        """Cost at completion less budgeted cost, rounded to cents"""
+        return round(self.actual_cost + self.remaining_cost - self.budget_cost, 2)
+
+
+class ResourceRollup:
+    """
+    A class to represent the resource assignments of a schedule totalled
+    by each breakdown in a single pass.
+
+    Groups are keyed by the id or code column of the assignment, so an
+    assignment without an account is totalled under None. WBS totals only
+    include the tasks assigned directly to each node.
+
+    ...
+
+    Attributes
+    ----------
+    total : RollupTotals
+        Totals of every assignment
+    by_assignment : dict[str, RollupTotals]
+        Totals of each assignment keyed by taskrsrc_id
+    by_resource : dict[str, RollupTotals]
+        Totals keyed by rsrc_id
+    by_type : dict[str, RollupTotals]
+        Totals keyed by rsrc_type (RT_Labor, RT_Mat, RT_Equip)
+    by_account : dict[Optional[str], RollupTotals]
+        Totals keyed by acct_id
+    by_wbs : dict[str, RollupTotals]
+        Totals keyed by the wbs_id of the task
+    by_task : dict[str, RollupTotals]
+        Totals keyed by task_id
+    """
+
+    def __init__(self, resources: Iterable[TaskResource]) -> None:
+        self.by_assignment: dict[str, RollupTotals] = {}
+        rows = []
+        resource_rows, type_rows, account_rows, wbs_rows, task_rows = (
+            defaultdict(list) for _ in range(5)
+        )
+        for res in resources:
+            attr, task = res._attr, res.task
+            budget = attr["target_cost"]
+            values = (
+                budget,
+                attr["act_reg_cost"] + attr["act_ot_cost"],
+                attr["act_this_per_cost"],
+                attr["remain_cost"],
+                attr["target_qty"],
+                attr["act_reg_qty"] + attr["act_ot_qty"],
+                attr["act_this_per_qty"],
+                attr["remain_qty"],
+                budget * task.percent_complete,
+            )
+            rows.append(values)
+            self.by_assignment[attr["taskrsrc_id"]] = RollupTotals(*values, 1)
+            resource_rows[attr["rsrc_id"]].append(values)
+            type_rows[attr["rsrc_type"]].append(values)
+            account_rows[attr["acct_id"]].append(values)
+            wbs_rows[task["wbs_id"]].append(values)
+            task_rows[task["task_id"]].append(values)
+
+        # columns are summed in assignment order, as a sum() per field would
+        self.total = _totals(rows)
+        self.by_resource = _group_totals(resource_rows)
+        self.by_type = _group_totals(type_rows)
+        self.by_account = _group_totals(account_rows)
+        self.by_wbs = _group_totals(wbs_rows)
+        self.by_task = _group_totals(task_rows)
+
+
+def _group_totals(grouped_rows: dict) -> dict:
+    """Totals of the value rows of each group"""
+    return {key: _totals(rows) for key, rows in grouped_rows.items()}
+
+
+def _totals(rows: list[tuple]) -> RollupTotals:
+    """Totals of the value rows of a group of assignments"""
+    if len(rows) == 1:
+        # most tasks have a single assignment
+        return RollupTotals(*rows[0], 1)
+    if not rows:
+        return RollupTotals()
+
+    return RollupTotals(*map(sum, zip(*rows)), len(rows))
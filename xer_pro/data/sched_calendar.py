@@ -5,10 +5,13 @@ Represents Calendar object parsed from an .xer file generated by
 Primavera P6.
 """
 
-from datetime import datetime, timedelta, time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate, compress
 import re
 from dataclasses import dataclass, field
-from typing import Iterator
+from typing import Iterator, Mapping, Optional
 
 from xer_pro.services.calendar_services import (
     calc_time_var_hrs,
@@ -39,6 +42,17 @@ REGEX_HOUR = r"[0-2]?\d:[0-5]\d"
 REGEX_HOL = r"(?<=d\|)\d{5}(?=\)\(\))"
 REGEX_EXCEPT = r"(?<=d\|)\d{5}\)\([^\)]{1}.+?\(\)\)\)"
 
+# Days compiled on each side of the dates a calendar is asked about
+COMPILE_MARGIN_DAYS = 366
+
+# Calendar days searched for work time before a calendar is deemed empty
+MAX_SEARCH_DAYS = 3660
+
+MINUTES_PER_DAY = 1440
+
+# Each whole minute of a day as a timedelta; building one from minutes is slow
+MINUTE_DELTAS = tuple(timedelta(minutes=m) for m in range(MINUTES_PER_DAY + 1))
+
 # Reference https://en.wikipedia.org/wiki/ANSI_escape_code#Colors
 TERM_COLORS = {
     "CYAN_FG": "\033[38;5;51m",
@@ -156,9 +170,16 @@ class SchedCalendar:
         Only returns valid workdays.
     """
 
-    def __init__(self, **kwargs) -> None:
-        self._data = kwargs
+    # Columns of the CALENDAR table read by the class and by Schedule
+    COLUMNS = frozenset(
+        {"clndr_id", "clndr_name", "clndr_type", "clndr_data", "proj_id"}
+    )
+
+    def __init__(self, row: Optional[Mapping] = None, **kwargs) -> None:
+        self._data = row if row is not None else {}
+        self._data.update(kwargs)
         self.assignments = 0
+        self._compiled = None
 
     def __getitem__(self, name: str):
         return self._data[name]
@@ -238,6 +259,194 @@ class SchedCalendar:
         return self._data["exceptions"]
 
 
+class CompiledCalendar:
+    """
+    A class to represent the days of a calendar over a window of dates as
+    dense per-day tables indexed by date ordinal.
+
+    The tables are built once from the work week, holidays and work
+    exceptions, so a date lookup is an index instead of a search.
+
+    ...
+
+    Attributes
+    ----------
+    first: int
+        Ordinal of the first date in the window
+    last: int
+        Ordinal of the last date in the window
+    work: bytearray
+        1 if the date is a workday, 0 if not
+    hours: array[float]
+        Work hours on the date, 0 on a non-work day
+    shifts: list[WeekDay | None]
+        Work week day or work exception that holds the shifts of the date,
+        whether or not the date is a holiday
+    holidays: frozenset[datetime]
+        Non-work exceptions of the calendar
+    workday_ordinals: array[int]
+        Ordinals of the workdays of the window in order
+    workday_hours: list[float]
+        Work hours of each date in workday_ordinals
+    periods: list[tuple[tuple[int, int], ...]]
+        Work periods of each date as (start, end) minutes after midnight,
+        empty on a non-work day
+    cumulative: array[float]
+        Work minutes from the start of the window to the start of each
+        date, with one more entry for the end of the window
+    """
+
+    def __init__(self, clndr: SchedCalendar, first: int, last: int) -> None:
+        self.first = first
+        self.last = last
+        self.holidays = frozenset(clndr.holidays)
+        days = last - first + 1
+
+        # work week from the weekday of the first date; ordinal 1 is a
+        # Monday and WEEKDAYS starts on Sunday
+        work_week = clndr.work_week
+        week = [work_week.get(WEEKDAYS[(first + i) % 7]) for i in range(7)]
+        week_totals = [_day_totals(work_day) for work_day in week]
+
+        # repeat the week over the window, then set the dates of the
+        # exceptions and holidays in it
+        repeat = days // 7 + 1
+        self.shifts = (week * repeat)[:days]
+        work = ([1 if work_day else 0 for work_day in week] * repeat)[:days]
+        hours, self.periods, minutes = (
+            (list(column) * repeat)[:days] for column in zip(*week_totals)
+        )
+        patches = [
+            (day.toordinal() - first, work_day, 1, _day_totals(work_day))
+            for day, work_day in clndr.work_exceptions.items()
+        ]
+        patches.extend(
+            (day.toordinal() - first, None, 0, (0.0, (), 0)) for day in self.holidays
+        )
+        for i, work_day, is_work, totals in patches:
+            if 0 <= i < days:
+                if work_day is not None:
+                    self.shifts[i] = work_day
+                work[i] = is_work
+                hours[i], self.periods[i], minutes[i] = totals
+
+        self.work = bytearray(work)
+        self.hours = array("d", hours)
+        self.cumulative = array("d", accumulate(minutes, initial=0))
+        self.workday_ordinals = array("l", compress(range(first, last + 1), work))
+        self.workday_hours = list(compress(hours, work))
+        # _workday_rank[i] is the number of workdays before day i
+        self._workday_rank = array("l", accumulate(work, initial=0))
+
+    def workdays(self, days: slice) -> list[datetime]:
+        """Dates of a slice of workday_ordinals"""
+        return list(map(datetime.fromordinal, self.workday_ordinals[days]))
+
+    def covers(self, first: int, last: int) -> bool:
+        """Window includes every date between two ordinals"""
+        return self.first <= first and last <= self.last
+
+    def index(self, date_to_find: datetime) -> int:
+        """Position of a date in the per-day tables"""
+        return date_to_find.toordinal() - self.first
+
+    def work_minutes_at(self, date_to_find: datetime) -> float:
+        """Work minutes from the start of the window to a date and time"""
+        i = self.index(date_to_find)
+        minute = _minute_of_day(date_to_find)
+        total = self.cumulative[i]
+        for start, end in self.periods[i]:
+            if minute <= start:
+                break
+            total += min(end, minute) - start
+
+        return total
+
+    def add_minutes(self, date_to_add: datetime, minutes: float) -> Optional[datetime]:
+        """Date and time that a number of work minutes starting at a date
+        finish, or with negative minutes, start; None if that is outside
+        the window"""
+        i = date_to_add.toordinal() - self.first
+        if not 0 <= i < len(self.periods):
+            return None
+
+        return self.date_at(self.work_minutes_at(date_to_add) + minutes, minutes > 0)
+
+    def date_at(self, total: float, finish: bool = True) -> Optional[datetime]:
+        """Date and time at a number of work minutes from the start of the
+        window: where the work up to it finishes, or if finish is False,
+        where the work after it starts; None if that is outside the window"""
+        periods, cumulative = self.periods, self.cumulative
+        if finish:
+            if not 0 < total <= cumulative[-1]:
+                return None
+            # day the total is reached in: cumulative[i] < total <= [i + 1]
+            i = bisect_left(cumulative, total) - 1
+            left = total - cumulative[i]
+            for start, end in periods[i]:
+                if left <= end - start:
+                    break
+                left -= end - start
+        else:
+            if not 0 <= total < cumulative[-1]:
+                return None
+            # day work goes on past the total in: cumulative[i] <= total < [i + 1]
+            i = bisect_right(cumulative, total) - 1
+            left = total - cumulative[i]
+            for start, end in periods[i]:
+                if left < end - start:
+                    break
+                left -= end - start
+
+        return _datetime_at(self.first + i, start + left)
+
+    def workday_range(self, start_date: datetime, end_date: datetime) -> slice:
+        """Slice of workday_ordinals and workday_hours between two dates,
+        inclusive"""
+        return slice(
+            self._workday_rank[self.index(start_date)],
+            self._workday_rank[self.index(end_date) + 1],
+        )
+
+
+def compile_calendar(
+    clndr: SchedCalendar, start_date: datetime, end_date: datetime
+) -> CompiledCalendar:
+    """Compile a calendar over a window that includes two dates.
+
+    The window reaches COMPILE_MARGIN_DAYS past both dates and is kept on
+    the calendar, so later dates near the project window are already
+    compiled. A date outside it recompiles the window with that side grown
+    by at least its width, so a calendar is compiled a few times at most.
+
+    Args:
+        clndr (Calendar): Calendar used to determine workdays and hours
+        start_date (datetime): first date to include
+        end_date (datetime): last date to include
+
+    Returns:
+        CompiledCalendar: per-day tables of the calendar
+    """
+    first, last = start_date.toordinal(), end_date.toordinal()
+    if first > last:
+        first, last = last, first
+
+    compiled = clndr._compiled
+    if compiled is None:
+        first -= COMPILE_MARGIN_DAYS
+        last += COMPILE_MARGIN_DAYS
+    elif not compiled.covers(first, last):
+        grow = max(COMPILE_MARGIN_DAYS, compiled.last - compiled.first)
+        first = first - grow if first < compiled.first else compiled.first
+        last = last + grow if last > compiled.last else compiled.last
+    else:
+        return compiled
+
+    compiled = CompiledCalendar(clndr, max(1, first), min(date.max.toordinal(), last))
+    clndr._compiled = compiled
+    return compiled
+
+
 def _calc_work_hours(
     clndr: SchedCalendar, date_to_calc: datetime, start_time: time, end_time: time
 ) -> float:
@@ -303,11 +512,8 @@ def _get_workday(cldnr: SchedCalendar, date: datetime) -> WeekDay:
 
     Internal to class.
     """
-    clean_date = date.replace(microsecond=0, second=0, minute=0, hour=0)
-    if clean_date in cldnr.work_exceptions.keys():
-        return cldnr.work_exceptions[clean_date]
-
-    return cldnr.work_week.get(f"{clean_date:%A}")
+    compiled = compile_calendar(cldnr, date, date)
+    return compiled.shifts[compiled.index(date)]
 
 
 def _parse_work_week(clndr: SchedCalendar) -> dict[str, WeekDay]:
@@ -400,18 +606,28 @@ def is_workday(clndr: SchedCalendar, date_to_check: datetime) -> bool:
     if not isinstance(date_to_check, datetime):
         raise ValueError("Argument date_to_check must be a datetime object")
 
-    # Clean date to match format stored in holidays and work_exceptions
-    _date = clean_date(date_to_check)
+    compiled = compile_calendar(clndr, date_to_check, date_to_check)
+    return bool(compiled.work[compiled.index(date_to_check)])
+
+
+def hours_on_date(clndr: SchedCalendar, date_to_check: datetime) -> float:
+    """Work hours on a date in a Calendar object
+
+    Args:
+        clndr (Calendar): Calendar used to determine workdays and hours
+        date_to_check (datetime): date to check
 
-    # date is set as a non-workday in the calendar
-    if _date in clndr.holidays:
-        return False
+    Raises:
+        ValueError: argument is not a datetime object
 
-    # date is set as workday exception in the calendar
-    if _date in clndr.work_exceptions.keys():
-        return True
+    Returns:
+        float: work hours of the date; 0 if it is not a workday
+    """
+    if not isinstance(date_to_check, datetime):
+        raise ValueError("Argument date_to_check must be a datetime object")
 
-    return bool(clndr.work_week[f"{date_to_check:%A}"])
+    compiled = compile_calendar(clndr, date_to_check, date_to_check)
+    return compiled.hours[compiled.index(date_to_check)]
 
 
 def iter_nonwork_exceptions(
@@ -437,13 +653,9 @@ def iter_nonwork_exceptions(
 
     # Clean start and end dates to remove time values
     cl_dates = clean_dates(start, end)
+    first, last = min(cl_dates), max(cl_dates)
 
-    check_date = min(cl_dates)
-    while check_date <= max(cl_dates):
-        if check_date in clndr.holidays:
-            yield check_date
-
-        check_date += timedelta(days=1)
+    yield from sorted(day for day in set(clndr.holidays) if first <= day <= last)
 
 
 def iter_workdays(
@@ -466,15 +678,9 @@ def iter_workdays(
     if not isinstance(start_date, datetime) or not isinstance(end_date, datetime):
         raise ValueError("Arguments must be a datetime object")
 
-    # Clean start and end dates to remove time values
-    _dates = clean_dates(start_date, end_date)
-
-    check_date = min(_dates)
-    while check_date <= max(_dates):
-        if is_workday(clndr, check_date):
-            yield check_date
-
-        check_date += timedelta(days=1)
+    start_date, end_date = min(start_date, end_date), max(start_date, end_date)
+    compiled = compile_calendar(clndr, start_date, end_date)
+    yield from compiled.workdays(compiled.workday_range(start_date, end_date))
 
 
 def rem_hours_per_day(
@@ -516,7 +722,9 @@ def rem_hours_per_day(
         return [(clean_date(start_date), round(work_hrs, 3))]
 
     # Get a list of all workdays between the start and end dates
-    date_range = list(iter_workdays(clndr, start_date, end_date))
+    compiled = compile_calendar(clndr, start_date, end_date)
+    workdays = compiled.workday_range(start_date, end_date)
+    date_range = compiled.workdays(workdays)
 
     # edge cases that only 1 valid workday between start date and end date
     # these may never actually occur since the dates are pulled directly from the schedule
@@ -556,11 +764,14 @@ def rem_hours_per_day(
         )
     ]
 
-    # loop through 2nd to 2nd to last day in date range
+    # 2nd to 2nd to last day in date range
     # these would be a full workday
-    for dt in date_range[1 : len(date_range) - 1]:
-        if wd := _get_workday(clndr, dt):
-            rem_hrs.append((dt, round(wd.hours, 3)))
+    middle = slice(workdays.start + 1, max(workdays.start + 1, workdays.stop - 1))
+    rem_hrs.extend(
+        (dt, hours)
+        for dt, hours in zip(compiled.workdays(middle), compiled.workday_hours[middle])
+        if hours
+    )
 
     # calculate work hours for the last day
     rem_hrs.append(
@@ -579,3 +790,133 @@ def rem_hours_per_day(
     )
 
     return rem_hrs
+
+
+def work_hours_between(
+    clndr: SchedCalendar, start_date: datetime, end_date: datetime
+) -> float:
+    """
+    Calculate the work hours between two dates and times from the
+    cumulative work minutes of the compiled calendar, so the cost does not
+    grow with the number of days between them. Shifts that end at midnight
+    run to the end of the day.
+
+    Args:
+        clndr (Calendar): Calendar used to determine workdays and hours
+        start_date (datetime): start of the period
+        end_date (datetime): end of the period
+
+    Raises:
+        ValueError: datetime objects are not passed in as arguments
+
+    Returns:
+        float: work hours rounded to 3 places; negative if end_date is
+        before start_date
+    """
+    if not isinstance(start_date, datetime) or not isinstance(end_date, datetime):
+        raise ValueError("Arguments must be a datetime object")
+
+    compiled = compile_calendar(clndr, start_date, end_date)
+    minutes = compiled.work_minutes_at(end_date)
+    minutes -= compiled.work_minutes_at(start_date)
+    return round(minutes / 60, 3)
+
+
+def add_work_hours(
+    clndr: SchedCalendar, date_to_add: datetime, hours: float
+) -> datetime:
+    """
+    Calculate the date and time that a number of work hours starting at a
+    date finish, or with negative hours, the date and time that work
+    ending at the date starts. The day is found by a binary search of the
+    cumulative work minutes of the compiled calendar.
+
+    Work that ends at the end of a shift finishes then rather than at the
+    start of the next shift; work that starts at the start of a shift
+    starts then rather than at the end of the previous one.
+
+    Args:
+        clndr (Calendar): Calendar used to determine workdays and hours
+        date_to_add (datetime): date and time the work starts, or ends if
+            hours is negative
+        hours (float): work hours to add
+
+    Raises:
+        ValueError: date_to_add is not a datetime object, or the calendar
+            has no work time within MAX_SEARCH_DAYS of the result
+
+    Returns:
+        datetime: date and time the work finishes, or starts
+    """
+    if not isinstance(date_to_add, datetime):
+        raise ValueError("Argument date_to_add must be a datetime object")
+    if hours == 0:
+        return date_to_add
+
+    # widen the window until it holds the target
+    date_ordinal = date_to_add.toordinal()
+    compiled = compile_calendar(clndr, date_to_add, date_to_add)
+    while (result := compiled.add_minutes(date_to_add, hours * 60)) is None:
+        target = compiled.work_minutes_at(date_to_add) + hours * 60
+        if hours > 0:
+            short = target - compiled.cumulative[-1]
+            searched = compiled.last - date_ordinal
+        else:
+            short = -target
+            searched = date_ordinal - compiled.first
+        if searched >= MAX_SEARCH_DAYS:
+            direction = "after" if hours > 0 else "before"
+            raise ValueError(
+                f"No work time in calendar {clndr} {direction} {date_to_add}"
+            )
+
+        # days the missing minutes take at the work rate of the window
+        rate = compiled.cumulative[-1] / (compiled.last - compiled.first + 1)
+        days = searched + 7 + (short / rate if rate else MAX_SEARCH_DAYS)
+        days = min(days, MAX_SEARCH_DAYS)
+        end_date = date_to_add + timedelta(days=days if hours > 0 else -days)
+        compiled = compile_calendar(clndr, date_to_add, end_date)
+
+    return result
+
+
+def _day_totals(work_day: Optional[WeekDay]) -> tuple[float, tuple, int]:
+    """Hours, work periods and work minutes of a WeekDay"""
+    if not work_day:
+        return 0.0, (), 0
+
+    periods = _shift_minutes(work_day)
+    minutes = sum(end - start for start, end in periods)
+    return round(work_day.hours, 3), periods, minutes
+
+
+def _minute_of_day(date_to_split: datetime) -> float:
+    """Minutes after midnight of a datetime"""
+    minute = date_to_split.hour * 60 + date_to_split.minute
+    if date_to_split.second or date_to_split.microsecond:
+        minute += date_to_split.second / 60 + date_to_split.microsecond / 60e6
+
+    return minute
+
+
+def _shift_minutes(work_day: Optional[WeekDay]) -> tuple[tuple[int, int], ...]:
+    """Shifts of a WeekDay as (start, end) minutes after midnight"""
+    if not work_day:
+        return ()
+
+    periods = []
+    for start, end in work_day.shifts:
+        start_min, end_min = start.hour * 60 + start.minute, end.hour * 60 + end.minute
+        # a shift ending at midnight runs to the end of the day
+        periods.append((start_min, end_min or MINUTES_PER_DAY))
+
+    return tuple(sorted(periods))
+
+
+def _datetime_at(ordinal: int, minute: float) -> datetime:
+    """Datetime of a date ordinal and minutes after midnight"""
+    day = datetime.fromordinal(ordinal)
+    if minute == (whole := int(minute)):
+        return day + MINUTE_DELTAS[whole]
+
+    return day + timedelta(minutes=minute)
@@ -1,63 +1,127 @@
 from datetime import datetime, timedelta
 from statistics import mean
-from collections import Counter
-from typing import Iterator, Optional
+from typing import Iterator, Mapping, Optional
 from functools import cached_property
 from xer_pro.data.sched_calendar import SchedCalendar
-from xer_pro.data.wbs import WbsNode
+from xer_pro.data.wbs import WbsNode, WbsTree
 from xer_pro.data.task import Task
+from xer_pro.data.date_index import TaskDateIndex
+from xer_pro.data.task_frame import HAS_NUMPY, TaskFrame
+from xer_pro.data.task_index import STATUS_CODES, TaskIndex
 from xer_pro.data.logic import Relationship
+from xer_pro.data.logic_graph import LogicGraph
 from xer_pro.data.resource import ResourceValues, TaskResource
+from xer_pro.data.rollup import ResourceRollup
 from xer_pro.data.financial import FinancialPeriod, ResourceFinancial
+from xer_pro.data.parse import PROJECT_TABLES, partition_tables
+from xer_pro.data.report import ParseReport, step_timer
+from xer_pro.data.table import LinkedRow
+
+# Tables read by the Schedule class
+SCHEDULE_TABLES = (
+    "CALENDAR",
+    "PROJECT",
+    "PROJWBS",
+    "TASK",
+    "TASKPRED",
+    "RSRC",
+    "ACCOUNT",
+    "TASKRSRC",
+    "FINDATES",
+    "TRSRCFIN",
+)
+
+# Columns kept from the tables the schedule models are built from
+SCHEDULE_COLUMNS = {
+    "CALENDAR": SchedCalendar.COLUMNS,
+    "PROJWBS": WbsNode.COLUMNS,
+    "TASK": Task.COLUMNS,
+    "TASKPRED": Relationship.COLUMNS,
+    "TASKRSRC": TaskResource.COLUMNS,
+    "TRSRCFIN": ResourceFinancial.COLUMNS,
+}
 
 
 class Schedule:
-    def __init__(self, proj_id: str, **tables) -> None:
+    """
+    A class to represent the schedule of one project in a .xer file.
+
+    The tables in PROJECT_TABLES must only hold the rows of the project;
+    build_schedules splits them by project with partition_tables.
+    """
+
+    def __init__(
+        self, proj_id: str, report: Optional[ParseReport] = None, **tables
+    ) -> None:
+        step = step_timer(report)
         self._id = proj_id
         self._project = self._get_project(tables.get("PROJECT", []))
-        self._calendars = {
-            cal["clndr_id"]: SchedCalendar(**cal) for cal in tables.get("CALENDAR", {})
-        }
+
+        with step("calendars") as stats:
+            self._calendars = {
+                cal["clndr_id"]: SchedCalendar(LinkedRow(cal))
+                for cal in tables.get("CALENDAR", {})
+            }
+            stats.items = len(self._calendars)
 
         self._fin_dates = {
-            fin["fin_dates_id"]: FinancialPeriod(**fin)
+            fin["fin_dates_id"]: FinancialPeriod(fin)
             for fin in tables.get("FINDATES", {})
         }
 
-        self._wbs = {
-            wbs["wbs_id"]: WbsNode(**wbs)
-            for wbs in tables.get("PROJWBS", {})
-            if wbs["proj_id"] == proj_id
-        }
+        with step("wbs") as stats:
+            self._wbs = {
+                wbs["wbs_id"]: WbsNode(wbs)
+                for wbs in tables.get("PROJWBS", {})
+            }
 
-        for wbs in self._wbs.values():
-            wbs.parent = self._wbs.get(wbs._attr["parent_wbs_id"])
+            for wbs in self._wbs.values():
+                wbs.parent = self._wbs.get(wbs._attr["parent_wbs_id"])
+            stats.items = len(self._wbs)
 
         self.name = self._get_schedule_name()
 
-        self._tasks = {
-            id: task for id, task in self._generate_tasks(tables.get("TASK", []))
-        }
-        self._logic = {
-            id: rel for id, rel in self._generate_logic(tables.get("TASKPRED", []))
-        }
+        with step("_generate_tasks") as stats:
+            self._tasks = {
+                id: task for id, task in self._generate_tasks(tables.get("TASK", []))
+            }
+            stats.items = len(self._tasks)
+
+        with step("task_index") as stats:
+            self._task_index = TaskIndex(self._tasks.values())
+            stats.items = len(self._task_index)
+        self._date_indexes: dict[frozenset[str], TaskDateIndex] = {}
+
+        with step("_generate_logic") as stats:
+            self._logic = {
+                id: rel
+                for id, rel in self._generate_logic(tables.get("TASKPRED", []))
+            }
+            stats.items = len(self._logic)
+
         self._resources = {r["rsrc_id"]: r for r in tables.get("RSRC", [])}
         self._accounts = {acct["acct_id"]: acct for acct in tables.get("ACCOUNT", [])}
-        self._task_resources = {
-            res["taskrsrc_id"]: res
-            for res in self._generate_resources(tables.get("TASKRSRC", []))
-        }
-        self._financials = {
-            id: fin for id, fin in self._generate_financials(tables.get("TRSRCFIN", []))
-        }
 
-        _cal_counter = Counter([t["clndr_id"] for t in self.tasks()])
-        for cal in self.calendars:
-            cal.assignments = _cal_counter.get(cal["clndr_id"], 0)
+        with step("_generate_resources") as stats:
+            self._task_resources = {
+                res["taskrsrc_id"]: res
+                for res in self._generate_resources(tables.get("TASKRSRC", []))
+            }
+            stats.items = len(self._task_resources)
 
-        _wbs_counter = Counter([t["wbs_id"] for t in self.tasks()])
-        for node in self.wbs:
-            node.assignments = _wbs_counter.get(node["wbs_id"], 0)
+        with step("_generate_financials") as stats:
+            self._financials = {
+                id: fin
+                for id, fin in self._generate_financials(tables.get("TRSRCFIN", []))
+            }
+            stats.items = len(self._financials)
+
+        with step("assignments"):
+            for cal in self.calendars:
+                cal.assignments = len(self._task_index.calendar(cal["clndr_id"]))
+
+            for node in self.wbs:
+                node.assignments = len(self._task_index.wbs(node["wbs_id"]))
 
     def __str__(self) -> str:
         return self.name
@@ -72,12 +136,24 @@ class Schedule:
 
     @cached_property
     def cost(self) -> ResourceValues:
-        return ResourceValues(
-            budget=sum((r.cost.budget for r in self.resources)),
-            actual=sum((r.cost.actual for r in self.resources)),
-            this_period=sum((r.cost.this_period for r in self.resources)),
-            remaining=sum((r.cost.remaining for r in self.resources)),
-        )
+        return self.rollup.total.cost
+
+    def date_index(self, *codes: str) -> TaskDateIndex:
+        """Tasks with any of the status codes indexed by start and finish date.
+        Every task is indexed if no codes are given; each index is built once.
+
+        Args:
+            codes (str): task status codes
+
+        Returns:
+            TaskDateIndex: start and finish index of the tasks
+        """
+        key = frozenset(codes or STATUS_CODES)
+        if (index := self._date_indexes.get(key)) is None:
+            index = TaskDateIndex(self._task_index.status(*key))
+            self._date_indexes[key] = index
+
+        return index
 
     @property
     def data_date(self) -> datetime:
@@ -119,25 +195,27 @@ class Schedule:
 
     def logic(
         self, fs: bool = False, ff: bool = False, ss: bool = False, sf: bool = False
-    ) -> list[Relationship]:
-        """List of Relationship objects included in the schedule"""
-        rels = sorted(
-            self._logic.values(),
-            key=lambda x: [x.predecessor.activity_id, x.successor.activity_id],
-        )
+    ) -> tuple[Relationship]:
+        """Relationship objects included in the schedule, sorted by
+        predecessor then successor activity id"""
         if not any([fs, ff, ss, sf]):
-            return rels
-
-        return [
-            rel
-            for rel in rels
-            if (
-                (rel.link == "FS" and fs)
-                or (rel.link == "FF" and ff)
-                or (rel.link == "SS" and ss)
-                or (rel.link == "SF" and sf)
-            )
-        ]
+            return self.logic_graph.relationships
+
+        flags = zip(("FS", "FF", "SS", "SF"), (fs, ff, ss, sf))
+        return self.logic_graph.by_link(*(link for link, flag in flags if flag))
+
+    @cached_property
+    def logic_graph(self) -> LogicGraph:
+        """Logic network of the schedule with predecessor and successor indexes"""
+        return LogicGraph(self._task_index.all, self._logic.values())
+
+    @cached_property
+    def task_frame(self) -> Optional[TaskFrame]:
+        """Task fields as NumPy columns, or None if NumPy is not installed"""
+        if not HAS_NUMPY:
+            return None
+
+        return TaskFrame(self._task_index.all)
 
     @property
     def must_finish_date(self) -> datetime:
@@ -146,13 +224,16 @@ class Schedule:
 
     @cached_property
     def percent_complete(self) -> float:
-        od_sum = sum((t.original_duration for t in self.tasks()))
-        rd_sum = sum((t.remaining_duration for t in self.tasks()))
+        if self.task_frame is not None:
+            return self.task_frame.percent_complete()
+
+        index = self._task_index
+        od_sum = sum((t.original_duration for t in index.all))
+        rd_sum = sum((t.remaining_duration for t in index.all))
         dur_comp = 1 - (rd_sum / od_sum)
 
-        status_cnt = Counter([t.status for t in self.tasks()])
-        status_comp = (status_cnt["In Progress"] / 2 + status_cnt["Complete"]) / len(
-            self.tasks()
+        status_comp = (index.count("TK_Active") / 2 + index.count("TK_Complete")) / len(
+            index
         )
 
         return mean([dur_comp, status_comp]) * 100
@@ -169,15 +250,25 @@ class Schedule:
             return 0
         return (self.finish - self.data_date).days
 
+    @cached_property
+    def rollup(self) -> ResourceRollup:
+        """Cost and unit totals of the resource assignments by breakdown"""
+        return ResourceRollup(self._task_resources.values())
+
     @property
     def resources(self) -> list[TaskResource]:
         """List of all TaskResource objects included in the schedule"""
         return self._task_resources.values()
 
+    @property
+    def short_name(self) -> str:
+        """Project ID set in the Project settings"""
+        return self._project.get("proj_short_name", "")
+
     @cached_property
     def start(self) -> datetime:
         """Start date of first activity in schedule"""
-        return min((t.start for t in self.tasks()))
+        return min((t.start for t in self._task_index.all))
 
     def tasks(
         self,
@@ -187,21 +278,21 @@ class Schedule:
     ) -> tuple[Task]:
         """List of all Task objects included in the schedule."""
         if not any((not_started, in_progress, completed)):
-            return set(self._tasks.values())
-
-        return tuple(
-            t
-            for t in self._tasks.values()
-            if (
-                (t.is_not_started and not_started)
-                or (t.is_in_progress and in_progress)
-                or (t.is_completed and completed)
-            )
+            return self._task_index.all
+
+        flags = (not_started, in_progress, completed)
+        return self._task_index.status(
+            *(code for code, flag in zip(STATUS_CODES, flags) if flag)
         )
 
+    @property
+    def task_index(self) -> TaskIndex:
+        """Tasks partitioned by status, type, calendar, WBS and longest path"""
+        return self._task_index
+
     @cached_property
     def tasks_by_id(self) -> dict[str, Task]:
-        return {task["task_code"]: task for task in self.tasks()}
+        return {task["task_code"]: task for task in self._task_index.all}
 
     def planned_progress(self, before_date: datetime) -> dict[str, list[Task]]:
         if before_date < self.data_date:
@@ -210,51 +301,44 @@ class Schedule:
             )
 
         progress = dict()
-        progress["planned_start"] = sorted(
-            [
-                task
-                for task in self.tasks()
-                if task.is_not_started and task.start < before_date
-            ],
-            key=lambda t: t.start,
+        progress["planned_start"] = list(
+            self.date_index("TK_NotStart").starting(end=before_date)
         )
 
-        progress["planned_finish"] = sorted(
-            [
-                task
-                for task in self.tasks()
-                if not task.is_completed and task.finish < before_date
-            ],
-            key=lambda t: t.finish,
+        progress["planned_finish"] = list(
+            self.date_index("TK_NotStart", "TK_Active").finishing(end=before_date)
         )
 
         return progress
 
     @cached_property
     def unit_qty(self) -> ResourceValues:
-        return ResourceValues(
-            budget=sum((r.unit_qty.budget for r in self.resources)),
-            actual=sum((r.unit_qty.actual for r in self.resources)),
-            this_period=sum((r.unit_qty.this_period for r in self.resources)),
-            remaining=sum((r.unit_qty.remaining for r in self.resources)),
-        )
+        return self.rollup.total.unit_qty
 
     @property
     def wbs(self) -> list[WbsNode]:
         """List of all Wbs objects included in the schedule"""
         return self._wbs.values()
 
+    @cached_property
+    def wbs_tree(self) -> WbsTree:
+        """WBS nodes as a tree with activity and cost summaries.
+        Call wbs_tree.invalidate after changing the tasks of a node."""
+        return WbsTree(self.wbs, self._task_index.wbs, self.rollup.by_wbs)
+
     @cached_property
     def average_tf(self) -> float:
-        return mean(
-            (t.total_float for t in self.tasks(not_started=True, in_progress=True))
-        )
+        if self.task_frame is not None and self._task_index.open:
+            return float(self.task_frame.open_float().mean())
+
+        return mean((t.total_float for t in self._task_index.open))
 
     @cached_property
     def lowest_tf(self) -> float:
-        return min(
-            (t.total_float for t in self.tasks(not_started=True, in_progress=True))
-        )
+        if self.task_frame is not None and self._task_index.open:
+            return int(self.task_frame.open_float().min())
+
+        return min((t.total_float for t in self._task_index.open))
 
     def group_by_float(
         self, near_critical: int = 20, high_float: int = 50
@@ -269,59 +353,68 @@ class Schedule:
             if tf >= high_float:
                 return "High Float"
 
+        if self.task_frame is not None:
+            return self.task_frame.float_counts(near_critical, high_float)
+
         float = {"Critical": 0, "Near Critical": 0, "Normal Float": 0, "High Float": 0}
 
-        for t in self.tasks(in_progress=True, not_started=True):
+        for t in self._task_index.open:
             float[parse_tf(t.total_float, near_critical, high_float)] += 1
 
         return float
 
     def _generate_tasks(self, table: list) -> dict[str, Task]:
         for row in table:
-            if row["proj_id"] == self._id:
-                row["calendar"] = self._calendars.get(row["clndr_id"])
-                row["wbs"] = self._wbs.get(row["wbs_id"])
-                yield (row["task_id"], Task(**row))
+            row = LinkedRow(
+                row,
+                calendar=self._calendars.get(row["clndr_id"]),
+                wbs=self._wbs.get(row["wbs_id"]),
+            )
+            yield (row["task_id"], Task(row))
 
     def _generate_logic(self, table: list) -> dict[tuple[str, str, str], Relationship]:
         for row in table:
-            if row["pred_proj_id"] == self._id and row["proj_id"] == self._id:
-                pred = self._tasks.get(row["pred_task_id"])
-                succ = self._tasks.get(row["task_id"])
-                yield (
-                    (pred["task_code"], succ["task_code"], row["pred_type"]),
-                    Relationship(pred, succ, **row),
-                )
+            pred = self._tasks.get(row["pred_task_id"])
+            succ = self._tasks.get(row["task_id"])
+            yield (
+                (pred["task_code"], succ["task_code"], row["pred_type"]),
+                Relationship(pred, succ, row),
+            )
 
     def _generate_resources(
         self, table: list
     ) -> dict[tuple[str, str, str], TaskResource]:
         for row in table:
-            if row["proj_id"] == self._id:
-                task: Task = self._tasks.get(row["task_id"])
-                row["task"] = task
-                row["resource"] = self._resources.get(row["rsrc_id"], {})
-                row["calendar"] = self._calendars.get(row["task"]["clndr_id"])
-                row["name"] = row["resource"].get("rsrc_name", "")
-                row["account"] = self._accounts.get(row["acct_id"])
+            task: Task = self._tasks.get(row["task_id"])
+            resource = self._resources.get(row["rsrc_id"], {})
+            row = LinkedRow(
+                row,
+                task=task,
+                resource=resource,
+                calendar=self._calendars.get(task["clndr_id"]),
+                name=resource.get("rsrc_name", ""),
+                account=self._accounts.get(row["acct_id"]),
+            )
 
-                res = TaskResource(**row)
-                yield res
+            res = TaskResource(row)
+            yield res
 
     def _generate_financials(self, table: list) -> dict[tuple[str, ResourceFinancial]]:
         if table:
             for row in table:
-                if row["proj_id"] == self._id:
-                    row["period"] = self._fin_dates[row["fin_dates_id"]]
-                    row["task_resource"] = self._task_resources[row["taskrsrc_id"]]
-                    row["task"] = self._tasks.get(row["task_id"])
-                    id = (
-                        row["period"].name,
-                        row["task"]["task_code"],
-                        row["task_resource"].name,
-                    )
-
-                    yield (id, ResourceFinancial(**row))
+                row = LinkedRow(
+                    row,
+                    period=self._fin_dates[row["fin_dates_id"]],
+                    task_resource=self._task_resources[row["taskrsrc_id"]],
+                    task=self._tasks.get(row["task_id"]),
+                )
+                id = (
+                    row["period"].name,
+                    row["task"]["task_code"],
+                    row["task_resource"].name,
+                )
+
+                yield (id, ResourceFinancial(row))
 
     def _get_project(self, table: list) -> dict:
         for row in table:
@@ -336,6 +429,39 @@ class Schedule:
         return ""
 
 
+def build_schedules(
+    tables: Mapping, report: Optional[ParseReport] = None
+) -> list[Schedule]:
+    """Build a Schedule for every project exported in a .xer file
+
+    The project tables are partitioned by project in one pass, so building
+    all of the schedules takes time linear in the total number of rows.
+
+    Args:
+        tables (Mapping): schedule data tables
+        report (ParseReport, optional): records the time of partitioning the
+            tables and of each step of building the schedules. Defaults to None.
+
+    Returns:
+        list[Schedule]: schedules in the order of the PROJECT table
+    """
+    proj_ids = [p["proj_id"] for p in tables.get("PROJECT", []) if p["export_flag"]]
+    shared = {
+        name: tables[name]
+        for name in SCHEDULE_TABLES
+        if name in tables and name not in PROJECT_TABLES
+    }
+
+    with step_timer(report)("partition_tables") as stats:
+        partitions = partition_tables(tables, proj_ids)
+        stats.items = len(partitions)
+
+    return [
+        Schedule(proj_id, report, **shared, **project_tables)
+        for proj_id, project_tables in partitions.items()
+    ]
+
+
 def _interval_date(date: datetime) -> datetime:
     return datetime(date.year, date.month, 1, 0, 0, 0)
 
@@ -0,0 +1,257 @@
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sequence
+from typing import Any, Optional, Union
+
+
+class LazyTextColumn(list):
+    """A column of text values kept as encoded bytes until they are read.
+
+    A value is decoded the first time it is read and the decoded text
+    replaces the bytes in the column. Searching or comparing the column
+    decodes every value first; other list methods see the raw bytes.
+
+    ...
+
+    Attributes
+    ----------
+    encoding: str
+        Encoding of the raw values
+    """
+
+    def __init__(self, encoding: str, values: Iterable = ()) -> None:
+        super().__init__(values)
+        self.encoding = encoding
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return LazyTextColumn(self.encoding, list.__getitem__(self, index))
+
+        value = list.__getitem__(self, index)
+        if isinstance(value, bytes):
+            value = value.decode("ascii" if value.isascii() else self.encoding)
+            list.__setitem__(self, index, value)
+
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __contains__(self, value: object) -> bool:
+        self._decode_all()
+        return list.__contains__(self, value)
+
+    def __eq__(self, other: object) -> bool:
+        self._decode_all()
+        if isinstance(other, LazyTextColumn):
+            other._decode_all()
+        return list.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def count(self, value: Any) -> int:
+        self._decode_all()
+        return list.count(self, value)
+
+    def index(self, value: Any, *args: int) -> int:
+        self._decode_all()
+        return list.index(self, value, *args)
+
+    def _decode_all(self) -> None:
+        """Decode every value still held as bytes"""
+        for index in range(len(self)):
+            self[index]
+
+    def take(self, indices: Iterable[int]) -> "LazyTextColumn":
+        """New column of the values at the given indices, still encoded"""
+        raw = list.__getitem__
+        return LazyTextColumn(self.encoding, [raw(self, i) for i in indices])
+
+
+def _take(values: list, indices: list[int]) -> list:
+    if isinstance(values, LazyTextColumn):
+        return values.take(indices)
+
+    return [values[i] for i in indices]
+
+
+class XerTable(Sequence):
+    """A class to represent a table parsed from a .xer file.
+
+    Values are stored column by column, one list per column label, so the
+    labels are stored once per table instead of once per row.
+    Indexing or iterating the table returns XerRow views.
+
+    ...
+
+    Attributes
+    ----------
+    columns: dict[str, list]
+        Values of each column keyed by column label
+    """
+
+    def __init__(self, columns: dict[str, list], length: Optional[int] = None) -> None:
+        self.columns = columns
+        if length is None:
+            length = len(next(iter(columns.values()), ()))
+        self._length = length
+
+    def __getitem__(self, index: int) -> "XerRow":
+        if isinstance(index, slice):
+            return self.take(range(self._length)[index])
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("XerTable index out of range")
+
+        return XerRow(self, index)
+
+    def __iter__(self) -> Iterator["XerRow"]:
+        for index in range(self._length):
+            yield XerRow(self, index)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"XerTable({len(self.columns)} columns, {self._length} rows)"
+
+    @property
+    def labels(self) -> list[str]:
+        """Column labels"""
+        return list(self.columns)
+
+    def column(self, label: str) -> list:
+        """Values of a column"""
+        return self.columns[label]
+
+    def take(self, indices: Iterable[int]) -> "XerTable":
+        """New table with only the rows at the given indices
+
+        Args:
+            indices (Iterable[int]): row indices in the order to keep them
+
+        Returns:
+            XerTable: table of the selected rows
+        """
+        indices = list(indices)
+        return XerTable(
+            {label: _take(values, indices) for label, values in self.columns.items()},
+            len(indices),
+        )
+
+    @classmethod
+    def concat(cls, tables: list["XerTable"]) -> "XerTable":
+        """Join tables with the same columns into one table
+
+        Args:
+            tables (list[XerTable]): tables in row order
+
+        Returns:
+            XerTable: table of all the rows
+        """
+        if not tables:
+            return cls({}, 0)
+
+        columns = {
+            label: values.take(()) if isinstance(values, LazyTextColumn) else []
+            for label, values in tables[0].columns.items()
+        }
+        for table in tables:
+            for label, values in table.columns.items():
+                list.extend(columns[label], list.__iter__(values))
+
+        return cls(columns, sum(len(table) for table in tables))
+
+
+class XerRow(MutableMapping):
+    """A view of one row of an XerTable.
+
+    Behaves like the dictionary of the row keyed by column label.
+    A table can be shared by several schedules, so only the values of its
+    columns can be assigned; wrap the row in a LinkedRow to give it values
+    of its own.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: XerTable, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._table.columns
+
+    def __getitem__(self, label: str) -> Any:
+        return self._table.columns[label][self._index]
+
+    def __setitem__(self, label: str, value: Any) -> None:
+        if (column := self._table.columns.get(label)) is None:
+            raise KeyError(f"XerRow can not add the column {label!r} to its table")
+        column[self._index] = value
+
+    def __delitem__(self, label: str) -> None:
+        raise TypeError("XerRow columns can not be deleted")
+
+    def get(self, label: str, default: Any = None) -> Any:
+        # one column lookup instead of the Mapping mixin's try/except
+        if (column := self._table.columns.get(label)) is None:
+            return default
+        return column[self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.columns)
+
+    def __len__(self) -> int:
+        return len(self._table.columns)
+
+    def __repr__(self) -> str:
+        return f"XerRow({dict(self)})"
+
+
+class LinkedRow(MutableMapping):
+    """A row with values of its own on top of a shared row.
+
+    Reads find the values of its own first, then the shared row. Writes
+    only change the values of its own, so the objects a Schedule links to
+    a row are not seen by other schedules built from the same tables.
+    """
+
+    __slots__ = ("_row", "_own")
+
+    def __init__(self, row: Mapping, **values) -> None:
+        self._row = row
+        self._own = values
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._own or label in self._row
+
+    def __getitem__(self, label: str) -> Any:
+        if label in self._own:
+            return self._own[label]
+        return self._row[label]
+
+    def __setitem__(self, label: str, value: Any) -> None:
+        self._own[label] = value
+
+    def __delitem__(self, label: str) -> None:
+        del self._own[label]
+
+    def get(self, label: str, default: Any = None) -> Any:
+        if label in self._own:
+            return self._own[label]
+        return self._row.get(label, default)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._own
+        yield from (label for label in self._row if label not in self._own)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"LinkedRow({dict(self)})"
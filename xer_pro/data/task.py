@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Mapping, Optional
 
 from xer_pro.data.sched_calendar import SchedCalendar, rem_hours_per_day
 from xer_pro.data.wbs import WbsNode
@@ -35,25 +35,93 @@ CONSTRAINTTYPES = {
 
 
 class Task:
-    def __init__(self, **kwargs) -> None:
-        self._attr = kwargs
+    # Columns of the TASK table read by the class and by Schedule
+    COLUMNS = frozenset(
+        {
+            "task_id",
+            "proj_id",
+            "wbs_id",
+            "clndr_id",
+            "task_code",
+            "task_name",
+            "task_type",
+            "status_code",
+            "complete_pct_type",
+            "phys_complete_pct",
+            "driving_path_flag",
+            "cstr_type",
+            "cstr_date",
+            "cstr_type2",
+            "cstr_date2",
+            "act_start_date",
+            "act_end_date",
+            "early_start_date",
+            "early_end_date",
+            "late_start_date",
+            "late_end_date",
+            "restart_date",
+            "reend_date",
+            "target_drtn_hr_cnt",
+            "remain_drtn_hr_cnt",
+            "total_float_hr_cnt",
+            "free_float_hr_cnt",
+            "act_work_qty",
+            "target_work_qty",
+            "act_equip_qty",
+            "target_equip_qty",
+        }
+    )
+
+    # The dates, durations, floats and codes are decoded up front; the text
+    # fields and the rest of the row are read from it when they are asked for
+    __slots__ = (
+        "_attr",
+        "_status",
+        "_type",
+        "activity_id",
+        "start",
+        "finish",
+        "original_duration",
+        "remaining_duration",
+        "total_float",
+        "free_float",
+    )
+
+    def __init__(self, row: Optional[Mapping] = None, **kwargs) -> None:
+        self._attr = attr = row if row is not None else {}
+        self._attr.update(kwargs)
+
+        self._status = status = attr.get("status_code")
+        self._type = attr.get("task_type") or ""
+        self.activity_id = attr.get("task_code")
+        self.original_duration = _hours_to_days(attr.get("target_drtn_hr_cnt"))
+        self.remaining_duration = _hours_to_days(attr.get("remain_drtn_hr_cnt"))
+
+        if status == "TK_NotStart":
+            self.start = attr.get("early_start_date")
+        else:
+            self.start = attr.get("act_start_date")
+        if status == "TK_Complete":
+            self.finish = attr.get("act_end_date")
+            self.total_float = None
+            self.free_float = None
+        else:
+            self.finish = attr.get("early_end_date")
+            self.total_float = _hours_to_days(attr.get("total_float_hr_cnt"))
+            self.free_float = _hours_to_days(attr.get("free_float_hr_cnt"))
 
     def __eq__(self, o: object) -> bool:
-        return self._attr["task_code"] == o._attr["task_code"]
+        return self.activity_id == o.activity_id
 
     def __getitem__(self, name: str):
         return self._attr[name]
 
     def __hash__(self) -> int:
-        return hash(self._attr["task_code"])
+        return hash(self.activity_id)
 
     def __str__(self) -> str:
         return f'{self["task_code"]} - {self["task_name"]}'
 
-    @property
-    def activity_id(self) -> str:
-        return self._attr.get("task_code")
-
     @property
     def calendar(self) -> SchedCalendar:
         return self._attr.get("calendar")
@@ -79,35 +147,21 @@ class Task:
 
         return {"type": CONSTRAINTTYPES[constraint], "date": self._attr["cstr_date2"]}
 
-    @property
-    def finish(self) -> datetime:
-        if self.is_completed:
-            return self._attr["act_end_date"]
-
-        return self._attr["early_end_date"]
-
-    @property
-    def free_float(self) -> Optional[int]:
-        if self.is_completed:
-            return None
-
-        return int(self._attr["free_float_hr_cnt"] / 8)
-
     @property
     def is_completed(self) -> bool:
-        return self._attr.get("status_code") == "TK_Complete"
+        return self._status == "TK_Complete"
 
     @property
     def is_critical(self) -> bool:
-        return not self.completed and self._attr.get("total_float_hr_cnt") <= 0
+        return self.is_open and (self._attr.get("total_float_hr_cnt") or 0) <= 0
 
     @property
     def is_in_progress(self) -> bool:
-        return self._attr.get("status_code") == "TK_Active"
+        return self._status == "TK_Active"
 
     @property
     def is_loe(self) -> bool:
-        return self._attr.get("task_type") == "TT_LOE"
+        return self._type == "TT_LOE"
 
     @property
     def is_longest_path(self) -> bool:
@@ -115,42 +169,35 @@ class Task:
 
     @property
     def is_milestone(self) -> bool:
-        return self._attr.get("task_type").endswith("Mile")
+        return self._type.endswith("Mile")
 
     @property
     def is_not_started(self) -> bool:
-        return self._attr.get("status_code") == "TK_NotStart"
+        return self._status == "TK_NotStart"
 
     @property
     def is_open(self) -> bool:
-        return self._attr.get("status_code") != "TK_Complete"
+        return self._status != "TK_Complete"
 
     @property
     def late_finish(self) -> Optional[datetime]:
-        return self._attr["late_end_date"]
+        return self._attr.get("late_end_date")
 
     @property
     def late_start(self) -> Optional[datetime]:
-        return self._attr["late_start_date"]
+        return self._attr.get("late_start_date")
 
     @property
     def name(self) -> str:
         return self._attr.get("task_name")
 
     @property
-    def original_duration(self) -> int:
-        return int(self._attr["target_drtn_hr_cnt"] / 8)
-
-    @property
-    def percent_type(self) -> str:
-        return PERCENTTYPES[self._attr["complete_pct_type"]]
-
-    @property
-    def percent_complete(self) -> float:
-        if self._attr["complete_pct_type"] == "CP_Phys":
+    def percent_complete(self) -> Optional[float]:
+        pct_type = self._attr.get("complete_pct_type")
+        if pct_type == "CP_Phys":
             return self._attr["phys_complete_pct"] / 100
 
-        if self._attr["complete_pct_type"] == "CP_Drtn":
+        if pct_type == "CP_Drtn":
             if self.is_not_started or self.original_duration == 0:
                 return 0.0
             if self.is_completed:
@@ -160,7 +207,7 @@ class Task:
 
             return 1 - self.remaining_duration / self.original_duration
 
-        if self._attr["complete_pct_type"] == "CP_Units":
+        if pct_type == "CP_Units":
             target_units = (
                 self._attr["target_work_qty"] + self._attr["target_equip_qty"]
             )
@@ -170,30 +217,16 @@ class Task:
             return 1 - actual_units / target_units
 
     @property
-    def remaining_duration(self) -> int:
-        return int(self._attr["remain_drtn_hr_cnt"] / 8)
+    def percent_type(self) -> Optional[str]:
+        return PERCENTTYPES.get(self._attr.get("complete_pct_type"))
 
     @property
-    def start(self) -> datetime:
-        if self.is_not_started:
-            return self._attr["early_start_date"]
-
-        return self._attr["act_start_date"]
+    def status(self) -> Optional[str]:
+        return STATUS.get(self._status)
 
     @property
-    def status(self) -> str:
-        return STATUS[self._attr.get("status_code")]
-
-    @property
-    def total_float(self) -> Optional[int]:
-        if self.is_completed:
-            return None
-
-        return int(self._attr["total_float_hr_cnt"] / 8)
-
-    @property
-    def type(self) -> str:
-        return TASKTYPES[self._attr["task_type"]]
+    def type(self) -> Optional[str]:
+        return TASKTYPES.get(self._type)
 
     @property
     def wbs(self) -> Optional[WbsNode]:
@@ -207,12 +240,17 @@ class Task:
         self._attr["wbs"] = wbs_node
 
     def get_rem_work_days(self) -> list[tuple[datetime, float]]:
-        if self.completed:
+        if self.is_completed:
             return []
 
         if not self.calendar:
             return []
 
         return rem_hours_per_day(
-            self.calendar, self._kwargs["restart_date"], self._kwargs["reend_date"]
+            self.calendar, self._attr["restart_date"], self._attr["reend_date"]
         )
+
+
+def _hours_to_days(hours: Optional[float]) -> int:
+    """Whole 8 hour days in a P6 hour count; a missing count is 0 days"""
+    return int((hours or 0) / 8)
@@ -0,0 +1,109 @@
+from typing import Iterable
+
+from xer_pro.data.task import Task
+from xer_pro.data.task_index import STATUS_CODES
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; Schedule falls back to Python loops
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Float groups in the order their counts are reported
+FLOAT_GROUPS = ("Critical", "Near Critical", "Normal Float", "High Float")
+
+
+class TaskFrame:
+    """
+    A class to represent the tasks of a schedule as NumPy columns.
+
+    Row i of every column is the i-th task passed in. Floats of completed
+    tasks are stored as 0 and masked out with is_open.
+
+    ...
+
+    Attributes
+    ----------
+    status: ndarray[int8]
+        Index of the status code of each task in STATUS_CODES, or -1
+    is_open: ndarray[bool]
+        Task is not complete
+    total_float: ndarray[int64]
+        Total float in days
+    free_float: ndarray[int64]
+        Free float in days
+    original_duration: ndarray[int64]
+        Original duration in days
+    remaining_duration: ndarray[int64]
+        Remaining duration in days
+    """
+
+    def __init__(self, tasks: Iterable[Task]) -> None:
+        if np is None:
+            raise ImportError("NumPy is required to build a TaskFrame")
+
+        tasks = tuple(tasks)
+        codes = {code: i for i, code in enumerate(STATUS_CODES)}
+        # a status outside STATUS_CODES is stored as -1 and counted as open,
+        # the same as TaskIndex keeps it under its own code
+        self.status = np.fromiter(
+            (codes.get(task["status_code"], -1) for task in tasks),
+            np.int8,
+            len(tasks),
+        )
+        self.is_open = self.status != codes["TK_Complete"]
+        self.total_float = _int_column(tasks, "total_float")
+        self.free_float = _int_column(tasks, "free_float")
+        self.original_duration = _int_column(tasks, "original_duration")
+        self.remaining_duration = _int_column(tasks, "remaining_duration")
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def status_count(self, code: str) -> int:
+        """Number of tasks with a status code"""
+        return int(np.count_nonzero(self.status == STATUS_CODES.index(code)))
+
+    def percent_complete(self) -> float:
+        """Mean of the duration and status percent complete of the tasks
+
+        Returns:
+            float: percent complete from 0 to 100
+        """
+        od_sum = int(self.original_duration.sum())
+        rd_sum = int(self.remaining_duration.sum())
+        dur_comp = 1 - (rd_sum / od_sum)
+
+        in_progress = self.status_count("TK_Active")
+        status_comp = (in_progress / 2 + self.status_count("TK_Complete")) / len(self)
+
+        return (dur_comp + status_comp) / 2 * 100
+
+    def open_float(self) -> "np.ndarray":
+        """Total float of the open tasks"""
+        return self.total_float[self.is_open]
+
+    def float_counts(self, near_critical: int, high_float: int) -> dict[str, int]:
+        """Count the open tasks in each float group
+
+        Args:
+            near_critical (int): highest float of a near critical task
+            high_float (int): lowest float of a high float task
+
+        Returns:
+            dict[str, int]: number of tasks keyed by float group
+        """
+        tf = self.open_float()
+        bins = [1, near_critical + 1, high_float]
+        counts = np.bincount(np.digitize(tf, bins), minlength=len(FLOAT_GROUPS))
+
+        return {group: int(count) for group, count in zip(FLOAT_GROUPS, counts)}
+
+
+def _int_column(tasks: tuple[Task], attr: str) -> "np.ndarray":
+    """Integer attribute of each task as an array, with None stored as 0"""
+    return np.fromiter(
+        (getattr(task, attr) or 0 for task in tasks), np.int64, len(tasks)
+    )
+
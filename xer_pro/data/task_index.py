@@ -0,0 +1,105 @@
+from collections import defaultdict
+from itertools import combinations
+from typing import Iterable, Optional
+
+from xer_pro.data.task import Task
+
+# Task status codes in the order tasks are reported
+STATUS_CODES = ("TK_NotStart", "TK_Active", "TK_Complete")
+
+# Pairs of status codes that tasks are filtered by
+STATUS_PAIRS = tuple(frozenset(pair) for pair in combinations(STATUS_CODES, 2))
+
+
+class TaskIndex:
+    """
+    A class to represent the tasks of a schedule partitioned by key.
+
+    The partitions are built in a single pass over the tasks and hold
+    immutable tuples in the original task order, so filtering the tasks of
+    a schedule never scans every task again.
+
+    ...
+
+    Attributes
+    ----------
+    all: tuple[Task]
+        Every task in the schedule
+    by_status: dict[str, tuple[Task]]
+        Tasks keyed by status code (TK_NotStart, TK_Active, TK_Complete)
+    by_type: dict[str, tuple[Task]]
+        Tasks keyed by task type code (TT_Task, TT_Mile, ...)
+    by_calendar: dict[str, tuple[Task]]
+        Tasks keyed by calendar id
+    by_wbs: dict[str, tuple[Task]]
+        Tasks keyed by WBS node id
+    longest_path: tuple[Task]
+        Tasks flagged as being on the longest path
+    """
+
+    def __init__(self, tasks: Iterable[Task]) -> None:
+        self.all = tuple(tasks)
+
+        by_status = defaultdict(list)
+        by_status_pair = {pair: [] for pair in STATUS_PAIRS}
+        by_type = defaultdict(list)
+        by_calendar = defaultdict(list)
+        by_wbs = defaultdict(list)
+        longest_path = []
+        for task in self.all:
+            status = task["status_code"]
+            by_status[status].append(task)
+            for pair, tasks in by_status_pair.items():
+                if status in pair:
+                    tasks.append(task)
+            by_type[task["task_type"]].append(task)
+            by_calendar[task["clndr_id"]].append(task)
+            by_wbs[task["wbs_id"]].append(task)
+            if task.is_longest_path:
+                longest_path.append(task)
+
+        self.by_status = {code: tuple(tasks) for code, tasks in by_status.items()}
+        self.by_type = {code: tuple(tasks) for code, tasks in by_type.items()}
+        self.by_calendar = {key: tuple(tasks) for key, tasks in by_calendar.items()}
+        self.by_wbs = {key: tuple(tasks) for key, tasks in by_wbs.items()}
+        self.longest_path = tuple(longest_path)
+        self._status_pairs = {pair: tuple(t) for pair, t in by_status_pair.items()}
+
+    def __len__(self) -> int:
+        return len(self.all)
+
+    def status(self, *codes: str) -> tuple[Task]:
+        """Tasks with any of the status codes, in the original task order
+
+        Args:
+            codes (str): task status codes
+
+        Returns:
+            tuple[Task]: tasks with one of the status codes
+        """
+        key = frozenset(codes)
+        if len(key) == 1:
+            return self.by_status.get(codes[0], ())
+        if key in self._status_pairs:
+            return self._status_pairs[key]
+        if key.issuperset(self.by_status):
+            return self.all
+
+        return tuple(task for task in self.all if task["status_code"] in key)
+
+    @property
+    def open(self) -> tuple[Task]:
+        """Tasks that are not started or in progress"""
+        return self.status("TK_NotStart", "TK_Active")
+
+    def count(self, code: str) -> int:
+        """Number of tasks with a status code"""
+        return len(self.by_status.get(code, ()))
+
+    def calendar(self, clndr_id: Optional[str]) -> tuple[Task]:
+        """Tasks assigned to a calendar"""
+        return self.by_calendar.get(clndr_id, ())
+
+    def wbs(self, wbs_id: Optional[str]) -> tuple[Task]:
+        """Tasks assigned directly to a WBS node"""
+        return self.by_wbs.get(wbs_id, ())
@@ -1,4 +1,7 @@
-from typing import Iterator
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Mapping, Optional
 
 
 class WbsNode:
@@ -14,24 +17,41 @@ class WbsNode:
         Short name for WBS node
     is_project_node: bool
         Flags if node is Project Node
+    short_name_path: str
+        Short names of the node and its ancestors below the Project Node
+    long_name_path: str
+        Long names of the node and its ancestors below the Project Node
     """
 
-    def __init__(self, **kwargs) -> None:
-        self._attr = kwargs
+    # Columns of the PROJWBS table read by the class and by Schedule
+    COLUMNS = frozenset(
+        {
+            "wbs_id",
+            "proj_id",
+            "parent_wbs_id",
+            "proj_node_flag",
+            "wbs_name",
+            "wbs_short_name",
+        }
+    )
+
+    def __init__(self, row: Optional[Mapping] = None, **kwargs) -> None:
+        self._attr = row if row is not None else {}
+        self._attr.update(kwargs)
         self.parent = None
         self.assignments = 0
+        self._paths = None
 
     def __getitem__(self, name: str):
         return self._attr[name]
 
     def __eq__(self, __o: object) -> bool:
-        self_path = WbsLinkedList(self)
-        other_path = WbsLinkedList(__o)
-        return self_path.short_name_path(False) == other_path.short_name_path(False)
+        if not isinstance(__o, WbsNode):
+            return NotImplemented
+        return self.short_name_path == __o.short_name_path
 
     def __hash__(self) -> int:
-        self_path = WbsLinkedList(self)
-        return self_path.short_name_path(False)
+        return hash(self.short_name_path)
 
     @property
     def name(self) -> str:
@@ -45,6 +65,44 @@ class WbsNode:
     def is_project_node(self) -> bool:
         return self._attr["proj_node_flag"]
 
+    @property
+    def short_name_path(self) -> str:
+        """Short names from the top of the WBS down to the node, joined by
+        '.'. The project node is left out."""
+        return self._get_paths()[0]
+
+    @property
+    def long_name_path(self) -> str:
+        """Names from the top of the WBS down to the node, joined by '.'.
+        The project node is left out."""
+        return self._get_paths()[1]
+
+    def _get_paths(self) -> tuple[str, str]:
+        # Paths are built once, top-down from the parent's paths, so each
+        # node of a schedule is joined once however often it is hashed or
+        # compared. Parents must be linked before the first read.
+        if self._paths is None:
+            missing = []
+            node = self
+            while node is not None and node._paths is None:
+                missing.append(node)
+                node = node.parent
+
+            for node in reversed(missing):
+                parent = node.parent
+                if node.is_project_node:
+                    node._paths = ("", "")
+                elif parent is None or parent.is_project_node:
+                    node._paths = (sys.intern(node.short_name), node.name)
+                else:
+                    short_path, long_path = parent._paths
+                    node._paths = (
+                        sys.intern(f"{short_path}.{node.short_name}"),
+                        f"{long_path}.{node.name}",
+                    )
+
+        return self._paths
+
 
 class WbsLinkedList:
     def __init__(self, tail: WbsNode = None) -> None:
@@ -76,3 +134,169 @@ class WbsLinkedList:
             reversed([node.name for node in self.iter_path(include_proj_node)])
         )
         return long_path
+
+
+@dataclass
+class WbsSummary:
+    """
+    A class to represent the activities and cost of a WBS node and every
+    node below it.
+
+    ...
+
+    Attributes
+    ----------
+    status_counts: dict[str, int]
+        Number of activities keyed by status code
+    start: datetime | None
+        Earliest activity start
+    finish: datetime | None
+        Latest activity finish
+    min_total_float: int | None
+        Lowest total float of the open activities
+    budget_cost: float
+        Budgeted cost of the resource assignments
+    remaining_cost: float
+        Remaining cost of the resource assignments
+    """
+
+    status_counts: dict[str, int] = field(default_factory=dict)
+    start: Optional[datetime] = None
+    finish: Optional[datetime] = None
+    min_total_float: Optional[int] = None
+    budget_cost: float = 0.0
+    remaining_cost: float = 0.0
+
+    @property
+    def activities(self) -> int:
+        return sum(self.status_counts.values())
+
+    def add_task(self, task) -> None:
+        """Count a task assigned to the node"""
+        status = task["status_code"]
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self._add_dates(task.start, task.finish, task.total_float)
+
+    def merge(self, other: "WbsSummary") -> None:
+        """Add the totals of a child node"""
+        for status, count in other.status_counts.items():
+            self.status_counts[status] = self.status_counts.get(status, 0) + count
+        self._add_dates(other.start, other.finish, other.min_total_float)
+        self.budget_cost += other.budget_cost
+        self.remaining_cost += other.remaining_cost
+
+    def _add_dates(
+        self,
+        start: Optional[datetime],
+        finish: Optional[datetime],
+        total_float: Optional[int],
+    ) -> None:
+        if start is not None and (self.start is None or start < self.start):
+            self.start = start
+        if finish is not None and (self.finish is None or finish > self.finish):
+            self.finish = finish
+        if total_float is not None and (
+            self.min_total_float is None or total_float < self.min_total_float
+        ):
+            self.min_total_float = total_float
+
+
+class WbsTree:
+    """
+    A class to represent the WBS nodes of a schedule as a tree with a
+    summary of every node.
+
+    Summaries are calculated bottom-up in one post-order pass the first
+    time one is read and kept until invalidate is called. Invalidating a
+    node only recalculates that node and its ancestors.
+
+    The tree reads the tasks assigned directly to a node through the tasks
+    callable and the budget_cost and remaining_cost of a node from costs,
+    such as ResourceRollup.by_wbs.
+
+    ...
+
+    Attributes
+    ----------
+    roots: list[WbsNode]
+        Nodes without a parent in the schedule
+    children: dict[str, list[WbsNode]]
+        Child nodes keyed by the wbs_id of the parent
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[WbsNode],
+        tasks: Callable[[str], Iterable],
+        costs: Optional[Mapping] = None,
+    ) -> None:
+        self._tasks = tasks
+        self._costs = costs if costs is not None else {}
+        self._nodes = {node["wbs_id"]: node for node in nodes}
+        self._summaries: dict[str, WbsSummary] = {}
+        self.roots = []
+        self.children = {wbs_id: [] for wbs_id in self._nodes}
+        for node in self._nodes.values():
+            if node.parent is None:
+                self.roots.append(node)
+            else:
+                self.children[node.parent["wbs_id"]].append(node)
+
+        self._post_order = self._get_post_order()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def summary(self, wbs_id: str) -> WbsSummary:
+        """Summary of a node and every node below it"""
+        if wbs_id not in self._summaries:
+            self._calculate()
+        return self._summaries[wbs_id]
+
+    def invalidate(self, *wbs_ids: str) -> None:
+        """Drop the summaries of nodes and their ancestors so they are
+        recalculated when next read. Every summary is dropped if no ids are
+        given.
+
+        Args:
+            wbs_ids (str): ids of the nodes whose tasks or costs changed
+        """
+        if not wbs_ids:
+            self._summaries.clear()
+            return
+
+        for wbs_id in wbs_ids:
+            node = self._nodes.get(wbs_id)
+            while node is not None:
+                self._summaries.pop(node["wbs_id"], None)
+                node = node.parent
+
+    def _calculate(self) -> None:
+        # children come before their parent, so a missing summary only
+        # needs its own tasks and the summaries of its children
+        for node in self._post_order:
+            wbs_id = node["wbs_id"]
+            if wbs_id in self._summaries:
+                continue
+
+            summary = WbsSummary()
+            for task in self._tasks(wbs_id):
+                summary.add_task(task)
+            if (cost := self._costs.get(wbs_id)) is not None:
+                summary.budget_cost += cost.budget_cost
+                summary.remaining_cost += cost.remaining_cost
+            for child in self.children[wbs_id]:
+                summary.merge(self._summaries[child["wbs_id"]])
+            self._summaries[wbs_id] = summary
+
+    def _get_post_order(self) -> list[WbsNode]:
+        order = []
+        stack = list(self.roots)
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(self.children[node["wbs_id"]])
+
+        # reversed pre-order visits every child before its parent
+        order.reverse()
+        return order
@@ -4,7 +4,7 @@ from xer_pro.data.logic import Relationship
 from xer_pro.data.resource import TaskResource
 from xer_pro.data.schedule import Schedule
 from xer_pro.data.task import Task
-from xer_pro.data.wbs import WbsLinkedList, WbsNode
+from xer_pro.data.wbs import WbsNode
 from xer_pro.data.sched_calendar import SchedCalendar
 
 
@@ -59,12 +59,9 @@ def get_task_changes(schedule: Schedule, other_schedule: Schedule) -> dict[str,
         if task.calendar != other.calendar:
             changes["act_calendar"].append((task, other))
 
-        task_wbs = WbsLinkedList(task.wbs)
-        other_wbs = WbsLinkedList(other.wbs)
-
-        if task_wbs != other_wbs:
+        if task.wbs != other.wbs:
             changes["act_wbs"].append(
-                (task, task_wbs.short_name_path(), other_wbs.short_name_path())
+                (task, task.wbs.short_name_path, other.wbs.short_name_path)
             )
 
         if task._attr["task_type"] != other._attr["task_type"]:
@@ -185,16 +182,18 @@ def get_wbs_changes(
     wbs_changes = defaultdict(list)
 
     wbs_node_by_path = {
-        WbsLinkedList(wbs): wbs for wbs in wbs_nodes if not wbs.is_project_node
+        wbs.short_name_path: wbs for wbs in wbs_nodes if not wbs.is_project_node
     }
 
     other_wbs_node_by_path = {
-        WbsLinkedList(wbs): wbs for wbs in other_wbs_nodes if not wbs.is_project_node
+        wbs.short_name_path: wbs
+        for wbs in other_wbs_nodes
+        if not wbs.is_project_node
     }
 
     wbs_changes["added_wbs"] = sorted(
         [
-            (path.short_name_path(), node)
+            (path, node)
             for path, node in wbs_node_by_path.items()
             if path not in other_wbs_node_by_path
         ],
@@ -202,7 +201,7 @@ def get_wbs_changes(
     )
 
     wbs_changes["deleted_wbs"] = [
-        (path.short_name_path(), node)
+        (path, node)
         for path, node in other_wbs_node_by_path.items()
         if path not in wbs_node_by_path
     ]
@@ -212,7 +211,7 @@ def get_wbs_changes(
             if node.name != other_node.name:
                 wbs_changes["revised_wbs_name"].append(
                     (
-                        path.short_name_path(),
+                        path,
                         node,
                         other_node,
                         fuzz.ratio(node.name, other_node.name),
@@ -2,7 +2,7 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 
 from xer_pro.data.schedule import Schedule
-from xer_pro.data.task import Task
+from xer_pro.data.task import STATUS, Task
 from xer_pro.data.logic import Relationship
 from xer_pro.data.resource import TaskResource
 from xer_pro.data.sched_calendar import rem_hours_per_day
@@ -143,20 +143,20 @@ def parse_schedule_work_flow(
     _ls = defaultdict(int)
     _lf = defaultdict(int)
 
-    for task in schedule.tasks():
-        if start <= task.start <= finish:
-            if task.is_not_started:
-                _es[_interval_date(task.start)] += 1
-                _ls[_interval_date(task.late_start)] += 1
-            else:
-                _as[_interval_date(task.start)] += 1
+    index = schedule.date_index()
+    for task in index.starting(start, finish, inclusive=True):
+        if task.is_not_started:
+            _es[_interval_date(task.start)] += 1
+            _ls[_interval_date(task.late_start)] += 1
+        else:
+            _as[_interval_date(task.start)] += 1
 
-        if start <= task.finish <= finish:
-            if task.is_completed:
-                _af[_interval_date(task.finish)] += 1
-            else:
-                _ef[_interval_date(task.finish)] += 1
-                _lf[_interval_date(task.late_finish)] += 1
+    for task in index.finishing(start, finish, inclusive=True):
+        if task.is_completed:
+            _af[_interval_date(task.finish)] += 1
+        else:
+            _ef[_interval_date(task.finish)] += 1
+            _lf[_interval_date(task.late_finish)] += 1
 
     return [
         _new_data_set(
@@ -199,43 +199,43 @@ def parse_schedule_work_flow(
 
 
 def group_by_status(schedule: Schedule) -> dict[str, list[Task]]:
-    status = defaultdict(list)
-    for t in schedule.tasks:
-        status[t.status].append(t)
-
-    return status
+    return {
+        STATUS[code]: list(tasks)
+        for code, tasks in schedule.task_index.by_status.items()
+    }
 
 
 def _parse_float_counts(
-    tasks: list[Task], near_critical: int, high_float: int
+    schedule: Schedule, near_critical: int, high_float: int
 ) -> dict[str, int]:
+    if schedule.task_frame is not None:
+        return schedule.task_frame.float_counts(near_critical, high_float)
+
     float_counts = defaultdict(int)
 
-    for task in tasks:
-        if task.is_completed:
-            continue
+    for task in schedule.task_index.open:
         tf = task.total_float
         if tf <= 0:
             float_counts["Critical"] += 1
         elif 0 < tf <= near_critical:
             float_counts["Near Critical"] += 1
-        elif near_critical < tf <= high_float:
+        elif near_critical < tf < high_float:
             float_counts["Normal Float"] += 1
-        elif tf > high_float:
+        elif tf >= high_float:
             float_counts["High Float"] += 1
 
     return float_counts
 
 
 def parse_float_chart_data(
-    curr_tasks: list[Task],
-    prev_tasks: list[Task],
+    curr_schedule: Schedule,
+    prev_schedule: Schedule,
     near_critical: int = 20,
     high_float: int = 50,
 ) -> dict:
 
-    curr_counts = _parse_float_counts(curr_tasks, near_critical, high_float)
-    prev_counts = _parse_float_counts(prev_tasks, near_critical, high_float)
+    curr_counts = _parse_float_counts(curr_schedule, near_critical, high_float)
+    prev_counts = _parse_float_counts(prev_schedule, near_critical, high_float)
 
     return {
         "labels": ["Current", "Previous"],
@@ -277,9 +277,10 @@ def parse_float_chart_data(
 
 
 def parse_status_chart_data(
-    curr_tasks: list[Task],
-    prev_tasks: list[Task],
+    curr_schedule: Schedule,
+    prev_schedule: Schedule,
 ) -> dict:
+    curr_index, prev_index = curr_schedule.task_index, prev_schedule.task_index
 
     return {
         "labels": ["Current", "Previous"],
@@ -287,24 +288,24 @@ def parse_status_chart_data(
             {
                 "label": "Complete",
                 "data": [
-                    sum((task.is_completed for task in curr_tasks)),
-                    sum((task.is_completed for task in prev_tasks)),
+                    curr_index.count("TK_Complete"),
+                    prev_index.count("TK_Complete"),
                 ],
                 "backgroundColor": [COLORS["PRIMARY"]],
             },
             {
                 "label": "In Progress",
                 "data": [
-                    sum((task.is_in_progress for task in curr_tasks)),
-                    sum((task.is_in_progress for task in prev_tasks)),
+                    curr_index.count("TK_Active"),
+                    prev_index.count("TK_Active"),
                 ],
                 "backgroundColor": [COLORS["SUCCESS"]],
             },
             {
                 "label": "Not Started",
                 "data": [
-                    sum((task.is_not_started for task in curr_tasks)),
-                    sum((task.is_not_started for task in prev_tasks)),
+                    curr_index.count("TK_NotStart"),
+                    prev_index.count("TK_NotStart"),
                 ],
                 "backgroundColor": [COLORS["DANGER"]],
             },
@@ -321,20 +322,16 @@ def group_by_link(self) -> dict[str, list[Relationship]]:
 
 
 def get_tasks_in_time_frame(
-    tasks: list[Task], start_date: datetime, end_date: datetime
+    schedule: Schedule, start_date: datetime, end_date: datetime
 ) -> dict[str, list[Task]]:
     tasks_in_time_frame = dict()
-    tasks_in_time_frame["planned_start"] = [
-        task
-        for task in tasks
-        if task.is_not_started and start_date <= task.start < end_date
-    ]
+    tasks_in_time_frame["planned_start"] = list(
+        schedule.date_index("TK_NotStart").starting(start_date, end_date)
+    )
 
-    tasks_in_time_frame["planned_finish"] = [
-        task
-        for task in tasks
-        if not task.is_completed and start_date <= task.finish < end_date
-    ]
+    tasks_in_time_frame["planned_finish"] = list(
+        schedule.date_index("TK_NotStart", "TK_Active").finishing(start_date, end_date)
+    )
 
     return tasks_in_time_frame
 
@@ -1,5 +1,6 @@
+from functools import lru_cache
+
 from xer_pro.data.task import Task
-from xer_pro.data.wbs import WbsLinkedList
 
 ADMIN_VERBS = (
     "submit",
@@ -39,6 +40,15 @@ CONSTRUCTION_VERBS = (
 )
 
 
+@lru_cache(maxsize=4096)
+def _is_admin_wbs(long_name_path: str) -> bool:
+    """Any WBS node in the path is administrative work"""
+    # no verb contains the '.' joining the names, so searching the whole
+    # path matches the same nodes as searching each name
+    wbs_path = long_name_path.lower()
+    return any(verb in wbs_path for verb in ADMIN_VERBS)
+
+
 def is_construction_task(task: Task) -> bool:
     """Determine if Task is construction work.
 
@@ -48,10 +58,8 @@ def is_construction_task(task: Task) -> bool:
     Returns:
         bool: True if is Construction; False if Administrative or Procurement
     """
-    wbs_path = WbsLinkedList(task.wbs)
-    for node in wbs_path.iter_path():
-        if any(verb in node.name.lower() for verb in ADMIN_VERBS):
-            return False
+    if _is_admin_wbs(task.wbs.long_name_path):
+        return False
 
     if task.name.lower().startswith(CONSTRUCTION_VERBS):
         return True
@@ -3,6 +3,7 @@ from datetime import datetime
 from itertools import groupby
 from xer_pro.data.schedule import Schedule
 from xer_pro.data.logic import Relationship
+from xer_pro.data.logic_graph import LINK_CODES, LogicGraph
 from xer_pro.data.task import Task
 from xer_pro.data.resource import TaskResource
 from xer_pro.services.task_services import is_construction_task
@@ -22,14 +23,6 @@ def get_duplicate_names(tasks: list[Task]) -> list[tuple[Task]]:
     return sorted(duplicate_names, key=lambda t: t[0].name)
 
 
-def _sort_pred(rel: Relationship):
-    return (rel.predecessor.activity_id, rel.successor.activity_id)
-
-
-def _sort_succ(rel: Relationship):
-    return (rel.successor.activity_id, rel.predecessor.activity_id)
-
-
 def get_invalid_actual_dates(data_date: datetime, tasks: list[Task]) -> list[Task]:
     invalid_dates = [
         task
@@ -41,21 +34,23 @@ def get_invalid_actual_dates(data_date: datetime, tasks: list[Task]) -> list[Tas
     return invalid_dates
 
 
-def get_duplicate_logic(logic: list[Relationship]) -> list[tuple[Relationship]]:
-    groupby_pred_succ = groupby(sorted(logic, key=_sort_pred), _sort_pred)
+def get_duplicate_logic(graph: LogicGraph) -> list[tuple[Relationship]]:
+    # relationships between the same tasks are adjacent in the successor rows
+    fs_sf = (LINK_CODES["FS"], LINK_CODES["SF"])
+    offsets, targets, links = graph.succ_offsets, graph.succ_targets, graph.links
 
     duplicate_logic = list()
-    for _, group in groupby_pred_succ:
-        if len(rels := tuple(group)) > 1:
-            for rel in rels:
-                if rel.link in ("FS", "SF"):
-                    duplicate_logic.append(rels)
-                    break
-
-    return sorted(
-        duplicate_logic,
-        key=lambda r: (r[0].predecessor.activity_id, r[0].successor.activity_id),
-    )
+    for n in range(len(graph)):
+        start, end = offsets[n], offsets[n + 1]
+        while start < end:
+            stop = start + 1
+            while stop < end and targets[stop] == targets[start]:
+                stop += 1
+            if stop - start > 1 and any(links[e] in fs_sf for e in range(start, stop)):
+                duplicate_logic.append(graph.relationships[start:stop])
+            start = stop
+
+    return duplicate_logic
 
 
 class RedundantLogic:
@@ -76,101 +71,85 @@ class RedundantLogic:
         return hash((self.redundant, self.epoch))
 
 
-def get_redundant_logic(logic: list[Relationship]) -> list[Relationship]:
-    def check_logic(
-        epoch_relationship: Relationship, relationship: Relationship, level: int
-    ):
-        for pred_rel in groupby_successor.get(relationship.successor, []):
-            if pred_rel.predecessor == epoch_relationship.predecessor and (
-                epoch_relationship.link == pred_rel.link
-                or epoch_relationship.link in ("FS", "FF")
-            ):
-                redundant_cache.add(pred_rel)
-                redundant[epoch_relationship].add(
-                    RedundantLogic(epoch_relationship, pred_rel, level)
-                )
-                continue
-
-        next_relationships = groupby_predecessor.get(relationship.successor, [])
-        for succ_rel in next_relationships:
-            if succ_rel in rel_cache:
-                continue
-
-            rel_cache.add(succ_rel)
-            logic_list.append(succ_rel)
-            check_logic(epoch_relationship, succ_rel, level + 1)
-
-    redundant = defaultdict(set)
+def get_redundant_logic(graph: LogicGraph) -> list[Relationship]:
+    # walks the graph by relationship position; edges are positions in
+    # graph.relationships and tasks are graph numbers
+    offsets, targets, links = graph.succ_offsets, graph.succ_targets, graph.links
+    pred_offsets, pred_edges = graph.pred_offsets, graph.pred_edges
+    sources = [n for n in range(len(graph)) for _ in range(graph.out_degree(n))]
+    is_loe = [task.is_loe for task in graph.tasks]
+    fs_ff = (LINK_CODES["FS"], LINK_CODES["FF"])
+
+    def check_logic(epoch: int, edge: int):
+        # depth first in the same order as following each successor in turn;
+        # the caller has already marked the first edge as visited
+        stack = [(edge, 1)]
+        while stack:
+            edge, level = stack.pop()
+            if level > 1:
+                if edge in rel_cache:
+                    continue
+                rel_cache.add(edge)
+
+            target = targets[edge]
+            for pred in pred_edges[pred_offsets[target] : pred_offsets[target + 1]]:
+                if sources[pred] == sources[epoch] and (
+                    links[epoch] == links[pred] or links[epoch] in fs_ff
+                ):
+                    redundant_cache.add(pred)
+                    redundant[epoch].setdefault(pred, level)
+
+            stack.extend(
+                (succ, level + 1)
+                for succ in reversed(range(offsets[target], offsets[target + 1]))
+            )
+
+    redundant = defaultdict(dict)
     redundant_cache = set()
-    groupby_predecessor = {
-        key: list(group)
-        for key, group in groupby(
-            sorted(logic, key=_sort_pred), lambda rel: rel.predecessor
-        )
-    }
 
-    groupby_successor = {
-        key: list(group)
-        for key, group in groupby(
-            sorted(logic, key=_sort_succ), lambda rel: rel.successor
-        )
-    }
-
-    for relationships in groupby_predecessor.values():
-        if len(list(filter(lambda r: not r.successor.is_loe, relationships))) <= 1:
+    for n in range(len(graph)):
+        start, end = offsets[n], offsets[n + 1]
+        if sum(not is_loe[targets[e]] for e in range(start, end)) <= 1:
             continue
         rel_cache = set()
-        logic_list = list()
-        for relationship in relationships:
-            if relationship.successor.is_loe:
+        for epoch in range(start, end):
+            if is_loe[targets[epoch]]:
                 continue
-            for next_relationship in groupby_predecessor.get(
-                relationship.successor, []
-            ):
-                rel_cache.add(next_relationship)
-                logic_list.append(relationship)
-                logic_list.append(next_relationship)
-                check_logic(relationship, next_relationship, 1)
-
-    return {key: val for key, val in redundant.items() if key not in redundant_cache}
+            succ = targets[epoch]
+            for edge in range(offsets[succ], offsets[succ + 1]):
+                rel_cache.add(edge)
+                check_logic(epoch, edge)
+
+    rels = graph.relationships
+    return {
+        rels[epoch]: {
+            RedundantLogic(rels[epoch], rels[pred], level)
+            for pred, level in found.items()
+        }
+        for epoch, found in redundant.items()
+        if epoch not in redundant_cache
+    }
 
 
 def get_open_ends(schedule: Schedule) -> dict[str, list[Task]]:
     open_ends = defaultdict(list)
-    groupby_predecessor = {
-        key: list(group)
-        for key, group in groupby(
-            sorted(schedule.logic(), key=_sort_pred), lambda rel: rel.predecessor
-        )
-    }
-
-    groupby_successor = {
-        key: list(group)
-        for key, group in groupby(
-            sorted(schedule.logic(), key=_sort_succ), lambda rel: rel.successor
-        )
-    }
+    graph = schedule.logic_graph
+    fs_ff = (LINK_CODES["FS"], LINK_CODES["FF"])
+    fs_ss = (LINK_CODES["FS"], LINK_CODES["SS"])
 
     for task in schedule.tasks():
-        if task not in groupby_predecessor:
+        n = graph.number(task)
+        if not graph.out_degree(n):
             open_ends["open_successor"].append(task)
-        else:
-            if not task.is_milestone:
-                for rel in groupby_predecessor.get(task):
-                    if rel.link in ("FS", "FF"):
-                        break
-                else:
-                    open_ends["open_finish"].append(task)
-
-        if task not in groupby_successor:
+        elif not task.is_milestone:
+            if not any(code in fs_ff for code in graph.successor_links(n)):
+                open_ends["open_finish"].append(task)
+
+        if not graph.in_degree(n):
             open_ends["open_predecessor"].append(task)
-        else:
-            if not task.is_milestone:
-                for rel in groupby_successor.get(task):
-                    if rel.link in ("FS", "SS"):
-                        break
-                else:
-                    open_ends["open_start"].append(task)
+        elif not task.is_milestone:
+            if not any(code in fs_ss for code in graph.predecessor_links(n)):
+                open_ends["open_start"].append(task)
 
     return open_ends
 
@@ -202,13 +181,15 @@ def get_lag_warnings(logic: list[Relationship]) -> list[Relationship]:
     return lag_warnings
 
 
-def get_cost_warnings(resources: list[TaskResource]) -> list[TaskResource]:
+def get_cost_warnings(schedule: Schedule) -> dict[str, list[TaskResource]]:
     cost_warnings = defaultdict(list)
-    for res in resources:
-        if res.cost.variance != 0:
+    by_assignment = schedule.rollup.by_assignment
+    for res in schedule.resources:
+        totals = by_assignment[res["taskrsrc_id"]]
+        if totals.cost_variance != 0:
             cost_warnings["cost_variance"].append(res)
 
-        if round(res.cost.actual, 2) != round(res.earned_value, 2):
+        if round(totals.actual_cost, 2) != round(totals.earned_value, 2):
             cost_warnings["ev_variance"].append(res)
 
     return cost_warnings
@@ -217,12 +198,12 @@ def get_cost_warnings(resources: list[TaskResource]) -> list[TaskResource]:
 def get_schedule_warnings(schedule: Schedule) -> dict[str, dict]:
     warnings = defaultdict(set)
     warnings["duplicate_names"] = get_duplicate_names(schedule.tasks())
-    warnings["duplicate_logic"] = get_duplicate_logic(schedule.logic())
-    warnings["redundant_logic"] = get_redundant_logic(schedule.logic())
+    warnings["duplicate_logic"] = get_duplicate_logic(schedule.logic_graph)
+    warnings["redundant_logic"] = get_redundant_logic(schedule.logic_graph)
     warnings.update(get_open_ends(schedule))
     warnings.update(get_lag_warnings(schedule.logic()))
-    warnings["sf_logic"] = [rel for rel in schedule.logic() if rel.link == "SF"]
-    warnings.update(get_cost_warnings(schedule.resources))
+    warnings["sf_logic"] = list(schedule.logic(sf=True))
+    warnings.update(get_cost_warnings(schedule))
     warnings["long_durations"] = [
         task
         for task in schedule.tasks()